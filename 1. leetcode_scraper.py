@@ -1,37 +1,62 @@
-import requests
 import json
 from bs4 import BeautifulSoup
 import time
 import logging
 import sys
 from logging.handlers import RotatingFileHandler
+from typing import Iterator, Optional
 import boto3
+from scraper_common import http_cache, http_session, rate_limit
+from scraper_common.fetch_engine import batched, fetch_in_order
+from scraper_common.retry import wait_for_circuit
+from scraper_common.s3_manifest import S3Manifest
 
-# Define the range for fetching questions
+# Define the range for fetching questions (end_offset = None fetches up to the total)
 start_offset = 0
-end_offset = 3060
-total_offset = 3060
+end_offset = None
 
-# Function to fetch list of questions from LeetCode
-def get_questions_list(skip: int = 0) -> list[dict]:
+# Questions per list page and number of list pages fetched at the same time
+list_limit = 100
+list_concurrency = 4
+
+# LeetCode GraphQL endpoint
+graphql_url = "https://leetcode.com/graphql/"
+
+# Number of question contents fetched at the same time
+detail_concurrency = 16
+
+# Number of questions per batched GraphQL request (1 disables batching)
+batch_size = 10
+
+# Seconds question contents are served from the local HTTP cache (0 disables caching)
+content_cache_ttl = 7 * 24 * 3600
+
+# Fields fetched for every question
+question_fields = "exampleTestcaseList metaData content mysqlSchemas dataSchemas codeSnippets { langSlug code } envInfo topicTags { slug } companyTagStats hints stats"
+
+# Function to fetch a page of the question list from LeetCode
+def get_questions_page(skip: int = 0, limit: int = 50) -> dict:
     """
-    Fetches a list of questions from LeetCode API.
+    Fetches a page of the question list together with the total number of questions.
 
     Args:
         skip (int): Number of questions to skip.
+        limit (int): Number of questions on the page.
 
     Returns:
-        list[dict]: List of questions.
+        dict: The page, with the keys 'total' and 'questions'.
     """
     # API endpoint URL
-    url = "https://leetcode.com/graphql/"
+    url = graphql_url
     # Payload for GraphQL query
-    payload = "{\"query\":\"\\n    query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {\\n  problemsetQuestionList: questionList(\\n    categorySlug: $categorySlug\\n    limit: $limit\\n    skip: $skip\\n    filters: $filters\\n  ) {\\n    total: totalNum\\n    questions: data {\\n      acRate\\n      difficulty\\n      likes\\n      dislikes\\n      freqBar\\n      frontendQuestionId\\n      isFavor\\n      paidOnly\\n      status\\n      title\\n      titleSlug\\n      topicTags {\\n        name\\n        id\\n        slug\\n      }\\n      hasSolution\\n      hasVideoSolution\\n    }\\n  }\\n}\\n    \",\"variables\":{\"categorySlug\":\"all-code-essentials\",\"skip\":"+str(skip)+",\"limit\":50,\"filters\":{}}}"
+    data = {
+        "query": "\n    query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {\n  problemsetQuestionList: questionList(\n    categorySlug: $categorySlug\n    limit: $limit\n    skip: $skip\n    filters: $filters\n  ) {\n    total: totalNum\n    questions: data {\n      acRate\n      difficulty\n      likes\n      dislikes\n      freqBar\n      frontendQuestionId\n      isFavor\n      paidOnly\n      status\n      title\n      titleSlug\n      topicTags {\n        name\n        id\n        slug\n      }\n      hasSolution\n      hasVideoSolution\n    }\n  }\n}\n    ",
+        "variables": {"categorySlug": "all-code-essentials", "skip": skip, "limit": limit, "filters": {}}
+    }
     # Making POST request to API
-    response = requests.request(
-        "POST", url, headers={'content-type': 'application/json'}, data=payload)
-    # Parsing JSON response and returning list of questions
-    return response.json().get('data').get('problemsetQuestionList').get('questions')
+    response = http_session.post(url, json=data, headers={'content-type': 'application/json'})
+    # Parsing JSON response and returning the page
+    return response.json().get('data').get('problemsetQuestionList')
 
 # Function to fetch content of a specific question from LeetCode
 def get_question_content(title_slug):
@@ -45,18 +70,154 @@ def get_question_content(title_slug):
         dict: Question content.
     """
     # API endpoint URL
-    url = 'https://leetcode.com/graphql/'
+    url = graphql_url
     # Payload for GraphQL query
     data = {
-        "query": "query consolePanelConfig($titleSlug: String!) { question(titleSlug: $titleSlug) { exampleTestcaseList metaData content mysqlSchemas dataSchemas codeSnippets { langSlug code } envInfo topicTags { slug } companyTagStats hints stats } }",
+        "query": "query consolePanelConfig($titleSlug: String!) { question(titleSlug: $titleSlug) { " + question_fields + " } }",
         "variables": {"titleSlug": title_slug},
         "operationName": "consolePanelConfig"
     }
     # Making POST request to API
-    response = requests.post(url, json=data, headers={'content-type': 'application/json'})
+    response = http_session.post(url, json=data, headers={'content-type': 'application/json'}, cache_ttl=content_cache_ttl)
     # Parsing JSON response and returning question content
     return response.json().get('data').get('question')
 
+# Function to fetch content of several questions in one request
+def get_questions_content_batch(title_slugs: list[str]) -> dict[str, Optional[dict]]:
+    """
+    Fetches content of several questions with one GraphQL document of aliased selections.
+
+    Args:
+        title_slugs (list[str]): Slugs of the questions.
+
+    Returns:
+        dict[str, Optional[dict]]: Question content by slug. A slug maps to None when its selection failed.
+    """
+    # API endpoint URL
+    url = graphql_url
+    # One aliased question selection per slug
+    arguments = ", ".join(f"$s{index}: String!" for index in range(len(title_slugs)))
+    selections = " ".join(
+        f"q{index}: question(titleSlug: $s{index}) {{ {question_fields} }}" for index in range(len(title_slugs)))
+    data = {
+        "query": f"query consolePanelConfigBatch({arguments}) {{ {selections} }}",
+        "variables": {f"s{index}": title_slug for index, title_slug in enumerate(title_slugs)},
+        "operationName": "consolePanelConfigBatch"
+    }
+    # Making POST request to API
+    response = http_session.post(url, json=data, headers={'content-type': 'application/json'}, cache_ttl=content_cache_ttl)
+    # Splitting the aliased response back into per-slug results
+    questions = response.json().get('data')
+    return {title_slug: questions.get(f"q{index}") for index, title_slug in enumerate(title_slugs)}
+
+# Function to fetch a page of the question list
+def fetch_questions_page(skip: int) -> Optional[dict]:
+    """
+    Fetches a page of the question list. Transient HTTP failures are retried by the session layer,
+    and an open circuit breaker is waited out.
+
+    Args:
+        skip (int): Number of questions to skip.
+
+    Returns:
+        Optional[dict]: The page, or None if it could not be fetched.
+    """
+    try:
+        logging.info(f"GET --> QUESTIONS FROM {skip}")
+        return wait_for_circuit(lambda: get_questions_page(skip, list_limit))
+    except Exception as e:
+        logging.info(f"FAILED : QUESTIONS FROM {skip} -- {e}")
+        return None
+
+# Function to iterate over the questions of every list page
+def iter_questions(start: int = 0, end: Optional[int] = None) -> Iterator[dict]:
+    """
+    Yields questions from every list page, in list order.
+
+    The first page tells how many questions exist; the remaining pages are then
+    fetched concurrently and streamed out as soon as each one is next in order.
+
+    Args:
+        start (int): Offset of the first question.
+        end (Optional[int]): Offset to stop at. Defaults to the total reported by LeetCode.
+
+    Returns:
+        Iterator[dict]: Questions in list order.
+    """
+    first_page = fetch_questions_page(start)
+    if first_page is None:
+        return
+    total = first_page.get('total')
+    stop = total if end is None else min(end, total)
+    logging.info(f"GET --> {total} QUESTIONS IN TOTAL")
+    yield from first_page.get('questions')[:stop - start]
+    offsets = range(start + list_limit, stop, list_limit)
+    for skip, page in fetch_in_order(offsets, fetch_questions_page, concurrency=list_concurrency):
+        if page is not None:
+            yield from page.get('questions')[:stop - skip]
+
+# Function to fetch content of a single listed question
+def fetch_question_content(question: dict) -> Optional[dict]:
+    """
+    Fetches the content of a listed question. Transient HTTP failures are retried by the
+    session layer and an open circuit breaker is waited out, so a failing question never
+    affects the rest of its page.
+
+    Args:
+        question (dict): Question from the list page.
+
+    Returns:
+        Optional[dict]: Question content, or None if it could not be fetched.
+    """
+    try:
+        return wait_for_circuit(lambda: get_question_content(question.get('titleSlug')))
+    except Exception as e:
+        logging.info(f"FAILED : {question.get('titleSlug')} -- {e}")
+        return None
+
+# Function to fetch content of a batch of questions, falling back to single queries
+def fetch_question_contents_batch(questions: list[dict]) -> list[tuple[dict, Optional[dict]]]:
+    """
+    Fetches the content of a batch of listed questions in one request.
+
+    Questions missing from the batched response, or every question when the
+    batch request itself fails, are fetched again one by one.
+
+    Args:
+        questions (list[dict]): Questions from the list page.
+
+    Returns:
+        list[tuple[dict, Optional[dict]]]: (question, content) pairs in the order of `questions`.
+    """
+    title_slugs = [question.get('titleSlug') for question in questions]
+    try:
+        contents = wait_for_circuit(lambda: get_questions_content_batch(title_slugs))
+    except Exception as e:
+        logging.info(f"BATCH FAILED : {title_slugs[0]}.. ({len(title_slugs)}) -- {e}")
+        contents = dict()
+    return [
+        (question, contents.get(title_slug) or fetch_question_content(question))
+        for question, title_slug in zip(questions, title_slugs)
+    ]
+
+# Function to iterate over question contents, batched or one query per question
+def iter_question_contents(questions: Iterator[dict]) -> Iterator[tuple[dict, Optional[dict]]]:
+    """
+    Fetches question contents concurrently and yields them in question order.
+
+    Args:
+        questions (Iterator[dict]): Questions from the list pages.
+
+    Returns:
+        Iterator[tuple[dict, Optional[dict]]]: (question, content) pairs.
+    """
+    if batch_size <= 1:
+        yield from fetch_in_order(questions, fetch_question_content, concurrency=detail_concurrency)
+        return
+    batches = batched(questions, batch_size)
+    for _, contents in fetch_in_order(batches, fetch_question_contents_batch, concurrency=detail_concurrency):
+        yield from contents
+
 # Function to upload JSON data to S3 bucket
 def upload_json_to_s3(s3_key, data):
     """
@@ -124,9 +285,6 @@ def get_object_as_json(s3_key):
 # Main function
 if __name__ == "__main__":
 
-    # Define initial skip value
-    skip = 0
-
     # AWS S3 configurations
     # Replace with your AWS credentials and region
     AWS_ACCESS_KEY = "YOUR_AWS_ACCESS_KEY"
@@ -148,73 +306,45 @@ if __name__ == "__main__":
     # Initialize logging
     initialize_logging(LOG_FILE_DIR)
 
-    # Fetch list of uploaded objects from S3 bucket
-    uploaded_list = get_objects_list("CQ-Scrapping/leetcode/new_upload/")
-
-    # Check end offset
-    if end_offset > total_offset:
-        end_offset = total_offset
-
-    # Initialize skip value
-    skip = start_offset
-
-    # Loop through question offsets
-    while skip <= end_offset:
-
-        # Retry loop for fetching questions
-        for _ in range(1, 4):
-            try:
-                # Fetch questions
-                logging.info(f"GET --> QUESTIONS FROM {skip}")
-                questions = get_questions_list(skip)
-                if questions == []:
-                    break
-            except:
-                continue
-            else:
-                break
-
-        # Retry loop for main execution
-        for _ in range(1, 4):
-            logging.info('TRY : {_}')
-            try:
-                # Iterate through questions
-                for question in questions:
-
-                    start_time = time.time()
-
-                    # Initialize problem data dictionary
-                    problem_data = dict()
-
-                    # Extract relevant question data
-                    problem_data['title'] = question.get('title')
-                    problem_data['title_slug'] = question.get('titleSlug')
-                    problem_data['difficulty'] = question.get('difficulty')
-
-                    # Fetch question content
-                    question_data = get_question_content(
-                        problem_data['title_slug'])
-
-                    # Process question data and upload to S3 bucket
-                    # Implement your processing logic here
-
-                    end_time = time.time()
-                    elapsed_time = end_time - start_time
-                    minutes = int(elapsed_time // 60)
-                    seconds = int(elapsed_time % 60)
-
-                    logging.info(
-                        f"COMPLETED : {problem_data['source']['leetcode_question_id']}. {problem_data['title']} in {minutes} minutes {seconds} seconds")
-
-                    upload_json_to_s3(
-                        f"CQ-Scrapping/leetcode/new_upload/{problem_data['source']['leetcode_question_id']}_{problem_data['title_slug']}.json", problem_data)
-
-                    uploaded_list = get_objects_list(
-                        "CQ-Scrapping/leetcode/new_upload/")
-            except:
-                continue
-            else:
-                break
-
-        # Increment skip value for next iteration
-        skip += 50
+    # Load the uploaded objects once into the local manifest
+    # (pass --resync to rebuild it from a fresh S3 listing)
+    manifest = S3Manifest(BUCKET)
+    manifest.load("CQ-Scrapping/leetcode/new_upload/", get_objects_list, resync='--resync' in sys.argv)
+
+    # Keep one pooled connection per concurrent fetch
+    http_session.configure(pool_size=detail_concurrency + list_concurrency)
+
+    # Fetch question contents concurrently, in question order
+    questions = iter_questions(start_offset, end_offset)
+    for question, question_data in iter_question_contents(questions):
+        try:
+            start_time = time.time()
+
+            # Initialize problem data dictionary
+            problem_data = dict()
+
+            # Extract relevant question data
+            problem_data['title'] = question.get('title')
+            problem_data['title_slug'] = question.get('titleSlug')
+            problem_data['difficulty'] = question.get('difficulty')
+
+            # Process question data and upload to S3 bucket
+            # Implement your processing logic here
+
+            end_time = time.time()
+            elapsed_time = end_time - start_time
+            minutes = int(elapsed_time // 60)
+            seconds = int(elapsed_time % 60)
+
+            logging.info(
+                f"COMPLETED : {problem_data['source']['leetcode_question_id']}. {problem_data['title']} in {minutes} minutes {seconds} seconds")
+
+            s3_key = f"CQ-Scrapping/leetcode/new_upload/{problem_data['source']['leetcode_question_id']}_{problem_data['title_slug']}.json"
+            upload_json_to_s3(s3_key, problem_data)
+            manifest.add(s3_key)
+        except Exception as e:
+            logging.info(f"FAILED : {question.get('titleSlug')} -- {e}")
+
+    # Log the rate each endpoint settled at
+    rate_limit.log_stats()
+    http_cache.log_stats()
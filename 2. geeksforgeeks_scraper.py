@@ -1,14 +1,20 @@
 from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import requests
-import time
+from bs4 import CData, NavigableString, Tag
 import json
 import logging
 import boto3
+from botocore.config import Config
 import os
 import sys
 from playwright.sync_api import BrowserContext, Page, Browser
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
+from scraper_common import fetch_engine, http_cache, http_session, next_data, rate_limit, replay
+from scraper_common.browser import LazyPage
+from scraper_common.cookie_session import CookieSession
+from scraper_common.s3_manifest import S3Manifest
+from scraper_common.s3_uploader import S3Uploader
+from scraper_common.session_store import SessionStore, state_cookies
+from scraper_common.soup import make_soup
 
 def global_vars() -> None:
     """
@@ -31,27 +37,31 @@ def global_vars() -> None:
     global HEADLESS_OPTION
     HEADLESS_OPTION = True
 
-    # AWS
-    global BUCKET
-    AWS_ACCESS_KEY = "YOUR_AWS_ACCESS_KEY"
-    AWS_SECRET_KEY = "YOUR_AWS_SECRET_KEY"
-    AWS_REGION = "YOUR_AWS_REGION"
-    BUCKET = "your_s3_bucket_name"
-
     # AWS
     global S3, S3_FOLDER_PATH, BUCKET
     AWS_ACCESS_KEY = "YOUR_AWS_ACCESS_KEY"
     AWS_SECRET_KEY = "YOUR_AWS_SECRET_KEY"
     AWS_REGION = "YOUR_AWS_REGION"
     BUCKET = "your_s3_bucket_name"
+    UPLOAD_WORKERS = 4
     S3 = boto3.client(
         's3',
         aws_access_key_id=AWS_ACCESS_KEY,
         aws_secret_access_key=AWS_SECRET_KEY,
-        region_name=AWS_REGION
+        region_name=AWS_REGION,
+        config=Config(max_pool_connections=UPLOAD_WORKERS)
     )
     S3_FOLDER_PATH = "your s3 folder path to store"
 
+    # S3 MANIFEST (pass --resync to rebuild it from a fresh S3 listing)
+    global MANIFEST, RESYNC_MANIFEST
+    MANIFEST = S3Manifest(BUCKET)
+    RESYNC_MANIFEST = '--resync' in sys.argv
+
+    # BACKGROUND UPLOADER
+    global UPLOADER
+    UPLOADER = S3Uploader(upload_json_to_s3, workers=UPLOAD_WORKERS, max_queue=2 * UPLOAD_WORKERS)
+
     # LOGGING
     global LOG_FILE_DIR
     LOG_FILE_DIR = os.path.join(
@@ -59,6 +69,16 @@ def global_vars() -> None:
         os.path.basename(os.path.abspath(__file__)).replace('.py', '.log')
     )
 
+    # SAVED LOGIN (cookies and local storage of the last sign-in, reused for a day)
+    global SESSION_STORE
+    SESSION_STORE = SessionStore('geeksforgeeks')
+
+    # SUBMISSIONS (read through the practice API; the browser click-through is only a fallback)
+    global SUBMISSIONS_API_FIRST, SUBMISSIONS_PER_PROBLEM, SUBMISSION_FETCH_WORKERS
+    SUBMISSIONS_API_FIRST = True
+    SUBMISSIONS_PER_PROBLEM = 6
+    SUBMISSION_FETCH_WORKERS = 4
+
     # COOKIES
     global PROBLEM_COOKY_NEEDED, SUBMISSION_COOKY_NEEDED
     PROBLEM_COOKY_NEEDED = {
@@ -173,6 +193,7 @@ def open_browser(headless_option: bool) -> Tuple[Page, BrowserContext, Browser]:
     browser = p.chromium.launch(headless=headless_option)
     logging.info(f'BROWSER --> CREATING A NEW PAGE & CONTEXT')
     context = browser.new_context()
+    replay.attach(context)
     page = context.new_page()
     return page, context, browser
 # Login to GeeksforGeeks
@@ -195,7 +216,9 @@ def login_to_gfg(page: Page, email: str, password: str) -> None:
     page.get_by_placeholder("Username or email").fill(email)
     page.get_by_role("textbox", name="Password").fill(password)
     logging.info("BROWSER --> SIGNING IN")
-    page.get_by_role("button", name="Sign In").click()    
+    page.get_by_role("button", name="Sign In").click()
+    # The sign-in is done once the auth page redirects back to the site
+    page.wait_for_url(lambda url: not url.startswith("https://auth.geeksforgeeks.org"), wait_until="domcontentloaded")
 
 def get_problem_list(page_number: int) -> Dict:
     """
@@ -216,7 +239,7 @@ def get_problem_list(page_number: int) -> Dict:
     headers = {
         'origin': 'https://www.geeksforgeeks.org'
     }
-    response = requests.get(url, params=params, headers=headers).json()
+    response = http_session.get(url, params=params, headers=headers).json()
     return response.get('results')    
 
 def get_cookies(context: BrowserContext, cooky: str) -> Dict[str, str]:
@@ -240,6 +263,37 @@ def get_cookies(context: BrowserContext, cooky: str) -> Dict[str, str]:
         if cooky.get('name') in cookies_needed
     }
     return cookies    
+
+def harvest_cookies(page: Page, stale: bool, storage_state: Optional[Dict] = None) -> Dict[str, str]:
+    """
+    This function reads the submission cookies of the saved session or of the logged-in browser, signing in again when they are missing or were rejected.
+
+    A fresh sign-in is saved to SESSION_STORE, so the next run can start without the browser.
+    A saved session is not checked with an API call at startup: its authtoken expiry is
+    checked when it is loaded, and the first practice API request serves as the check.
+    If that request answers 401 or 403, CookieSession calls this function again with
+    `stale` set, which signs in and saves the new session.
+
+    Args:
+        page (Page): The Playwright page object. The browser is only launched if the saved session cannot be used.
+        stale (bool): Whether the practice API rejected the previously harvested cookies.
+        storage_state (Optional[Dict]): The storage state of the saved session, if one was loaded.
+
+    Returns:
+        Dict[str, str]: The submission cookies.
+    """
+    if storage_state is not None and not stale:
+        cookies = state_cookies(storage_state, SUBMISSION_COOKY_NEEDED)
+        if 'authtoken' in cookies:
+            return cookies
+    context = page.context
+    cookies = get_cookies(context, 'submission')
+    if stale or 'authtoken' not in cookies:
+        logging.info('BROWSER --> SESSION EXPIRED, SIGNING IN AGAIN')
+        login_to_gfg(page, GFG_MAIL_OR_USERNAME, GFG_PASSWORD)
+        cookies = get_cookies(context, 'submission')
+        SESSION_STORE.save(context.storage_state())
+    return cookies
 # Open all API gateways for problem submissions
 def open_all_api_gateways(page: Page, submission_time: str, status: str) -> None:
     """Opens all API gateways for problem submissions.
@@ -254,6 +308,27 @@ def open_all_api_gateways(page: Page, submission_time: str, status: str) -> None
     page.get_by_role("row", name=f"{submission_time} {status}").locator("a").nth(1).click()
     page.get_by_role("button", name="OK", exact=True).click()
     
+# Open the submissions of a problem in the browser
+def unlock_submissions(page: Page, problem_url: str, first_submission: Dict) -> bool:
+    """
+    This function opens the problem page in the browser and clicks through the submissions table, which lets the API show other users' submissions.
+
+    Args:
+        page (Page): The Playwright page object.
+        problem_url (str): The URL of the GeeksforGeeks problem page.
+        first_submission (Dict): The newest submission listed by the API, whose table row is clicked.
+
+    Returns:
+        bool: True once the click-through was attempted, so it is not repeated for the same problem.
+    """
+    logging.info(f'BROWSER --> GOING TO THE PROBLEM URL {problem_url}')
+    try:
+        page.goto(problem_url, wait_until="domcontentloaded")  # Open the problem page in the browser; the clicks wait for their elements
+        open_all_api_gateways(page, first_submission.get('subtime'), first_submission.get('exec_status_text'))
+    except Exception as e:
+        logging.info(f'BROWSER --> UNLOCKING SUBMISSIONS FAILED <EXCEPTION = {e}>')
+    return True
+    
 # Get problem HTML content
 def get_problem_html(problem_url: str) -> str:
     """
@@ -265,146 +340,206 @@ def get_problem_html(problem_url: str) -> str:
     Returns:
         str: The HTML content of the problem page.
     """
-    html = requests.request("GET", problem_url).text
-    soup = BeautifulSoup(html, 'html.parser')
-    script_element = soup.find('script', id='__NEXT_DATA__')
-    json_content = json.loads(script_element.string)
+    html = http_session.request("GET", problem_url).content
+    # Slice the __NEXT_DATA__ payload out of the raw page instead of parsing all of it
+    json_content = next_data.extract_next_data(html)
+    if json_content is None:
+        logging.info(f'LOCAL --> __NEXT_DATA__ FAST PATH MISSED, PARSING THE PAGE <URL = {problem_url}>')
+        soup = make_soup(html)
+        script_element = soup.find('script', id='__NEXT_DATA__')
+        json_content = json.loads(script_element.string)
     prob_html = json_content.get('props').get('pageProps').get('initialState').get('problemData').get('allData').get('probData').get('problem_question')
     return prob_html
     
+# Get the code of one submission
+def get_submission_codes(session: CookieSession, submission_id: str, refresh: bool = True) -> Optional[Dict[str, str]]:
+    """
+    This function retrieves the code of a submission through the practice API.
+
+    Args:
+        session (CookieSession): The session sending the practice API requests with the harvested cookies.
+        submission_id (str): The ID of the submission.
+        refresh (bool): Sign in again if the cookies are rejected. Worker threads pass False, since the browser belongs to the main thread.
+
+    Returns:
+        Optional[Dict[str, str]]: The GFG code and the user code, or None if the API refused to show the submission.
+    """
+    response = session.request(
+        'GET',  # Make a GET request
+        url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/submissions/{submission_id}/",  # to the GFG API endpoint
+        refresh=refresh
+    )
+    if response.status_code != 200:
+        return None
+    submission_data = response.json()  # Parse the JSON response
+    if submission_data.get('code') is None and submission_data.get('user_code') is None:
+        return None
+    return {
+        'gfg_code': submission_data.get('code'),  # Get the GFG code
+        'user_code': submission_data.get('user_code')  # Get the user code
+    }
+
 # Get problem data including submissions
-def get_problem_data(problem_url: str, slug: str, context: BrowserContext, page: Page) -> Tuple[Dict, Dict]:
+def get_problem_data(problem_url: str, slug: str, session: CookieSession, page: Page) -> Tuple[Dict, Dict]:
     """
     This function retrieves the metadata and submission data of a GeeksforGeeks problem.
 
+    Submissions are paged and read straight through the practice API. The codes of
+    correct submissions are fetched concurrently while the next page is requested,
+    and everything still queued is dropped once SUBMISSIONS_PER_PROBLEM distinct
+    codes are in. The browser only opens the problem page and clicks through the
+    submissions table when the API refuses to show a submission, or on every
+    problem if SUBMISSIONS_API_FIRST is False.
+
     Args:
         problem_url (str): The URL of the GeeksforGeeks problem page.
         slug (str): The unique slug of the problem.
-        context (BrowserContext): The Playwright browser context.
+        session (CookieSession): The session sending the practice API requests with the harvested cookies.
         page (Page): The Playwright page object.
 
     Returns:
         Tuple[Dict, Dict]: A tuple containing the problem metadata and submission data. The metadata is stored in a dictionary, and the submission data is stored in a dictionary, where the key is the language and the value is a list of submission codes.
     """
-    logging.info(f'BROWSER --> GOING TO THE PROBLEM URL {problem_url}')
-    page.goto(problem_url, wait_until="domcontentloaded")  # Open the problem page in the browser
-    logging.info('BROWSER --> WAITING FOR COOKIE GENERATION (20 SECONDS)')
-    time.sleep(20)  # Wait for 20 seconds to allow for cookie generation
-    problem_meta = requests.request(
+    problem_meta = session.request(
         'GET',  # Make a GET request
-        url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/{slug}/metainfo/",  # to the GFG API endpoint
-        cookies=get_cookies(context, 'submission')  # with the submission cookies
+        url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/{slug}/metainfo/"  # to the GFG API endpoint
     ).json().get('results')  # Parse the JSON response
 
     problem_id = problem_meta.get('id')  # Get the problem ID
+    state = {'unlocked': False, 'first_submission': None}  # Whether the submissions were opened in the browser, and the newest submission whose table row the browser clicks
+
+    def correct_submissions():
+        # Pages through the submissions on the calling thread, yielding the correct ones
+        params = {}  # Initialize an empty dictionary to store the query parameters
+        while True:
+            submissions = session.request(
+                'GET',  # Make a GET request
+                url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/{problem_id}/submissions/",  # to the GFG API endpoint
+                params=params  # with the query parameters
+            ).json().get('message').get('submissions')  # Parse the JSON response
+            last_keys = submissions.get('LastEvaluatedKey')  # Get the last evaluated key
+            submissions = submissions.get('Items')  # Get the submissions
+            if not submissions:  # Check if there are any more submissions
+                return
+            if state['first_submission'] is None:
+                state['first_submission'] = submissions[0]
+                if not SUBMISSIONS_API_FIRST:
+                    state['unlocked'] = unlock_submissions(page, problem_url, state['first_submission'])
+            for submission in submissions:  # Loop through the submissions
+                logging.info(f'API --> GOING THROUGH SUBMISSION ID : {submission.get("submission_id")}')
+                if submission.get('exec_status_text') == 'Correct':  # Check if the submission is correct
+                    yield submission
+            if not last_keys:  # Check if this was the last page
+                return
+            params = {
+                'last_submission_key': last_keys.get('submission_id'),  # Set the last submission key parameter
+                'last_submission_key_time': last_keys.get('subtime').replace(' ', '%')  # Set the last submission key time parameter
+            }
+
+    def fetch_codes(submission: Dict) -> Optional[Dict[str, str]]:
+        return get_submission_codes(session, submission.get('submission_id'), refresh=False)
+
+    def refetch_codes(submission: Dict) -> Optional[Dict[str, str]]:
+        # Runs on the main thread, which owns the browser
+        submission_id = submission.get('submission_id')
+        if not state['unlocked']:
+            logging.info(f'API --> SUBMISSION REFUSED, UNLOCKING IN THE BROWSER : {submission_id}')
+            state['unlocked'] = unlock_submissions(page, problem_url, state['first_submission'])
+        submission_codes = get_submission_codes(session, submission_id)
+        if submission_codes is None:
+            logging.info(f'API --> SUBMISSION STILL REFUSED, SKIPPING : {submission_id}')
+        return submission_codes
+
     submissions_100 = dict()  # Initialize an empty dictionary to store the submission data
-    count = 0  # Initialize a counter to track the number of submissions retrieved
-    params = {}  # Initialize an empty dictionary to store the query parameters
-    submissions = True  # Initialize a boolean variable to track whether there are more submissions to retrieve
-    cookies = get_cookies(context, 'submission')  # Get the submission cookies
-    submissions = requests.request(
-        'GET',  # Make a GET request
-        url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/{problem_id}/submissions/",  # to the GFG API endpoint
-        cookies=cookies,  # with the submission cookies
-        params=params  # with the query parameters
-    ).json().get('message').get('submissions').get('Items')  # Parse the JSON response
-
-    first_sub_time = submissions[0].get('subtime')  # Get the first submission time
-    first_status = submissions[0].get('exec_status_text')  # Get the first submission status
-    open_all_api_gateways(page, first_sub_time, first_status)  # Open all API gateways for the first submission
-
-    while count <= 5:  # Loop through up to 5 submissions
-        submissions = requests.request(
-            'GET',  # Make a GET request
-            url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/{problem_id}/submissions/",  # to the GFG API endpoint
-            cookies=cookies,  # with the submission cookies
-            params=params  # with the query parameters
-        ).json().get('message').get('submissions')  # Parse the JSON response
-        last_keys = submissions.get('LastEvaluatedKey')  # Get the last evaluated key
-        submissions = submissions.get('Items')  # Get the submissions
-        if not submissions:  # Check if there are any more submissions
-            break
-        for submission in submissions:  # Loop through the submissions
-            language = submission.get('lang')  # Get the language of the submission
-            submission_id = submission.get('submission_id')  # Get the submission ID
-            logging.info(f'API --> GOING THROUGH SUBMISSION ID : {submission_id}')
-            status = submission.get('exec_status_text')  # Get the execution status of the submission
-            if status == 'Correct':  # Check if the submission is correct
-                submission_data = requests.request(
-                    'GET',  # Make a GET request
-                    url=f"https://practiceapi.geeksforgeeks.org/api/latest/problems/submissions/{submission_id}/",  # to the GFG API endpoint
-                    cookies=cookies  # with the submission cookies
-                ).json()  # Parse the JSON response
-                submission_codes = {
-                    'gfg_code': submission_data.get('code'),  # Get the GFG code
-                    'user_code': submission_data.get('user_code')  # Get the user code
-                }
-                if language not in submissions_100:  # Check if the language is already in the dictionary
-                    submissions_100[language] = list()  # Add the language to the dictionary if it is not already present
-                submissions_100[language].append(submission_codes)  # Add the submission codes to the dictionary
-                count += 1  # Increment the counter
-                if count > 5:  # Check if the counter is greater than 5
-                    break
-        params = {
-            'last_submission_key': last_keys.get('submission_id'),  # Set the last submission key parameter
-            'last_submission_key_time': last_keys.get('subtime').replace(' ', '%')  # Set the last submission key time parameter
-        }
+    for submission, submission_codes in fetch_engine.collect_first(
+        correct_submissions(),
+        fetch_codes,
+        SUBMISSIONS_PER_PROBLEM,
+        key=lambda codes: (codes.get('gfg_code'), codes.get('user_code')),
+        retry=refetch_codes,
+        concurrency=SUBMISSION_FETCH_WORKERS,
+        prefetch=SUBMISSION_FETCH_WORKERS
+    ):
+        language = submission.get('lang')  # Get the language of the submission
+        if language not in submissions_100:  # Check if the language is already in the dictionary
+            submissions_100[language] = list()  # Add the language to the dictionary if it is not already present
+        submissions_100[language].append(submission_codes)  # Add the submission codes to the dictionary
     return problem_meta, submissions_100  # Return the problem metadata and submission data
 
 def get_data_from_html(html: str) -> Tuple[str, List[str], Dict[str, str]]:
     """
     This function extracts the problem description, constraints, and example code from the given HTML content.
 
+    The <p> and <pre> tags are collected in document order with a single traversal, and
+    every section is read from that list, so the document is never searched or parsed twice.
+
     Args:
         html (str): The HTML content of the GeeksforGeeks problem page.
 
     Returns:
         Tuple[str, List[str], Dict[str, str]]: A tuple containing the problem description, constraints, and example code.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
+    tags = soup.find_all(["p", "pre"])
+    paragraphs = [(position, tag, tag.get_text()) for position, tag in enumerate(tags) if tag.name == "p"]
 
-    problem_description = []
-    Constraints = []
-    Cleaned = dict()
+    # Text of the first <pre> at or after every position
+    next_pre_text = [None] * (len(tags) + 1)
+    for position in range(len(tags) - 1, -1, -1):
+        tag = tags[position]
+        next_pre_text[position] = tag.get_text().strip() if tag.name == "pre" else next_pre_text[position + 1]
 
-    p_tag = soup.find("p")
-    try:
-        while "Example" not in p_tag.get_text():
-            problem_description.append(p_tag.get_text())
-            p_tag = p_tag.find_next("p")
-        problem_description = "\n".join(problem_description)
-    except:
+    # Paragraphs up to the first one mentioning an example
+    problem_description = []
+    for _, _, text in paragraphs:
+        if "Example" in text:
+            problem_description = "\n".join(problem_description)
+            break
+        problem_description.append(text)
+    else:
         problem_description = None
 
-    p_tags = soup.find_all("p")
-    for p_tag in p_tags:
-        if "Constraints" in p_tag.get_text():
-            p_tag_str = str(p_tag)
-            p_tag_str = p_tag_str.replace("Constraints:", "")
-            p_tag_str = p_tag_str.replace("<sup>", "**")
-            p_tag_str = p_tag_str.replace("</sup>", "")
-            p_tag_str = p_tag_str.replace("<br/>", "\n")
-            p_tag = BeautifulSoup(p_tag_str, "html.parser")
-            p_tag = p_tag.get_text().split("\n")
-            Constraints = [constraint for constraint in p_tag if constraint]
-
-    p_tag = soup.find("p", string=lambda text: text and "Example" in text)
+    # The last paragraph mentioning constraints, one constraint per line
+    Constraints = []
+    for _, p_tag, text in paragraphs:
+        if "Constraints" in text:
+            Constraints = [constraint for constraint in get_constraints_text(p_tag).split("\n") if constraint]
 
+    # Every paragraph mentioning an example, paired with the next <pre>
     half_cleaned = dict()
     index = 1
-
-    try:
-        p_tags = soup.find_all("p")
-        for p_tag in p_tags:
-            if "example" in p_tag.get_text().lower():
-                next_pre_tag = p_tag.find_next("pre")
-                half_cleaned[f"Example {index}"] = next_pre_tag.get_text().strip()
-                index += 1
-    except:
-        half_cleaned = None
+    for position, _, text in paragraphs:
+        if "example" in text.lower():
+            example = next_pre_text[position + 1]
+            if example is None:
+                half_cleaned = None
+                break
+            half_cleaned[f"Example {index}"] = example
+            index += 1
 
     return problem_description, Constraints, half_cleaned
 
+def get_constraints_text(p_tag: Tag) -> str:
+    """
+    This function renders the text of a constraints paragraph, writing superscripts as "**" powers and line breaks as newlines.
+
+    Args:
+        p_tag (Tag): The constraints paragraph.
+
+    Returns:
+        str: The paragraph text without the "Constraints:" label.
+    """
+    parts = []
+    for element in p_tag.descendants:
+        if isinstance(element, Tag):
+            if element.name == "sup" and not element.attrs:
+                parts.append("**")
+            elif element.name == "br" and not element.attrs:
+                parts.append("\n")
+        elif type(element) in (NavigableString, CData):
+            parts.append(element.replace("Constraints:", ""))
+    return "".join(parts)
+
 def upload_json_to_s3(s3_key: str, data: Dict) -> None:
     """
     Uploads the given JSON data to the given S3 key.
@@ -422,6 +557,7 @@ def upload_json_to_s3(s3_key: str, data: Dict) -> None:
         Body=json.dumps(data, indent=4),
         ContentType='application/json'
     )
+    MANIFEST.add(s3_key)
     logging.info(f"--UPLOADED : {s3_key}")
 
 def get_objects_list(s3_key: str) -> List[str]:
@@ -463,15 +599,17 @@ if __name__ == '__main__':
     global_vars()
     # Initialize logging
     initialize_logging(LOG_FILE_DIR)
+    # Load the uploaded objects once instead of listing S3 per problem
+    MANIFEST.load(S3_FOLDER_PATH, get_objects_list, resync=RESYNC_MANIFEST)
 
     with sync_playwright() as p:
-        # Open a new browser using Playwright
-        browser = p.chromium.launch(headless=HEADLESS_OPTION)
-        context = browser.new_context()
-        page = context.new_page()
+        # Reuse the saved login; the browser only starts to sign in or to click through submissions
+        saved_session = SESSION_STORE.load(required_cookies={'authtoken'})
+        storage_state = saved_session.get('storage_state') if saved_session else None
+        page = LazyPage(p, headless=HEADLESS_OPTION, **({'storage_state': storage_state} if storage_state else {}))
         
-        # Login to GeeksforGeeks
-        login_to_gfg(page, GFG_MAIL_OR_USERNAME, GFG_PASSWORD)
+        # Harvested once here and again only if the practice API rejects them
+        session = CookieSession(lambda stale: harvest_cookies(page, stale, storage_state))
 
         # Iterate through problem pages
         problem_index = 0
@@ -491,9 +629,8 @@ if __name__ == '__main__':
                 problem_data['title_slug'] = problem.get('slug')
                 problem_data['difficulty'] = problem.get('difficulty')
                 
-                uploaded_list = get_objects_list(S3_FOLDER_PATH)
                 s3_key = S3_FOLDER_PATH + '/' + problem_data.get("title_slug") + '.json'
-                if s3_key in uploaded_list:
+                if s3_key in MANIFEST:
                     logging.info(f'CLOUD --> FILE ALREADY PRESENT {s3_key}')
                     continue
 
@@ -514,7 +651,7 @@ if __name__ == '__main__':
 
                 problem_data['company_tags'] = problem.get('tags').get('company_tags')
                 
-                problem_meta, submission_100 = get_problem_data(problem_data.get('source').get('url'), problem_data.get('title_slug'), context, page)
+                problem_meta, submission_100 = get_problem_data(problem_data.get('source').get('url'), problem_data.get('title_slug'), session, page)
                 
                 problem_data['problem_id'] = problem_meta.get('id')
                 
@@ -546,9 +683,13 @@ if __name__ == '__main__':
                 
                 problem_data['user_solutions'] = submission_100
             
-                upload_json_to_s3(s3_key, problem_data)
+                UPLOADER.submit(s3_key, problem_data)
                 
             START_PAGE += 1
                        
-        context.close()     
-        browser.close()
+        page.close()
+
+    # Wait for the queued uploads to finish
+    UPLOADER.close()
+    rate_limit.log_stats()
+    http_cache.log_stats()
@@ -1,10 +1,16 @@
-from typing import Dict, List, Union
+from contextlib import closing
+from typing import Dict, Iterator, List, Union
 import logging
 import json
+import sys
 import time
-import requests
 import boto3
+from botocore.config import Config
 from playwright.sync_api import sync_playwright
+from scraper_common import fetch_engine, http_cache, http_session, rate_limit, replay
+from scraper_common.s3_manifest import S3Manifest
+from scraper_common.s3_uploader import S3Uploader
+from scraper_common.session_store import SessionStore
 
 # Global variables initialization
 def global_vars() -> None:
@@ -19,6 +25,18 @@ def global_vars() -> None:
     START_PAGE = 44
     END_PAGE = 150
     
+    # Submissions (listing pages are requested ahead, codes concurrently)
+    global SUBMISSION_PAGES, SUBMISSION_PAGE_PREFETCH, SOLUTIONS_PER_PROBLEM, SUBMISSION_FETCH_WORKERS
+    SUBMISSION_PAGES = 25
+    SUBMISSION_PAGE_PREFETCH = 2
+    SOLUTIONS_PER_PROBLEM = 6
+    SUBMISSION_FETCH_WORKERS = 4
+
+    # Saved login (cookie and CSRF-token of the last login, checked against one problem's submissions)
+    global SESSION_STORE, SESSION_CHECK_PROBLEM
+    SESSION_STORE = SessionStore('codechef')
+    SESSION_CHECK_PROBLEM = 'FOODCOST'
+
     # Browser configuration
     global HEADLESS_OPTION
     HEADLESS_OPTION = True
@@ -29,14 +47,25 @@ def global_vars() -> None:
     AWS_SECRET_KEY = "your_aws_secret_key"
     AWS_REGION = "your_aws_region"
     BUCKET = "your_s3_bucket_name"
+    UPLOAD_WORKERS = 4
     S3 = boto3.client(
         's3', 
         aws_access_key_id=AWS_ACCESS_KEY, 
         aws_secret_access_key=AWS_SECRET_KEY, 
-        region_name=AWS_REGION
+        region_name=AWS_REGION,
+        config=Config(max_pool_connections=UPLOAD_WORKERS)
         )
     S3_FOLDER_PATH = "your_s3_folder_path"
     
+    # S3 manifest (pass --resync to rebuild it from a fresh S3 listing)
+    global MANIFEST, RESYNC_MANIFEST
+    MANIFEST = S3Manifest(BUCKET)
+    RESYNC_MANIFEST = '--resync' in sys.argv
+    
+    # Background uploader
+    global UPLOADER
+    UPLOADER = S3Uploader(upload_json_to_s3, workers=UPLOAD_WORKERS, max_queue=2 * UPLOAD_WORKERS)
+    
     # Logging
     global LOG_FILE_DIR
     LOG_FILE_DIR = "path_to_log_file.log"
@@ -87,6 +116,7 @@ def fetch_headers() -> None:
         logging.info('Launching browser')
         browser = playwright.chromium.launch(headless=HEADLESS_OPTION)
         context = browser.new_context()
+        replay.attach(context)
         page = context.new_page()
         sample_problem_url = "https://www.codechef.com/problems/FOODCOST"
         logging.info('Redirecting to sample problem URL')
@@ -102,10 +132,27 @@ def fetch_headers() -> None:
         try: page.on("request", playwright_request_handler)
         except: pass
         time.sleep(10)
+        if HEADERS.get('cookie') and HEADERS.get('x-csrf-token'):
+            SESSION_STORE.save(context.storage_state(), headers=dict(HEADERS))
         logging.info('Closing browser')
         context.close()
         browser.close()
 
+# Load headers saved by an earlier run
+def load_saved_headers() -> bool:
+    """Reuse the saved cookie and CSRF-token if one submissions request accepts them."""
+    saved_session = SESSION_STORE.load()
+    headers = (saved_session or {}).get('headers') or {}
+    if not (headers.get('cookie') and headers.get('x-csrf-token')):
+        return False
+    HEADERS.update(headers)
+    logging.info('Validating saved headers')
+    if get_submission_page(SESSION_CHECK_PROBLEM, 1).get('status') == 'apierror':
+        logging.info('Saved headers rejected, logging in again')
+        SESSION_STORE.discard()
+        return False
+    return True
+
 # Fetch problem list
 def get_problem_list(page_number: int) -> List[Dict[str, Union[str, int]]]:
     """Get the list of problems from a specific page."""
@@ -115,7 +162,7 @@ def get_problem_list(page_number: int) -> List[Dict[str, Union[str, int]]]:
         'limit' : 50,
         'page' : page_number
     }
-    problem_list = requests.request(
+    problem_list = http_session.request(
         "GET", 
         url, 
         params=params
@@ -126,51 +173,82 @@ def get_problem_list(page_number: int) -> List[Dict[str, Union[str, int]]]:
 def get_problem(slug: str) -> Dict[str, Union[str, Dict[str, str]]]:
     """Get details of a specific problem."""
     logging.info(f'Getting problem details (Problem slug: {slug})')
-    problem = requests.request(
+    problem = http_session.request(
         'GET',
         f'https://www.codechef.com/api/contests/PRACTICE/problems/{slug}'
         ).json()
     return problem
 
-# Fetch submission list
-def get_submission_list(slug: str) -> List[Dict[str, str]]:
-    """Get a list of submissions for a specific problem."""
-    count = 0
-    page = 1
-    submissions = []
+# Fetch a page of the submission list
+def get_submission_page(slug: str, page: int) -> Dict:
+    """Get one page of submissions for a specific problem."""
+    return http_session.request(
+        'GET',
+        f'https://www.codechef.com/api/submissions/PRACTICE/{slug}?limit=10&page={page}',
+        headers = HEADERS
+        ).json()
+
+# Fetch accepted submissions
+def iter_accepted_submissions(slug: str) -> Iterator[Dict[str, str]]:
+    """Yield the accepted submissions of a specific problem, requesting the next listing pages ahead."""
     previous_submission = None
-    while count <= 5:
-        if page > 25:
-            break
-        logging.info(f'Getting submissions list (Problem slug: {slug}, Page: {page})')
-        submission_list = requests.request(
-            'GET',
-            f'https://www.codechef.com/api/submissions/PRACTICE/{slug}?limit=10&page={page}',
-            headers = HEADERS
-            ).json()
-        if submission_list.get('status') == 'apierror':
-            fetch_headers()
-            get_submission_list(slug)
-        submission_list = submission_list.get('data')
-        if previous_submission == submission_list:
-            break
-        previous_submission = submission_list
-        if not submission_list:
-            break
-        for submission in submission_list:
-            if submission.get('tooltip') == 'accepted':
-                submissions.append(submission)
-                count += 1
-                if count >= 5:
-                    break
-        page += 1
-    return submissions
+    headers_refreshed = False
+    pages = fetch_engine.fetch_in_order(
+        range(1, SUBMISSION_PAGES + 1),
+        lambda page: get_submission_page(slug, page),
+        concurrency=SUBMISSION_PAGE_PREFETCH,
+        prefetch=SUBMISSION_PAGE_PREFETCH
+        )
+    try:
+        for page, submission_list in pages:
+            logging.info(f'Getting submissions list (Problem slug: {slug}, Page: {page})')
+            if submission_list.get('status') == 'apierror':
+                # Session expired: refresh the headers once and retry the page; pages fetched ahead are retried too
+                if not headers_refreshed:
+                    fetch_headers()
+                    headers_refreshed = True
+                submission_list = get_submission_page(slug, page)
+            submission_list = submission_list.get('data')
+            if previous_submission == submission_list:
+                break
+            previous_submission = submission_list
+            if not submission_list:
+                break
+            for submission in submission_list:
+                if submission.get('tooltip') == 'accepted':
+                    yield submission
+    finally:
+        pages.close()
+
+# Fetch submission codes
+def get_user_solutions(slug: str) -> Dict[str, List[str]]:
+    """Get the codes of the first distinct accepted submissions of a specific problem, by language."""
+    user_solutions = dict()
+    # collect_first can only close the enumerate wrapper, so the paging generator and its prefetch are closed here
+    with closing(iter_accepted_submissions(slug)) as accepted_submissions:
+        solutions = fetch_engine.collect_first(
+            enumerate(accepted_submissions, 1),
+            lambda numbered: get_submission(numbered[1].get('id'), numbered[0]),
+            SOLUTIONS_PER_PROBLEM,
+            key=lambda submission: (json.dumps(submission.get('language'), sort_keys=True), submission.get('code')),
+            concurrency=SUBMISSION_FETCH_WORKERS,
+            prefetch=SUBMISSION_FETCH_WORKERS
+            )
+    for _, submission in solutions:
+        try:
+            language = submission.get('language').get('full_name')
+            if language not in user_solutions:
+                user_solutions[language] = []
+            user_solutions[language].append(submission.get('code'))
+        except:
+            print(json.dumps(submission, indent=4))
+    return user_solutions
 
 # Fetch submission details
 def get_submission(submission_code: str, index: int) -> Dict[str, str]:
     """Get details of a specific submission."""
     logging.info(f'Getting submission details [{index}] (Submission code: {submission_code})')
-    submission = requests.request(
+    submission = http_session.request(
         'GET',
         f'https://www.codechef.com/api/submission-code/{submission_code}'
         ).json().get('data')
@@ -213,13 +291,16 @@ def upload_json_to_s3(s3_key: str, data: Dict) -> None:
         Body=json.dumps(data, indent=4),
         ContentType='application/json'
     )
+    MANIFEST.add(s3_key)
     logging.info(f"Uploaded file (S3 key: {s3_key})")
 
 if __name__ == '__main__':
     
     global_vars()
     initialize_logging(LOG_FILE_DIR)
-    fetch_headers()
+    MANIFEST.load(S3_FOLDER_PATH, get_objects_list, resync=RESYNC_MANIFEST)
+    if not load_saved_headers():
+        fetch_headers()
         
     while START_PAGE <= END_PAGE:
         
@@ -234,9 +315,8 @@ if __name__ == '__main__':
             problem_data['title'] = problem.get('name')
             problem_data['title_slug'] = problem.get('code')
             
-            uploaded_list = get_objects_list(S3_FOLDER_PATH)
             s3_key = S3_FOLDER_PATH + '/' + problem_data.get("title_slug") + '.json'
-            if s3_key in uploaded_list:
+            if s3_key in MANIFEST:
                 logging.info(f'File already present (File: {s3_key})')
                 continue
             
@@ -277,24 +357,10 @@ if __name__ == '__main__':
             except:
                 problem_data['available_languages'] = problem_info.get('languages_supported')
 
-            submissions_list = get_submission_list(problem_data.get('title_slug'))
-            user_solutions = dict()
-            index = 1
-            for submission in submissions_list:
-                submission = get_submission(submission.get('id'), index)
-                index += 1
-                try:
-                    language = submission.get('language').get('full_name')
-                    if language not in user_solutions:
-                        user_solutions[language] = []
-                    code = submission.get('code')
-                    if code not in user_solutions.get(language):
-                        user_solutions[language].append(submission.get('code'))
-                except:
-                    print(json.dumps(submission, indent=4))
+            user_solutions = get_user_solutions(problem_data.get('title_slug'))
             problem_data['user_solutions'] = user_solutions
             
-            upload_json_to_s3(s3_key, problem_data)
+            UPLOADER.submit(s3_key, problem_data)
             
             end_time = time.time()
             elapsed_time = end_time - start_time
@@ -303,4 +369,9 @@ if __name__ == '__main__':
             
             logging.info(f"Completed {problem_data.get('title_slug')} in {minutes} mins {seconds} secs")
             
-        START_PAGE += 1
\ No newline at end of file
+        START_PAGE += 1
+    
+    # Wait for the queued uploads to finish
+    UPLOADER.close()
+    rate_limit.log_stats()
+    http_cache.log_stats()
\ No newline at end of file
@@ -1,16 +1,26 @@
 import boto3
+from botocore.config import Config
 import os
 import logging
 import time
 import json
 import sys
-import requests
 from playwright.sync_api import sync_playwright
 from playwright.sync_api import Page, BrowserContext, Browser
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
-from bs4 import BeautifulSoup
 import re
-import jsbeautifier
+from collections import deque
+from concurrent.futures import Future
+from scraper_common import http_cache, http_session, rate_limit, replay
+from scraper_common.browser import ContextPool
+from scraper_common.fetch_engine import fetch_in_order
+from scraper_common.script_json import extract_assigned_json
+from scraper_common.soup import make_soup
+from scraper_common.s3_manifest import S3Manifest
+from scraper_common.s3_uploader import S3Uploader
+from scraper_common.session_store import SessionStore
 
 def global_vars():
     """
@@ -32,14 +42,25 @@ def global_vars():
     AWS_SECRET_KEY  = "YourSecretKeyHere"
     AWS_REGION      = "YourRegionHere"
     BUCKET          = "YourBucketNameHere"
+    UPLOAD_WORKERS  = 4
     S3 = boto3.client(
         's3', 
         aws_access_key_id       = AWS_ACCESS_KEY, 
         aws_secret_access_key   = AWS_SECRET_KEY, 
-        region_name             = AWS_REGION
+        region_name             = AWS_REGION,
+        config                  = Config(max_pool_connections=UPLOAD_WORKERS)
         )
     S3_FOLDER_PATH              = "YourFolderPathHere"
     
+    #S3 MANIFEST (pass --resync to rebuild it from a fresh S3 listing)
+    global MANIFEST, RESYNC_MANIFEST
+    MANIFEST        = S3Manifest(BUCKET)
+    RESYNC_MANIFEST = '--resync' in sys.argv
+    
+    #BACKGROUND UPLOADER
+    global UPLOADER
+    UPLOADER        = S3Uploader(upload_json_to_s3, workers=UPLOAD_WORKERS, max_queue=2 * UPLOAD_WORKERS)
+    
     #LOGGING
     global LOG_FILE_DIR
     LOG_FILE_DIR = os.path.join(
@@ -47,10 +68,17 @@ def global_vars():
         os.path.basename(os.path.abspath(__file__)).replace('.py', '.log')
         )
     
-    #HEADERS
-    global HINT_RESPONSE, URL
-    HINT_RESPONSE = dict()
-    SLUG = None
+    #SAVED LOGIN (cookies and local storage of the last sign-in, reused for a day)
+    global SESSION_STORE
+    SESSION_STORE       = SessionStore('interviewbit')
+    
+    #HINTS (captured in a pool of browser contexts sharing the login)
+    global HINT_CONTEXTS, HINT_HEADLESS, HINT_DEADLINE, HINT_CLICK_TIMEOUT, HINT_POLL_INTERVAL
+    HINT_CONTEXTS       = 3
+    HINT_HEADLESS       = True
+    HINT_DEADLINE       = 30    # seconds per problem for all hint responses
+    HINT_CLICK_TIMEOUT  = 5     # seconds per click
+    HINT_POLL_INTERVAL  = 0.25  # seconds between looks for an unlock button
 
 def initialize_logging():
     """
@@ -94,6 +122,7 @@ def do_login() -> Tuple[Page, BrowserContext, Browser]:
 
     logging.info('BROWSER --> CREATING A NEW PAGE & CONTEXT')
     context = browser.new_context()
+    replay.attach(context)
     page = context.new_page()
 
     logging.info('BROWSER --> REDIRECTING TO INTERVIEWBIT SIGN IN')
@@ -125,6 +154,11 @@ def do_login() -> Tuple[Page, BrowserContext, Browser]:
     page.locator("#password-field").click()
     page.locator("#password-field").press_sequentially(PASSWORD)
     page.get_by_text("Proceed").click()
+    try:
+        # Let the sign-in settle, so the session cookies are in the storage state
+        page.wait_for_load_state("networkidle")
+    except Exception as e:
+        logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
 
     return page, context, browser
 
@@ -140,7 +174,7 @@ def get_problem_list(page_offset: int) -> List[Dict]:
     """
     logging.info(f'API     --> GETTING PROBLEM LIST    <PAGE OFFSET = {page_offset}>')
     url = f"https://www.interviewbit.com/v2/problem_list/?&page_offset={page_offset}&page_limit=20"
-    response = requests.request("GET", url)
+    response = http_session.request("GET", url)
     return response.json().get('items')
 
 def get_objects_list(s3_key: str) -> List[str]:
@@ -197,6 +231,7 @@ def upload_json_to_s3(s3_key: str, data: Dict) -> None:
         Body=json.dumps(data, indent=4),
         ContentType='application/json'
     )
+    MANIFEST.add(s3_key)
     logging.info(f"CLOUD   --> UPLOADED FILE           <S3 KEY = |{s3_key}|>")
 
 def get_object_as_json(s3_key: str) -> Dict:
@@ -226,11 +261,28 @@ def get_problem_data(slug: str) -> Dict:
     """
     logging.info(f'API     --> GETTING PROBLEM DATA    <SLUG = {slug}>')
     url = f"https://www.interviewbit.com/problems/{slug}/"
-    response = requests.request('GET', url)
+    response = http_session.request('GET', url)
     if response.status_code != 200:
         return
     html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
+    problems_data = extract_assigned_json(html_content, 'window.__INTERVIEWBIT__.problemsData')
+    if problems_data is None:
+        logging.info(f'LOCAL   --> JSON SLICE MISSED       <SLUG = {slug}>')
+        problems_data = get_beautified_problem_data(html_content)
+    return problems_data
+
+def get_beautified_problem_data(html_content: str) -> Dict:
+    """
+    This function extracts the problem data by beautifying the page script, for pages the JSON slice cannot read.
+
+    Args:
+        html_content (str): The problem page.
+
+    Returns:
+        Dict: The problem data.
+    """
+    import jsbeautifier
+    soup = make_soup(html_content)
     script_tag = soup.find('script', text=lambda text: text and 'window.__INTERVIEWBIT__.problemsData' in text)
     code = script_tag.string
     beautified_code = jsbeautifier.beautify(code)
@@ -239,88 +291,270 @@ def get_problem_data(slug: str) -> Dict:
     problems_data = json.loads(problems_data_json)
     return problems_data
 
-def playwright_request_handler(response):
+@dataclass
+class ProblemSections:
+    """
+    The sections of an InterviewBit problem statement. A section is None when it is missing or malformed.
     """
-    This function sets the global variable "HEADERS" with the values of the request headers "accept-language", "cookie", and "user-agent".
+    description: Optional[str] = None
+    constraints: Optional[List[str]] = None
+    input_format: Optional[str] = None
+    output_format: Optional[str] = None
+    example_input: Optional[Dict[str, str]] = None
+    example_output: Optional[Dict[str, str]] = None
+    example_explanation: Optional[Dict[str, str]] = None
+
+# Section div id -> (field, kind)
+SECTION_IDS = {
+    'problem_description_markdown_content_value': ('description', 'text'),
+    'problem_constraints_markdown_content_value': ('constraints', 'lines'),
+    'input_format_markdown_content_value': ('input_format', 'text'),
+    'output_format_markdown_content_value': ('output_format', 'text'),
+    'example_input_markdown_content_value': ('example_input', 'examples'),
+    'example_output_markdown_content_value': ('example_output', 'non_empty_examples'),
+    'example_explanation_markdown_content_value': ('example_explanation', 'non_empty_examples'),
+}
+
+def extract_sections(markdown_content: str) -> ProblemSections:
+    """
+    This function extracts every section of the problem statement in a single walk of the markdown content.
 
-    Parameters:
-        request (Request): The Playwright request object.
+    Args:
+        markdown_content (str): The problem's `meta.markdown_content` HTML.
 
     Returns:
-        None
+        ProblemSections: The extracted sections.
     """
-    global HINT_RESPONSE, SLUG
-    try:
-        if response.url and f'https://www.interviewbit.com/v2/problems/{SLUG}/hints' in str(response.url) and response.status == 200:
-            HINT_RESPONSE[f"{response.url}"] = response.json()
-            logging.info(f"NETWORK --> CAPTURED RESPONSE       <URL = {response.url}>")
-    except:
-        pass
-    
-def open_api_gateways(page):
+    sections = ProblemSections()
+    seen = set()
+    for div in make_soup(markdown_content).find_all('div', id=SECTION_IDS.__contains__):
+        field, kind = SECTION_IDS[div['id']]
+        if field in seen:
+            continue
+        seen.add(field)
+        if kind == 'text':
+            value = div.get_text().strip()
+        elif kind == 'lines':
+            value = div.get_text().strip().split("\n")
+        else:
+            value = pair_examples(div, skip_empty=kind == 'non_empty_examples')
+        setattr(sections, field, value)
+    return sections
+
+def pair_examples(div, skip_empty: bool) -> Optional[Dict[str, str]]:
     """
-    Opens the API gateways for the given problem slug.
+    This function maps every <p> label of an example section to the text of the <pre> that follows it.
 
     Args:
-        page (Page): The Playwright page object.
+        div (Tag): The section div.
+        skip_empty (bool): Whether to ignore <p> tags without text.
 
     Returns:
-        None
+        Optional[Dict[str, str]]: The examples, or None if a label has no <pre> after it.
+    """
+    examples = dict()
+
+    def walk(parent) -> bool:
+        pending = []
+        for child in parent.children:
+            if child.name == 'pre':
+                value = child.get_text().strip()
+                for key in pending:
+                    examples[key] = value
+                pending = []
+            elif child.name == 'p':
+                key = child.get_text().strip()
+                if key or not skip_empty:
+                    examples.setdefault(key, None)
+                    pending.append(key)
+            elif child.name and not walk(child):
+                return False
+        return not pending
+
+    return examples if walk(div) else None
+
+class SessionRejected(Exception):
+    """
+    Raised when InterviewBit refuses the hint requests of a pooled context, because its login expired.
     """
-    global SLUG
-    problem_url = f"https://www.interviewbit.com/problems/{SLUG}"
-    page.on("response", playwright_request_handler)
-    page.goto(problem_url, wait_until="domcontentloaded")
 
-    # Click on the Hints link
-    try:
-        page.get_by_role("link", name="Hints").click(timeout=5000)
-    except Exception as e:
-        logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
-    page.wait_for_timeout(2500)
+class HintCapture:
+    """
+    Collects the hint responses of one problem from the page it listens on.
 
-    # Click on the Unlock Hint button
-    try:
-        page.get_by_text("Unlock Hint").click(timeout=5000)
-    except Exception as e:
-        logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
+    Each problem has its own capture, so several problems can be open in different
+    browser contexts at the same time.
+    """
 
-    # Click on the Solution Approach link
-    try:
-        page.locator("a").filter(has_text="Solution Approach").click()
-    except Exception as e:
-        logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
-    page.wait_for_timeout(2500)
+    def __init__(self, slug: str) -> None:
+        """
+        Args:
+            slug (str): The problem slug.
+        """
+        self.prefix = f'https://www.interviewbit.com/v2/problems/{slug}/hints'
+        self.responses: Dict[str, Dict] = dict()
+        self.rejected = False
 
-    # Click on the Unlock Solution Approach button
-    try:
-        page.get_by_text("Unlock Solution Approach").click(timeout=5000)
-    except Exception as e:
-        logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
+    def handle(self, response) -> None:
+        """
+        Stores the body of a successful hint response of this problem.
 
-    # Click on the Complete Solution link
+        Args:
+            response (Response): The Playwright response object.
+        """
+        try:
+            if response.url and self.prefix in str(response.url) and response.status in (401, 403):
+                self.rejected = True
+            if response.url and self.prefix in str(response.url) and response.status == 200:
+                self.responses[f"{response.url}"] = response.json()
+                logging.info(f"NETWORK --> CAPTURED RESPONSE       <URL = {response.url}>")
+        except:
+            pass
+
+    def matches(self, url: str, hint_id) -> bool:
+        """
+        Whether a URL is the hint endpoint of the given hint ID.
+        """
+        hint_url = f"{self.prefix}/{hint_id}"
+        return url.startswith(hint_url) and url[len(hint_url):len(hint_url) + 1] in ('', '/', '?')
+
+    def has(self, hint_id) -> bool:
+        """
+        Whether the response of a hint was captured.
+        """
+        return any(self.matches(url, hint_id) for url in self.responses)
+
+    def find(self, hint_id) -> Dict:
+        """
+        Returns the captured response of a hint.
+
+        Args:
+            hint_id: The hint ID from the hints metadata.
+
+        Raises:
+            IndexError: If the hint was not captured.
+        """
+        hint_url = [url for url in self.responses if self.matches(url, hint_id)].pop(0)
+        return self.responses.get(hint_url)
+
+    def wait(self, page: Page, hint_id, timeout: float) -> bool:
+        """
+        Waits until the response of a hint is captured, handling page events in the meantime.
+
+        Args:
+            page (Page): The Playwright page the capture listens on.
+            hint_id: The hint ID from the hints metadata.
+            timeout (float): Seconds to wait at most.
+
+        Returns:
+            bool: Whether the hint was captured in time. A refused hint request ends the wait early.
+        """
+        end = time.monotonic() + timeout
+        while not self.has(hint_id) and not self.rejected:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                page.wait_for_event("response", predicate=lambda response: self.matches(response.url, hint_id), timeout=remaining * 1000)
+            except PlaywrightTimeoutError:
+                return self.has(hint_id)
+        return self.has(hint_id)
+    
+def unlock_hint(page: Page, capture: HintCapture, hint_id, open_tab, unlock_text: str, deadline: float) -> None:
+    """
+    Opens a hint tab and clicks its unlock button until the hint response is captured.
+
+    Problems that were unlocked before send the response as soon as the tab opens,
+    so the unlock button is only clicked once it is visible and the response has
+    not arrived yet.
+
+    Args:
+        page (Page): The Playwright page object.
+        capture (HintCapture): The capture of the problem.
+        hint_id: The hint ID from the hints metadata, or None if the problem does not have this hint.
+        open_tab (Callable[[], None]): Clicks the link of the tab.
+        unlock_text (str): The text of the unlock button.
+        deadline (float): `time.monotonic()` value after which the hint is given up.
+    """
+    if hint_id is None or capture.has(hint_id) or capture.rejected:
+        return
     try:
-        page.locator("a").filter(has_text="Complete Solution").click()
+        open_tab()
     except Exception as e:
         logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
-    page.wait_for_timeout(2500)
+    unlock_button = page.get_by_text(unlock_text).first
+    clicked = False
+    while not capture.has(hint_id) and not capture.rejected:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logging.info(f"PAGE    --> HINT NOT CAPTURED       <HINT ID = {hint_id}>")
+            return
+        if not clicked:
+            try:
+                if unlock_button.is_visible():
+                    unlock_button.click(timeout=min(HINT_CLICK_TIMEOUT, remaining) * 1000)
+                    clicked = True
+                    continue
+            except Exception as e:
+                logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
+                clicked = True
+        # Before the click, look for the button again shortly; after it, wait for the response
+        capture.wait(page, hint_id, remaining if clicked else min(HINT_POLL_INTERVAL, remaining))
 
-    # Click on the Unlock Complete Solution button
+def open_api_gateways(page: Page, slug: str, capture: HintCapture, hint_ids: List, deadline: float) -> None:
+    """
+    Opens the API gateways for the given problem slug, moving on as soon as each hint response is captured.
+
+    Args:
+        page (Page): The Playwright page object.
+        slug (str): The problem slug.
+        capture (HintCapture): The capture of the problem, already listening on the page.
+        hint_ids (List): The IDs of the hint, the solution approach and the complete solution; None for missing ones.
+        deadline (float): `time.monotonic()` value after which the remaining hints are given up.
+
+    Returns:
+        None
+    """
+    hint_id, solution_approach_id, complete_solution_id = hint_ids
+    problem_url = f"https://www.interviewbit.com/problems/{slug}"
+    page.goto(problem_url, wait_until="domcontentloaded")
+    timeout = HINT_CLICK_TIMEOUT * 1000
+
+    # Click on the Hints link, then on the Unlock Hint button
     try:
-        page.get_by_text("Unlock Complete Solution").click(timeout=5000)
+        page.get_by_role("link", name="Hints").click(timeout=timeout)
     except Exception as e:
         logging.info(f"BROWSER --> EXCEPTION OCCURED       <EXCEPTION = {e}>")
+    unlock_hint(page, capture, hint_id, lambda: None, "Unlock Hint", deadline)
+
+    # Click on the Solution Approach link, then on the Unlock Solution Approach button
+    unlock_hint(
+        page, capture, solution_approach_id,
+        lambda: page.locator("a").filter(has_text="Solution Approach").click(timeout=timeout),
+        "Unlock Solution Approach", deadline
+        )
+
+    # Click on the Complete Solution link, then on the Unlock Complete Solution button
+    unlock_hint(
+        page, capture, complete_solution_id,
+        lambda: page.locator("a").filter(has_text="Complete Solution").click(timeout=timeout),
+        "Unlock Complete Solution", deadline
+        )
         
-def get_hints(hints_meta, slug: str, page: Page) -> None:
+def get_hints(hints_meta, slug: str, page: Page) -> Optional[Dict]:
     """
-    Opens the API gateways for the given problem slug.
+    Opens the API gateways for the given problem slug and reads the captured hint responses.
 
     Args:
+        hints_meta (List[Dict]): The hints metadata of the problem.
         slug (str): The problem slug.
-        page (Page): The Playwright page object.
+        page (Page): The Playwright page object. It can be a page of any pooled context, since the capture is scoped to this call.
 
     Returns:
-        None
+        Dict: The hint, the solution approach and the complete solutions, or None if the problem has no hints.
+
+    Raises:
+        SessionRejected: If InterviewBit refused the hint requests of this context.
     """
     
     hints_dict = dict()
@@ -331,9 +565,6 @@ def get_hints(hints_meta, slug: str, page: Page) -> None:
     if hints_meta is None:
         return None
     
-    global URL
-    global HINT_RESPONSE
-    
     for hint in hints_meta:
         if 'hint' in hint.get('title').lower():
             hint_id = hint.get('id')
@@ -342,25 +573,33 @@ def get_hints(hints_meta, slug: str, page: Page) -> None:
         if 'complete' in hint.get('title').lower():
             complete_solution_id = hint.get('id')
                 
-    open_api_gateways(page)
-    logging.info(f"PAGE    --> RESPONSE CAPTURE WAIT    <TIME = 25 SECONDS>")
-    page.wait_for_timeout(25000)
+    capture = HintCapture(slug)
+    hint_ids = [hint_id, solution_approach_id, complete_solution_id]
+    start_time = time.monotonic()
+    page.on("response", capture.handle)
+    try:
+        open_api_gateways(page, slug, capture, hint_ids, start_time + HINT_DEADLINE)
+    finally:
+        page.remove_listener("response", capture.handle)
+    captured = sum(capture.has(hint) for hint in hint_ids if hint is not None)
+    expected = sum(hint is not None for hint in hint_ids)
+    logging.info(f"PAGE    --> HINTS CAPTURED          <CAPTURED = {captured}/{expected}, TIME = {time.monotonic() - start_time:.1f} SECONDS>")
+    if capture.rejected:
+        logging.info(f"PAGE    --> HINTS REFUSED, LOGIN EXPIRED <SLUG = {slug}>")
+        raise SessionRejected(slug)
     
     try:
-        hint_url = [url for url in HINT_RESPONSE if f"hints/{hint_id}" in url].pop(0)
-        hints_dict['hint'] = HINT_RESPONSE.get(hint_url).get('hint').get('markdown_content')
+        hints_dict['hint'] = capture.find(hint_id).get('hint').get('markdown_content')
     except:
         hints_dict['hint'] = None
         
     try:
-        approach_url = [url for url in HINT_RESPONSE if f"hints/{solution_approach_id}" in url].pop(0)
-        hints_dict['solution_approach'] = HINT_RESPONSE.get(approach_url).get('hint').get('markdown_content')
+        hints_dict['solution_approach'] = capture.find(solution_approach_id).get('hint').get('markdown_content')
     except:
         hints_dict['solution_approach'] = None
     
     try:
-        solution_url = [url for url in HINT_RESPONSE if f"hints/{complete_solution_id}" in url].pop(0)
-        solution_response = HINT_RESPONSE.get(solution_url).get('hint').get('complete_solution')
+        solution_response = capture.find(complete_solution_id).get('hint').get('complete_solution')
         languages = solution_response.get('language_names')
         editorial_solutions = solution_response.get('editorial_solutions')
         hints_dict['solutions'] = dict()
@@ -368,7 +607,7 @@ def get_hints(hints_meta, slug: str, page: Page) -> None:
             if language_id not in editorial_solutions:
                 continue
             html_solution = editorial_solutions.get(language_id).get('content')
-            div_element = BeautifulSoup(html_solution, 'html.parser').find('div')
+            div_element = make_soup(html_solution).find('div')
             if div_element is None:
                 hints_dict['solutions'][languages.get(language_id)] = html_solution
             else:    
@@ -376,12 +615,81 @@ def get_hints(hints_meta, slug: str, page: Page) -> None:
                 hints_dict['solutions'][languages.get(language_id)] = actual_solution
     except:
         hints_dict['solutions'] = None
-            
-    page.remove_listener("response", playwright_request_handler)
-    HINT_RESPONSE = dict()
     
     return hints_dict
 
+def sign_in() -> Dict:
+    """
+    This function signs in with a new browser and saves the login to SESSION_STORE.
+
+    Returns:
+        Dict: The storage state of the logged-in context.
+    """
+    page, context, browser = do_login()
+    storage_state = context.storage_state()
+    SESSION_STORE.save(storage_state)
+    context.close()
+    browser.close()
+    return storage_state
+
+def capture_hints(problem_data: Dict) -> Optional[Tuple[ContextPool, Future]]:
+    """
+    Queues the hint capture of a problem on HINT_POOL.
+
+    Args:
+        problem_data (Dict): The problem data, with its slug and hints metadata.
+
+    Returns:
+        Optional[Tuple[ContextPool, Future]]: The pool and the future of the capture, or None if the problem has no hints.
+    """
+    hints_meta, slug = problem_data.get('hints_meta'), problem_data.get('title_slug')
+    if hints_meta is None:
+        return None
+    return HINT_POOL, HINT_POOL.submit(lambda page: get_hints(hints_meta, slug, page))
+
+def renew_session() -> None:
+    """
+    Signs in again and replaces HINT_POOL with contexts of the new login.
+    """
+    global HINT_POOL
+    logging.info('BROWSER --> SAVED LOGIN REJECTED, SIGNING IN AGAIN')
+    SESSION_STORE.discard()
+    expired_pool = HINT_POOL
+    HINT_POOL = ContextPool(sign_in(), size=HINT_CONTEXTS, headless=HINT_HEADLESS)
+    # Captures still queued on the old contexts fail fast and are submitted again
+    expired_pool.close()
+
+def store_problem(s3_key: str, problem_data: Dict, hints_capture: Optional[Tuple[ContextPool, Future]]) -> None:
+    """
+    Adds the captured hints to the problem data and queues it for upload.
+
+    If the login was rejected, the first problem to notice signs in again and every
+    affected problem is captured again with the new login. A rejection right after
+    a new sign-in stops the run instead of uploading problems without hints.
+
+    Args:
+        s3_key (str): The S3 key of the problem.
+        problem_data (Dict): The problem data collected over HTTP.
+        hints_capture (Optional[Tuple[ContextPool, Future]]): The pooled hint capture of the problem, or None if it has no hints.
+    """
+    hints_dict = None
+    if hints_capture is not None:
+        pool, hints_future = hints_capture
+        try:
+            hints_dict = hints_future.result()
+        except SessionRejected:
+            if pool is HINT_POOL:
+                renew_session()
+            hints_dict = capture_hints(problem_data)[1].result()
+    if hints_dict is not None:
+        for key in hints_dict:
+            problem_data[key] = hints_dict.get(key)
+
+    # with open(f'sample/{problem_data.get("title_slug")}.json', 'w')   # test
+    #     json.dump(problem_data, file, indent=4)
+
+    UPLOADER.submit(s3_key, problem_data) # src
+
 def get_code_snippets(slug: str, languages: Dict) -> Dict:
     """
     This function retrieves the code snippets for the given problem slug and programming languages.
@@ -393,15 +701,18 @@ def get_code_snippets(slug: str, languages: Dict) -> Dict:
     Returns:
         Dict: A dictionary of programming languages with their code snippets as values.
     """
-    code_snippets = dict()
-    for language_id in languages:
+    def get_code_snippet(language_id):
         url = f"https://www.interviewbit.com/v2/problems/{slug}/codes/?programming_language_id={language_id}"
         """
-        This function uses the requests library to make an HTTP GET request to the InterviewBit API endpoint
+        This function uses the pooled HTTP session to make an HTTP GET request to the InterviewBit API endpoint
         that returns the code snippet for the specified problem slug and programming language.
         """
         logging.info(f'API     --> GETTING CODE SNIPPET    <LANGUAGE = {languages.get(language_id)}>')
-        code_snippet = requests.get(url).json().get('content')
+        return http_session.get(url).json().get('content')
+
+    # Every language is requested at the same time; unchanged templates come from the HTTP cache
+    code_snippets = dict()
+    for language_id, code_snippet in fetch_in_order(languages, get_code_snippet, concurrency=max(1, len(languages))):
         code_snippets[languages.get(language_id)] = code_snippet
     return code_snippets
 
@@ -409,15 +720,23 @@ if __name__ == '__main__':
     
     global_vars()
     initialize_logging()
+    MANIFEST.load(S3_FOLDER_PATH, get_objects_list, resync=RESYNC_MANIFEST)
     
     with sync_playwright() as p:
         
-        page, context, browser = do_login()
+        # Every pooled context starts from the cookies of the saved or a new sign-in
+        saved_session = SESSION_STORE.load()
+        storage_state = saved_session.get('storage_state') if saved_session else None
+        if storage_state is None:
+            storage_state = sign_in()
+        HINT_POOL = ContextPool(storage_state, size=HINT_CONTEXTS, headless=HINT_HEADLESS)
+        
+        # Problems whose hints are still being captured, oldest first
+        in_flight = deque()
         
         while START_PAGE <= END_PAGE:
             
             problem_list = get_problem_list(START_PAGE)
-            global SLUG
                         
             for problem in problem_list: 
                 
@@ -425,9 +744,8 @@ if __name__ == '__main__':
                 if problem.get('topic_title') == 'Puzzles':
                     continue
                 
-                uploaded_list = get_objects_list(S3_FOLDER_PATH)
                 s3_key = S3_FOLDER_PATH + '/' + problem.get('slug')
-                if s3_key in uploaded_list:
+                if s3_key in MANIFEST:
                     logging.info(f'CLOUD   --> FILE ALREADY PRESENT    <FILE = |{s3_key}|>')
                     uploaded_json = get_object_as_json(s3_key)
                     if not(uploaded_json.get('hint') is None or uploaded_json.get('solution_approach') is None or uploaded_json.get('solutions') is None):
@@ -441,17 +759,17 @@ if __name__ == '__main__':
                 problem_data['company_tags'] = problem.get('tags')
                 problem_data['category'] = problem.get('topic_title')
                 
-                SLUG = problem.get('slug')
+                slug = problem.get('slug')
                 
                 source = dict()
-                source['url'] = f"https://www.interviewbit.com/problems/{SLUG}"
+                source['url'] = f"https://www.interviewbit.com/problems/{slug}"
                 source['interviewbit_score'] = problem.get('score')
                 source['interviewbit_avg_solving_time'] = problem.get('average_solving_time')
                 source['interviewbit_solved_count'] = problem.get('solved_by')
                 
                 problem_data['source'] = source
                 
-                problem_content = get_problem_data(SLUG)
+                problem_content = get_problem_data(slug)
                 
                 if problem_content is None:
                     continue
@@ -460,97 +778,36 @@ if __name__ == '__main__':
                 
                 available_languages = languages.values()
                 problem_content['available_languages'] = list(available_languages)
-                problem_data['code_snippets'] = get_code_snippets(SLUG, languages)
+                problem_data['code_snippets'] = get_code_snippets(slug, languages)
                 problem_data['input_descriptor'] = problem_content.get('meta').get('input_descriptor')
                 problem_data['html_content'] = problem_content.get('meta').get('markdown_content')
                 
-                html_soup = BeautifulSoup(problem_data['html_content'], 'html.parser')
-                
-                try:
-                    div_ele = html_soup.find('div', id='problem_description_markdown_content_value')
-                    description = div_ele.get_text().strip()
-                    problem_data['description'] = description
-                except:
-                    problem_data['description'] = None
-                
-                try:
-                    div_ele = html_soup.find('div', id='problem_constraints_markdown_content_value')
-                    constraints = div_ele.get_text().strip().split("\n")
-                    problem_data['constraints'] = constraints
-                except:
-                    problem_data['constraints'] = None
-                
-                try:
-                    div_ele = html_soup.find('div', id='input_format_markdown_content_value')
-                    input_format = div_ele.get_text().strip()
-                    problem_data['input_format'] = input_format
-                except:
-                    problem_data['input_format'] = None
-                
-                try:
-                    div_ele = html_soup.find('div', id='output_format_markdown_content_value')
-                    output_format = div_ele.get_text().strip()
-                    problem_data['output_format'] = output_format
-                except:
-                    problem_data['output_format'] = None
-                
-                try:
-                    div_ele = html_soup.find('div', id='example_input_markdown_content_value')
-                    p_tags = div_ele.find_all('p')
-                    inputs = dict()
-                    for tag in p_tags:
-                        key = tag.get_text().strip()
-                        pre_tag = tag.find_next_sibling('pre')
-                        value = pre_tag.get_text().strip()
-                        inputs[key] = value
-                    problem_data['example_input'] = inputs
-                except:
-                    problem_data['example_input'] = None
-                
-                try:
-                    div_ele = html_soup.find('div', id='example_output_markdown_content_value')
-                    p_tags = div_ele.find_all('p')
-                    p_tags = [p for p in p_tags if p.get_text().strip()]
-                    outputs = dict()
-                    for tag in p_tags:
-                        key = tag.get_text().strip()
-                        pre_tag = tag.find_next_sibling('pre')
-                        value = pre_tag.get_text().strip()
-                        outputs[key] = value
-                    problem_content['example_output'] = outputs
-                except:
-                    problem_content['example_output'] = None
-                
-                try:
-                    div_ele = html_soup.find('div', id='example_explanation_markdown_content_value')
-                    p_tags = div_ele.find_all('p')
-                    p_tags = [p for p in p_tags if p.get_text().strip()]
-                    explanations = dict()
-                    for tag in p_tags:
-                        key = tag.get_text().strip()
-                        pre_tag = tag.find_next_sibling('pre')
-                        value = pre_tag.get_text().strip()
-                        explanations[key] = value
-                    problem_content['example_explanation'] = explanations
-                except:
-                    problem_content['example_explanation'] = None
+                sections = extract_sections(problem_data['html_content'])
+                problem_data['description'] = sections.description
+                problem_data['constraints'] = sections.constraints
+                problem_data['input_format'] = sections.input_format
+                problem_data['output_format'] = sections.output_format
+                problem_data['example_input'] = sections.example_input
+                problem_data['example_output'] = sections.example_output
+                problem_data['example_explanation'] = sections.example_explanation
                 
                 hints_meta = problem_content.get('hints').get('hints')
                 
                 problem_data['hints_meta'] = hints_meta
                 
-                hints_dict = get_hints(hints_meta, SLUG, page)
+                in_flight.append((s3_key, problem_data, capture_hints(problem_data)))
                 
-                if hints_dict is not None:
-                    for key in hints_dict:
-                        problem_data[key] = hints_dict.get(key)
-                                    
-                # with open(f'sample/{problem_data.get("title_slug")}.json', 'w')   # test
-                #     json.dump(problem_data, file, indent=4)
-                                    
-                upload_json_to_s3(s3_key, problem_data) # src
+                # Keep every context busy with one more problem queued behind it, finishing the oldest first
+                while len(in_flight) > 2 * HINT_POOL.size:
+                    store_problem(*in_flight.popleft())
             
             START_PAGE += 1
         
-        context.close()
-        browser.close()
+        while in_flight:
+            store_problem(*in_flight.popleft())
+        HINT_POOL.close()
+    
+    # Wait for the queued uploads to finish
+    UPLOADER.close()
+    rate_limit.log_stats()
+    http_cache.log_stats()
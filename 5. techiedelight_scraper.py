@@ -2,15 +2,29 @@ import logging
 import sys
 import os
 import boto3
+from botocore.config import Config
+import functools
+import gzip
+import itertools
 import json
-import requests
+import tempfile
 import time
 from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from scraper_common import http_cache, http_session, rate_limit
+from scraper_common.browser import LazyPage
+from scraper_common.fetch_engine import fetch_in_order
+from scraper_common.s3_manifest import S3Manifest
+from scraper_common.s3_uploader import S3Uploader
+from scraper_common.html_sanitizer import strip_styles
+from scraper_common.fast_json import loads as fast_json_loads
+from scraper_common.retry import CircuitOpenError
+from scraper_common.soup import make_soup
 
 # type hinting imports
 from playwright.sync_api import Page
-from typing import List, Dict, Tuple, Optional, Union, Any
+from bs4 import BeautifulSoup
+from requests import RequestException, Response
+from typing import IO, List, Dict, Tuple, Optional, Union, Any
 
 def constants_definitions() -> None:
     """
@@ -19,6 +33,14 @@ def constants_definitions() -> None:
     # BROWSER
     global HEADLESS_OPTION
     HEADLESS_OPTION = True
+    
+    # PAGES (fetched over HTTP first; the browser is only launched for pages missing the expected elements)
+    global HTTP_FIRST, PAGE_HEADERS
+    HTTP_FIRST = True
+    PAGE_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+    }
 
     # AWS
     global S3, S3_FOLDER_PATH, BUCKET
@@ -26,14 +48,30 @@ def constants_definitions() -> None:
     AWS_SECRET_KEY = "YOUR_AWS_SECRET_KEY"
     AWS_REGION = "YOUR_AWS_REGION"
     BUCKET = "YOUR_BUCKET"
+    UPLOAD_WORKERS = 4
     S3 = boto3.client(
         's3', 
         aws_access_key_id=AWS_ACCESS_KEY, 
         aws_secret_access_key=AWS_SECRET_KEY, 
-        region_name=AWS_REGION
+        region_name=AWS_REGION,
+        config=Config(max_pool_connections=UPLOAD_WORKERS)
     )
     S3_FOLDER_PATH = "YOUR_S3_LOCATION"
     
+    # S3 MANIFEST (pass --resync to rebuild it from a fresh S3 listing)
+    global MANIFEST, RESYNC_MANIFEST
+    MANIFEST = S3Manifest(BUCKET)
+    RESYNC_MANIFEST = '--resync' in sys.argv
+    
+    # BACKGROUND UPLOADER
+    global UPLOADER
+    UPLOADER = S3Uploader(upload_json_to_s3, workers=UPLOAD_WORKERS, max_queue=2 * UPLOAD_WORKERS)
+    
+    # TESTCASES (streamed to their own gzipped objects instead of the problem JSON)
+    global STREAM_TESTCASES, TESTCASE_SPOOL_BYTES
+    STREAM_TESTCASES = True
+    TESTCASE_SPOOL_BYTES = 1024 * 1024
+    
     # LOGGING
     global LOG_FILE_DIR
     global LOCAL_LOG, TEST_LOG, BROWSER_LOG, API_LOG, CLOUD_LOG
@@ -130,8 +168,52 @@ def upload_json_to_s3(s3_key: str, data: Dict) -> None:
         Body=json.dumps(data, indent=4),
         ContentType='application/json'
     )
+    MANIFEST.add(s3_key)
     log(CLOUD_LOG, "uploading json to s3", s3_key)
 
+def upload_gzip_to_s3(s3_key: str, file: IO[bytes], content_type: str) -> None:
+    """
+    Upload a gzipped file to an S3 bucket.
+
+    Parameters:
+        s3_key (str): The key under which the object is stored in the bucket.
+        file (IO[bytes]): The gzipped content, read from its current position.
+        content_type (str): The content type of the uncompressed content.
+    """
+    S3.upload_fileobj(file, BUCKET, s3_key, ExtraArgs={'ContentType': content_type, 'ContentEncoding': 'gzip'})
+    MANIFEST.add(s3_key)
+    log(CLOUD_LOG, "uploading testcases to s3", s3_key)
+
+def fetch_page(page: Page, url: str, selectors: List[str], wait_until: str = 'load') -> Tuple[str, BeautifulSoup]:
+    """
+    Fetch and parse a page, over HTTP when the server-rendered HTML already contains the expected elements.
+
+    Parameters:
+        page (Page): The Playwright page object, only used when the HTTP response lacks an element.
+        url (str): The URL of the page.
+        selectors (List[str]): CSS selectors of elements the page must all contain.
+        wait_until (str): The load state to wait for when the browser is used.
+
+    Returns:
+        Tuple[str, BeautifulSoup]: The HTML of the page and its soup.
+    """
+    if HTTP_FIRST:
+        log(API_LOG, "fetching page", url)
+        try:
+            response = http_session.request("GET", url, headers=PAGE_HEADERS)
+        except (RequestException, CircuitOpenError) as e:
+            log(API_LOG, "page request failed", url, e)
+        else:
+            if response.status_code == 200:
+                soup = make_soup(response.text)
+                if all(soup.select_one(selector) is not None for selector in selectors):
+                    return response.text, soup
+            log(BROWSER_LOG, "elements missing over http, using browser", url)
+    log(BROWSER_LOG, "redirecting to", url)
+    page.goto(url, wait_until=wait_until)
+    html = page.content()
+    return html, make_soup(html)
+
 def get_problem_urls(page: Page) -> List[str]:
     """
     Get the URLs of problems from the main page.
@@ -143,15 +225,10 @@ def get_problem_urls(page: Page) -> List[str]:
         List[str]: A list of problem URLs.
     """
     main_url = "https://www.techiedelight.com"
-    log(BROWSER_LOG, f"redirecting to", main_url)
-    page.goto(main_url)
-    
-    log(BROWSER_LOG, "fetching page content")
-    content = page.content()
+    _, soup = fetch_page(page, main_url, ['span#problemsList ol li a'])
     
     log(LOCAL_LOG, "getting problem urls")
     
-    soup = BeautifulSoup(content, 'html.parser')
     problem_list_span_tag = soup.find('span', id="problemsList")
     ol_sibling_tag = problem_list_span_tag.find('ol')
     li_tag_list = ol_sibling_tag.find_all('li')
@@ -203,7 +280,7 @@ def get_code(slug: str, language: str) -> str:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
         'sec-ch-ua-platform': '"Windows"'
     }
-    response = requests.request("GET", url, headers=headers, data=payload)
+    response = http_session.request("GET", url, headers=headers, data=payload)
     return response.text
 
 def fetch_code_snippet(slug: str) -> Dict[str, str]:
@@ -216,13 +293,11 @@ def fetch_code_snippet(slug: str) -> Dict[str, str]:
     Returns:
         Dict[str, str]: A dictionary containing code snippets for different programming languages.
     """
-    cpp_code = get_code(slug, "cpp")
-    py_code = get_code(slug, "py")
-    java_code = get_code(slug, "java")
+    # The three templates are requested at the same time; unchanged ones come from the HTTP cache
+    languages = {'cpp': 'cpp', 'py': 'python', 'java': 'java'}
     code_snippets = {
-        'cpp': cpp_code,
-        'python': py_code,
-        'java': java_code,
+        languages[language]: code
+        for language, code in fetch_in_order(languages, lambda language: get_code(slug, language), concurrency=len(languages))
     }
     return code_snippets
 
@@ -236,15 +311,7 @@ def remove_css(html_content : str) -> str:
     Returns:
         str: The HTML document with all the CSS styles removed.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    for style_tag in soup.find_all('style'):
-        style_tag.decompose()
-
-    for tag in soup.find_all():
-        del tag['style']
-    
-    return str(soup)
+    return strip_styles(html_content)
 
 def fetch_html_and_editorial_url(page: Page, problem_url: str) -> str:
     """
@@ -257,11 +324,8 @@ def fetch_html_and_editorial_url(page: Page, problem_url: str) -> str:
     Returns:
         Tuple[str, str]: A tuple containing the editorial URL and HTML content.
     """
-    log(BROWSER_LOG, "redirecting to", problem_url)
     main_url = "https://www.techiedelight.com"
-    page.goto(problem_url)
-    html_text = page.content()
-    soup = BeautifulSoup(html_text, 'html.parser')
+    html_text, soup = fetch_page(page, problem_url, ['a#editorial[href]'])
     a_tag = soup.find('a', id="editorial")
     editorial_href = a_tag.get('href')
     editorial_url = main_url + editorial_href 
@@ -271,15 +335,16 @@ def fetch_html_and_editorial_url(page: Page, problem_url: str) -> str:
         html_text
     )
 
-def fetch_dirty_testcases(slug: str) -> str:
+def request_testcases(slug: str, stream: bool = False) -> Response:
     """
-    Fetch dirty test cases for a given problem slug.
+    Request the test case file of a given problem slug.
 
     Parameters:
         slug (str): The slug of the problem.
+        stream (bool): Leave the body unread so it can be iterated.
 
     Returns:
-        str: The dirty test cases.
+        Response: The response.
     """
     log(API_LOG, "fetching testcases", slug)
     url = f"https://www.techiedelight.com/practice/template/{slug}/{slug}"
@@ -293,84 +358,105 @@ def fetch_dirty_testcases(slug: str) -> str:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
         'sec-ch-ua-platform': '"Windows"'
     }
-    response = requests.request("GET", url, headers=headers, data=payload)
-    return response.text
+    return http_session.request("GET", url, headers=headers, data=payload, stream=stream)
 
-def custom_clean(dirty_x: str) -> Union[bool, int, str, List]:
+def fetch_dirty_testcases(slug: str) -> str:
     """
-    Clean dirty input data.
+    Fetch dirty test cases for a given problem slug.
 
     Parameters:
-        dirty_x (str): The dirty input data.
+        slug (str): The slug of the problem.
 
     Returns:
-        Union[bool, int, str, List]: The cleaned data.
+        str: The dirty test cases.
     """
-    if ',' in dirty_x:
-        try:
-            return list(map(int, dirty_x.split(',')))
-        except:
-            return dirty_x.split(',')
-    
-    elif 'Y' in dirty_x.upper():
-        x = dirty_x.replace('Y', 'True')
-        x = x.replace('y', 'true')
-        try:
-            return eval(x)
-        except:
-            return dirty_x
-    
-    elif 'N' in dirty_x.upper():
-        x = dirty_x.replace('N', 'False')
-        x = x.replace('n', 'False')
-        try:
-            x = eval(x)
-            return x
-        except:
-            return dirty_x
-    
-    else:
-        try:
-            return int(dirty_x)
-        except:
-            return dirty_x
+    return request_testcases(slug).text
+
+# Testcase files: one testcase per line, input fields separated by '|' and the expected
+# output last, with '#' between accepted alternatives. A field is a comma separated
+# list, a boolean (Y or N), an integer or otherwise a plain string.
+# A list field made only of these characters is tried as a JSON array body first
+TESTCASE_INTEGER_LIST_CHARS = '0123456789-, \t'
+TESTCASE_BOOLEANS = {'Y': True, 'y': True, 'N': False, 'n': False}
+
+def is_testcase_integer(text: str) -> bool:
+    """
+    Check whether a testcase item is an optionally signed run of decimal digits.
+
+    Parameters:
+        text (str): The item, possibly padded with whitespace.
+
+    Returns:
+        bool: True if int() reads the item as written.
+    """
+    text = text.strip()
+    return text[1:].isdecimal() if text[:1] in ('+', '-') else text.isdecimal()
+
+def parse_testcase_field(field: str) -> Union[bool, int, str, List]:
+    """
+    Parse one field of a testcase line.
+
+    Parameters:
+        field (str): The stripped field text.
+
+    Returns:
+        Union[bool, int, str, List]: A list of integers if every comma separated item is an integer,
+        otherwise the items as written; a boolean for Y or N; an integer; or the text itself.
+    """
+    if ',' in field:
+        if not field.strip(TESTCASE_INTEGER_LIST_CHARS):
+            try:
+                return fast_json_loads(f'[{field}]')
+            except ValueError:
+                pass
+        items = field.split(',')
+        if '_' not in field:
+            try:
+                return list(map(int, items))
+            except ValueError:
+                pass
+        return items
+    if field in TESTCASE_BOOLEANS:
+        return TESTCASE_BOOLEANS[field]
+    if is_testcase_integer(field):
+        return int(field)
+    return field
+
+def parse_testcase_line(line: str) -> Optional[Dict[str, Union[bool, int, str, List]]]:
+    """
+    Clean one line of dirty test cases.
+
+    Parameters:
+        line (str): The line, without its line break.
+
+    Returns:
+        Optional[Dict[str, Union[bool, int, str, List]]]: The cleaned test case, or None for a blank line.
+    """
+    if not line.strip():
+        return None
+    fields = line.split('|')
+    inputs = [parse_testcase_field(field.strip()) for field in fields[:-1]]
+    outputs = [parse_testcase_field(output.strip()) for output in fields[-1].split('#')]
+    return {
+        'input': inputs[0] if len(inputs) == 1 else inputs,
+        'accepted_output(s)': outputs[0] if len(outputs) == 1 else outputs
+    }
 
 def clean_testcases(dirty_content: str) -> List[Dict[str, Union[bool, int, str, List]]]:
     """
     Clean dirty test cases.
 
     Parameters:
-        dirty_content (str): The dirty test cases.
+        dirty_content (str): The dirty test cases, one per line; blank lines are skipped.
 
     Returns:
         List[Dict[str, Union[bool, int, str, List]]]: The cleaned test cases.
     """
-    dirty_testcases_list = dirty_content.split('\n')
     cleaned_testcases = list()
-    for dirty_TC in dirty_testcases_list:
-        dirty_TC = dirty_TC.split('|')
-        dirty_TC = list(map(str.strip, dirty_TC))
-        inputs, outputs = dirty_TC[:-1], dirty_TC[-1]
-        inputs = list(map(custom_clean, inputs))
-        if type(inputs) == list:
-            inputs = inputs[0] if len(inputs) == 1 else inputs
-        if '#' in outputs:
-            outputs = outputs.split('#')
-        if type(outputs) == list:
-            outputs = list(map(lambda x: x.strip(), outputs))
-        else:
-            outputs = outputs.strip()
-        if type(outputs) == list:
-            outputs = list(map(custom_clean, outputs))
-        else:
-            outputs = custom_clean(outputs)
-        
-        if type(outputs) == list:
-            outputs = outputs[0] if len(outputs) == 1 else outputs
-        cleaned_testcases.append({
-            'input': inputs,
-            'accepted_output(s)': outputs
-        })
+    for line in dirty_content.split('\n'):
+        testcase = parse_testcase_line(line)
+        if testcase is not None:
+            cleaned_testcases.append(testcase)
     return cleaned_testcases
     
 def fetch_testcases(slug: str) -> Dict[str, str]:
@@ -390,6 +476,70 @@ def fetch_testcases(slug: str) -> Dict[str, str]:
         'cleaned': cleaned_testcases
     }
 
+def upload_testcases(slug: str, s3_prefix: str) -> Dict[str, Union[str, int]]:
+    """
+    Stream the test cases of a given problem slug to S3, cleaning them line by line.
+
+    The response is read in chunks. The raw file and the cleaned test cases, one
+    JSON object per line, are gzipped into spooled temporary files that only
+    spill to disk beyond TESTCASE_SPOOL_BYTES, so memory stays flat whatever the
+    size of the file. Both files are handed to the background uploader. When the
+    HTTP cache confirms the file is unchanged and both objects are in the
+    manifest, they are only counted and not uploaded again.
+
+    Parameters:
+        slug (str): The slug of the problem.
+        s3_prefix (str): The S3 folder the problem JSON is uploaded to.
+
+    Returns:
+        Dict[str, Union[str, int]]: The S3 keys of the dirty and cleaned test cases and the number of test cases.
+    """
+    dirty_key = f"{s3_prefix}/testcases/{slug}.txt.gz"
+    cleaned_key = f"{s3_prefix}/testcases/{slug}.jsonl.gz"
+    count = 0
+    dirty_file = tempfile.SpooledTemporaryFile(max_size=TESTCASE_SPOOL_BYTES)
+    cleaned_file = tempfile.SpooledTemporaryFile(max_size=TESTCASE_SPOOL_BYTES)
+    try:
+        with request_testcases(slug, stream=True) as response:
+            # A body served or revalidated by the HTTP cache is the one an earlier run uploaded
+            unchanged = getattr(response, 'from_cache', False) and dirty_key in MANIFEST and cleaned_key in MANIFEST
+            encoding = response.encoding or 'utf-8'
+            # Fast compression: the default level 9 costs several times more than the parsing
+            with gzip.GzipFile(fileobj=dirty_file, mode='wb', compresslevel=1) as dirty_gzip, \
+                    gzip.GzipFile(fileobj=cleaned_file, mode='wb', compresslevel=1) as cleaned_gzip:
+                pending = b''
+                for chunk in itertools.chain(response.iter_content(chunk_size=64 * 1024), [None]):
+                    if chunk is None:
+                        # End of the body: the unterminated last line is complete
+                        lines, pending = [pending], b''
+                    else:
+                        if not unchanged:
+                            dirty_gzip.write(chunk)
+                        lines = (pending + chunk).split(b'\n')
+                        pending = lines.pop()
+                    testcases = filter(None, (parse_testcase_line(line.decode(encoding, errors='replace')) for line in lines))
+                    cleaned_lines = [json.dumps(testcase) for testcase in testcases]
+                    if cleaned_lines:
+                        if not unchanged:
+                            cleaned_gzip.write(('\n'.join(cleaned_lines) + '\n').encode())
+                        count += len(cleaned_lines)
+    except BaseException:
+        dirty_file.close()
+        cleaned_file.close()
+        raise
+    for file, key, content_type in ((dirty_file, dirty_key, 'text/plain'), (cleaned_file, cleaned_key, 'application/x-ndjson')):
+        if unchanged:
+            file.close()
+            log(CLOUD_LOG, "file already present in", key)
+        else:
+            # The uploader owns the file from here and closes it once uploaded
+            UPLOADER.submit(key, file, upload=functools.partial(upload_gzip_to_s3, content_type=content_type))
+    return {
+        'dirty_s3_key': dirty_key,
+        'cleaned_s3_key': cleaned_key,
+        'count': count
+    }
+
 def fetch_editorial_solutions(page: Page, editorial_url: str) -> Dict[str,List[str]]:
     """
     Fetch editorial solutions for a given problem.
@@ -401,13 +551,10 @@ def fetch_editorial_solutions(page: Page, editorial_url: str) -> Dict[str,List[s
     Returns:
         Dict[str,List[str]]: Editorial solutions.
     """
-    log(BROWSER_LOG, "redirecting to editorial url", editorial_url)
-    page.goto(editorial_url, wait_until='domcontentloaded')
-    editorial_content = page.content()
-    editorial_content = BeautifulSoup(editorial_content, 'html.parser')
+    _, editorial_content = fetch_page(page, editorial_url, ['h2.tabtitle', 'div.c-pre'], wait_until='domcontentloaded')
         
-    h2_tags_list = editorial_content.find_all('h2', class_='tabtitle responsive-tabs__heading')
-    h2_tags_list.extend(editorial_content.find_all('h2', class_='tabtitle responsive-tabs__heading responsive-tabs__heading--active'))
+    # The tabs script adds the responsive-tabs__heading classes in the browser; server HTML only has tabtitle
+    h2_tags_list = editorial_content.select('h2.tabtitle')
     
     test_dict = dict()
     
@@ -430,14 +577,12 @@ if __name__ == '__main__':
 
     constants_definitions()
     initialize_logging(LOG_FILE_DIR)
+    MANIFEST.load(S3_FOLDER_PATH, get_objects_list, resync=RESYNC_MANIFEST)
     
     with sync_playwright() as playwright:
         
-        log(BROWSER_LOG, "launching browser")
-        
-        browser = playwright.chromium.launch(headless=HEADLESS_OPTION)
-        context = browser.new_context()
-        page = context.new_page()
+        # The browser is only launched if a page cannot be read over HTTP
+        page = LazyPage(playwright, headless=HEADLESS_OPTION)
         
         problem_number = 0
         problem_urls = get_problem_urls(page)
@@ -454,9 +599,8 @@ if __name__ == '__main__':
             
             slug = get_slug(problem_url)
             
-            uploaded_list = get_objects_list(S3_FOLDER_PATH)
             s3_key = f"{S3_FOLDER_PATH}/{slug}.json"
-            if s3_key in uploaded_list:
+            if s3_key in MANIFEST:
                 log(CLOUD_LOG, "file already present in", s3_key)
                 log(LOCAL_LOG, "PROBLEM NUMBER", f"[{problem_number}]")
                 log(LOCAL_LOG, f'{"-"*30}\n')
@@ -467,7 +611,10 @@ if __name__ == '__main__':
             code_snippets = fetch_code_snippet(slug)
             editorial_url, html_content = fetch_html_and_editorial_url(page, problem_url)
             sample_code_snippet = code_snippets.get('python')
-            testcases = fetch_testcases(slug)
+            if STREAM_TESTCASES:
+                testcases = upload_testcases(slug, S3_FOLDER_PATH)
+            else:
+                testcases = fetch_testcases(slug)
             editorial_solutions = fetch_editorial_solutions(page, editorial_url)
             
             problem_data['slug'] = slug
@@ -480,7 +627,7 @@ if __name__ == '__main__':
             problem_data['editorial_url'] = editorial_url
             problem_data['editorial_solutions'] = editorial_solutions
             
-            upload_json_to_s3(s3_key, problem_data)
+            UPLOADER.submit(s3_key, problem_data)
             
             end_time = time.time()
             elapsed_time = end_time - start_time
@@ -491,4 +638,9 @@ if __name__ == '__main__':
             log(LOCAL_LOG, "PROBLEM NUMBER", f"[{problem_number}]")
             log(LOCAL_LOG, f'{"-"*30}\n')
             
-            problem_number += 1
\ No newline at end of file
+            problem_number += 1
+
+    # Wait for the queued uploads to finish
+    UPLOADER.close()
+    rate_limit.log_stats()
+    http_cache.log_stats()
@@ -0,0 +1,115 @@
+"""
+Measures the CodeChef accepted-submission phase: listing pages plus submission codes.
+
+Usage:
+    python benchmarks/bench_codechef_submissions.py [PROBLEMS] [LATENCY_MS]
+
+A local server plays the submissions API: listing pages of 10 where only some
+submissions are accepted (and some accepted codes are resubmissions of the same
+code), and the submission-code endpoint. The previous loop, which read up to 25
+listing pages and then each code one request after another, is compared with the
+prefetched listing and concurrent code fetch that stops at 6 distinct solutions.
+The previous loop skipped the rest of a listing page once it had 5 submissions
+and kept duplicates in its count, so it can return different or fewer solutions.
+"""
+import json
+import random
+import sys
+import time
+import types
+
+from common import load_scraper, start_json_stub
+
+from scraper_common import http_cache, http_session
+
+PAGE_SIZE = 10
+STATE = {'requests': 0}
+
+
+def submissions_of(slug):
+    rng = random.Random(slug)
+    return [
+        {'id': f'{slug}-{number}', 'tooltip': 'accepted' if rng.random() < 0.12 else 'wrong answer',
+         'language': rng.choice(['C++17', 'PYTH 3', 'JAVA']), 'code': f'// {slug} solution {rng.randint(0, 8)}'}
+        for number in range(rng.randint(20, 400))
+    ]
+
+
+def respond(method, path, body):
+    STATE['requests'] += 1
+    segments = path.split('?')[0].strip('/').split('/')
+    if segments[-2] == 'submission-code':
+        slug, number = segments[-1].rsplit('-', 1)
+        submission = submissions_of(slug)[int(number)]
+        return 200, {'data': {'language': {'full_name': submission['language']}, 'code': submission['code']}}
+    page = int(path.split('page=')[1])
+    submissions = submissions_of(segments[-1])
+    items = [{'id': item['id'], 'tooltip': item['tooltip']} for item in submissions[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]]
+    return 200, {'status': 'OK', 'data': items}
+
+
+def legacy_user_solutions(codechef, slug):
+    # The previous get_submission_list and code loop of the main block
+    count, page, submissions, previous_submission = 0, 1, [], None
+    while count <= 5 and page <= 25:
+        submission_list = codechef.get_submission_page(slug, page).get('data')
+        if previous_submission == submission_list or not submission_list:
+            break
+        previous_submission = submission_list
+        for submission in submission_list:
+            if submission.get('tooltip') == 'accepted':
+                submissions.append(submission)
+                count += 1
+                if count >= 5:
+                    break
+        page += 1
+    user_solutions = dict()
+    for index, submission in enumerate(submissions, 1):
+        submission = codechef.get_submission(submission.get('id'), index)
+        language = submission.get('language').get('full_name')
+        user_solutions.setdefault(language, [])
+        if submission.get('code') not in user_solutions[language]:
+            user_solutions[language].append(submission.get('code'))
+    return user_solutions
+
+
+def first_distinct(slug, limit=6):
+    # The expected result, read straight from the generated submissions
+    user_solutions, seen = dict(), set()
+    for item in submissions_of(slug)[:25 * PAGE_SIZE]:
+        if item['tooltip'] == 'accepted' and (item['language'], item['code']) not in seen and len(seen) < limit:
+            seen.add((item['language'], item['code']))
+            user_solutions.setdefault(item['language'], []).append(item['code'])
+    return user_solutions
+
+
+def run(label, fetch, slugs):
+    STATE['requests'] = 0
+    start_time = time.perf_counter()
+    results = [fetch(slug) for slug in slugs]
+    elapsed_time = (time.perf_counter() - start_time) / len(slugs)
+    solutions = sum(len(codes) for result in results for codes in result.values()) / len(slugs)
+    print(f'{label:<36} {elapsed_time * 1000:7.1f} ms/problem  {STATE["requests"] / len(slugs):5.1f} requests'
+          f'  {solutions:4.1f} distinct solutions per problem')
+    return results
+
+
+if __name__ == '__main__':
+    problems = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 60) / 1000
+    http_cache.configure(enabled=False)
+    server = start_json_stub(respond, latency=latency)
+    base = f'http://127.0.0.1:{server.server_port}'
+    codechef = load_scraper('3. codechef_scraper.py')
+    codechef.http_session = types.SimpleNamespace(
+        request=lambda method, url, **kwargs: http_session.request(method, url.replace('https://www.codechef.com', base), **kwargs)
+    )
+    codechef.HEADERS = {}
+    codechef.SUBMISSION_PAGES, codechef.SUBMISSION_PAGE_PREFETCH = 25, 2
+    codechef.SOLUTIONS_PER_PROBLEM, codechef.SUBMISSION_FETCH_WORKERS = 6, 4
+    slugs = [f'PROB{index}' for index in range(problems)]
+    print(f'{problems} problems, {latency * 1000:.0f} ms per request')
+
+    expected = run('sequential (previous loop)', lambda slug: legacy_user_solutions(codechef, slug), slugs)
+    results = run('prefetched pages, concurrent codes', codechef.get_user_solutions, slugs)
+    print(f'{"":<36} first 6 distinct accepted solutions in listing order: {results == [first_distinct(slug) for slug in slugs]}')
@@ -0,0 +1,57 @@
+"""
+Compares the full BeautifulSoup parse of GeeksforGeeks problem pages with the __NEXT_DATA__ fast path.
+
+Usage:
+    python benchmarks/bench_gfg_next_data.py [PAGES_DIR | PAGES]
+
+PAGES_DIR is a directory of saved problem pages (*.html); without it PAGES
+synthetic pages are generated. Reports CPU time and peak memory per problem.
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from common import REPO_DIR  # noqa: F401 -- puts the repository on sys.path
+from sample_pages import gfg_problem_page, load_pages
+
+from scraper_common import next_data
+
+
+def legacy(html: bytes) -> str:
+    # The previous get_problem_html: decode, parse the whole page, then the payload
+    soup = BeautifulSoup(html.decode('utf-8'), 'html.parser')
+    script_element = soup.find('script', id='__NEXT_DATA__')
+    json_content = json.loads(script_element.string)
+    return json_content.get('props').get('pageProps').get('initialState').get('problemData').get('allData').get('probData').get('problem_question')
+
+
+def fast(html: bytes) -> str:
+    json_content = next_data.extract_next_data(html)
+    return json_content.get('props').get('pageProps').get('initialState').get('problemData').get('allData').get('probData').get('problem_question')
+
+
+def measure(label, extract, pages):
+    start_time = time.process_time()
+    results = [extract(page) for page in pages]
+    cpu_time = (time.process_time() - start_time) / len(pages)
+    tracemalloc.start()
+    extract(pages[0])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'{label:<28} {cpu_time * 1000:8.2f} ms/problem  {peak / 1024 / 1024:8.2f} MB peak')
+    return cpu_time, results
+
+
+if __name__ == '__main__':
+    argument = sys.argv[1] if len(sys.argv) > 1 else '20'
+    pages = load_pages(argument) if os.path.isdir(argument) else [gfg_problem_page(index) for index in range(int(argument))]
+    average_size = sum(map(len, pages)) / len(pages)
+    print(f'{len(pages)} pages, {average_size / 1024:.0f} KB on average, JSON backend: {next_data.JSON_BACKEND}')
+
+    baseline, expected = measure('BeautifulSoup + json', legacy, pages)
+    elapsed_time, results = measure('__NEXT_DATA__ fast path', fast, pages)
+    print(f'{"":<28} speedup {baseline / elapsed_time:.1f}x, identical output: {results == expected}')
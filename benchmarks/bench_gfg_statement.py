@@ -0,0 +1,102 @@
+"""
+Compares the previous multi-scan GeeksforGeeks get_data_from_html with the single-pass version.
+
+Usage:
+    python benchmarks/bench_gfg_statement.py [PAGES_DIR | PAGES]
+
+PAGES_DIR is a directory of saved `problem_question` fragments (*.html); without it
+PAGES synthetic statements plus a set of edge cases are used. With html.parser both
+versions must return the same description, constraints and examples for every
+statement; other backends may differ where they repair malformed markup differently.
+"""
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from common import load_scraper
+from sample_pages import gfg_problem_question, load_pages
+
+from scraper_common import soup
+
+EDGE_CASES = [
+    '',
+    '<p>No examples here</p><p>Constraints: 1 &lt;= N</p>',
+    '<p>Intro</p><p><strong>Example 1:</strong></p><p>Missing pre</p>',
+    '<p>A &amp; B</p><p>Example:</p><pre>1 2</pre><p>Constraints<span>:</span> x<sup class="s">2</sup></p>',
+    '<p>Text</p><p>Example 1</p><div><pre> nested </pre></div><p>example 2 <pre>inside</pre></p>',
+    '<p>Intro <!-- note --> more</p><p>Example</p><pre>x</pre>'
+    '<p><strong>Constraints:</strong><br>1 ≤ N ≤ 10<sup>5</sup><br class="b">2<script>var a = 1;</script></p>',
+    '<p>First</p><p>Constraints: a<br/>b</p><p>Constraints: c<br>d<sup>2</sup></p>',
+    '<div><p>Outer <p>Inner Example</p></p></div><pre>\nfirst\n</pre>',
+]
+
+
+def legacy(html):
+    # The previous get_data_from_html, unchanged
+    soup = BeautifulSoup(html, "html.parser")
+
+    problem_description = []
+    Constraints = []
+
+    p_tag = soup.find("p")
+    try:
+        while "Example" not in p_tag.get_text():
+            problem_description.append(p_tag.get_text())
+            p_tag = p_tag.find_next("p")
+        problem_description = "\n".join(problem_description)
+    except:  # noqa: E722
+        problem_description = None
+
+    p_tags = soup.find_all("p")
+    for p_tag in p_tags:
+        if "Constraints" in p_tag.get_text():
+            p_tag_str = str(p_tag)
+            p_tag_str = p_tag_str.replace("Constraints:", "")
+            p_tag_str = p_tag_str.replace("<sup>", "**")
+            p_tag_str = p_tag_str.replace("</sup>", "")
+            p_tag_str = p_tag_str.replace("<br/>", "\n")
+            p_tag = BeautifulSoup(p_tag_str, "html.parser")
+            p_tag = p_tag.get_text().split("\n")
+            Constraints = [constraint for constraint in p_tag if constraint]
+
+    half_cleaned = dict()
+    index = 1
+
+    try:
+        p_tags = soup.find_all("p")
+        for p_tag in p_tags:
+            if "example" in p_tag.get_text().lower():
+                next_pre_tag = p_tag.find_next("pre")
+                half_cleaned[f"Example {index}"] = next_pre_tag.get_text().strip()
+                index += 1
+    except:  # noqa: E722
+        half_cleaned = None
+
+    return problem_description, Constraints, half_cleaned
+
+
+def measure(label, extract, pages):
+    start_time = time.process_time()
+    results = [extract(page) for page in pages]
+    cpu_time = (time.process_time() - start_time) / len(pages)
+    print(f'{label:<28} {cpu_time * 1000:8.3f} ms/problem')
+    return cpu_time, results
+
+
+if __name__ == '__main__':
+    argument = sys.argv[1] if len(sys.argv) > 1 else '300'
+    if os.path.isdir(argument):
+        pages = [page.decode('utf-8') for page in load_pages(argument)]
+    else:
+        pages = [gfg_problem_question(index) for index in range(int(argument))] + EDGE_CASES
+    print(f'{len(pages)} statements, {sum(map(len, pages)) / len(pages) / 1024:.1f} KB on average')
+
+    geeksforgeeks = load_scraper('2. geeksforgeeks_scraper.py')
+    baseline, expected = measure('multi-scan', legacy, pages)
+    for parser in soup.available_parsers():
+        soup.configure(parser)
+        elapsed_time, results = measure(f'single pass ({parser})', geeksforgeeks.get_data_from_html, pages)
+        mismatches = [index for index, (result, previous) in enumerate(zip(results, expected)) if result != previous]
+        print(f'{"":<28} speedup {baseline / elapsed_time:.1f}x, mismatching statements: {mismatches or "none"}')
@@ -0,0 +1,123 @@
+"""
+Measures GeeksforGeeks submission harvesting through the practice API with the browser as a fallback.
+
+Usage:
+    python benchmarks/bench_gfg_submissions.py [PROBLEMS] [LATENCY_MS]
+
+A local server plays the practice API: metainfo, submission pages of 20 with
+LastEvaluatedKey paging, and submission details. A stand-in page counts browser
+navigations and clicks. Four runs are compared: codes fetched one at a time;
+codes fetched concurrently while the API shows every submission; the API
+refuses them until the submissions table was clicked through; and the previous
+browser-first order.
+"""
+import random
+import sys
+import time
+import types
+from urllib.parse import parse_qs, urlsplit
+
+from common import load_scraper, start_json_stub
+
+from scraper_common import cookie_session, http_cache, http_session
+
+PAGE_SIZE = 20
+STATE = {'requests': 0, 'refuse': False, 'unlocked': set(), 'current': None}
+
+
+def submissions_of(problem_id):
+    rng = random.Random(problem_id)
+    return [
+        {'submission_id': f'{problem_id}-{number}', 'subtime': f'2024-01-{number % 28 + 1:02d} 10:00:00',
+         'lang': rng.choice(['cpp', 'java', 'python3']), 'exec_status_text': 'Correct' if rng.random() < 0.3 else 'Wrong Answer'}
+        for number in range(rng.randint(10, 120))
+    ]
+
+
+def respond(method, path, body):
+    STATE['requests'] += 1
+    parts = urlsplit(path)
+    segments = parts.path.strip('/').split('/')
+    if segments[-1] == 'metainfo':
+        return 200, {'results': {'id': int(segments[-2].split('-')[1]), 'extra': {}}}
+    if segments[-2] == 'submissions' and segments[-3] == 'problems':
+        problem_id = int(segments[-1].split('-')[0])
+        if STATE['refuse'] and problem_id not in STATE['unlocked']:
+            return 200, {'code': None, 'user_code': None, 'message': 'Submission is locked'}
+        return 200, {'code': f'// gfg {segments[-1]}', 'user_code': f'// user {segments[-1]}'}
+    problem_id = int(segments[-2])
+    submissions = submissions_of(problem_id)
+    after = parse_qs(parts.query).get('last_submission_key', [None])[0]
+    start = next((index + 1 for index, item in enumerate(submissions) if item['submission_id'] == after), 0)
+    items = submissions[start:start + PAGE_SIZE]
+    last = items[-1] if start + PAGE_SIZE < len(submissions) else None
+    return 200, {'message': {'submissions': {'Items': items, 'LastEvaluatedKey': last}}}
+
+
+class Clickable:
+    # Any locator chain of the stand-in page; clicking "OK" unlocks the current problem
+    def __init__(self, page, name=None):
+        self.page, self.name = page, name
+
+    def locator(self, *args, **kwargs):
+        return self
+
+    def nth(self, *args):
+        return self
+
+    def click(self):
+        self.page.clicks += 1
+        if self.name == 'OK':
+            STATE['unlocked'].add(STATE['current'])
+
+
+class StandInPage:
+    def __init__(self):
+        self.navigations = self.clicks = 0
+
+    def goto(self, url, **kwargs):
+        self.navigations += 1
+        STATE['current'] = int(url.rstrip('/').split('-')[-1])
+
+    def get_by_text(self, text, **kwargs):
+        return Clickable(self, text)
+
+    def get_by_role(self, role, name=None, **kwargs):
+        return Clickable(self, name)
+
+
+def run(label, geeksforgeeks, problems, api_first, refuse, workers=4):
+    STATE.update(requests=0, refuse=refuse, unlocked=set())
+    geeksforgeeks.SUBMISSIONS_API_FIRST = api_first
+    geeksforgeeks.SUBMISSIONS_PER_PROBLEM, geeksforgeeks.SUBMISSION_FETCH_WORKERS = 6, workers
+    page = StandInPage()
+    session = cookie_session.CookieSession(lambda stale: {'authtoken': 'token'})
+    start_time = time.perf_counter()
+    results = [
+        geeksforgeeks.get_problem_data(f'https://www.geeksforgeeks.org/problems/problem-{index}', f'problem-{index}', session, page)[1]
+        for index in range(problems)
+    ]
+    elapsed_time = (time.perf_counter() - start_time) / problems
+    print(f'{label:<34} {elapsed_time * 1000:7.1f} ms/problem  {STATE["requests"] / problems:5.1f} requests'
+          f'  {page.navigations / problems:4.1f} navigations  {page.clicks / problems:4.1f} clicks per problem')
+    return results
+
+
+if __name__ == '__main__':
+    problems = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 40) / 1000
+    http_cache.configure(enabled=False)
+    server = start_json_stub(respond, latency=latency)
+    base = f'http://127.0.0.1:{server.server_port}'
+    cookie_session.http_session = types.SimpleNamespace(
+        request=lambda method, url, **kwargs: http_session.request(
+            method, url.replace('https://practiceapi.geeksforgeeks.org', base), **kwargs)
+    )
+    geeksforgeeks = load_scraper('2. geeksforgeeks_scraper.py')
+    print(f'{problems} problems, {latency * 1000:.0f} ms per request')
+
+    expected = run('one code at a time', geeksforgeeks, problems, True, False, workers=1)
+    concurrent = run('api first, api shows submissions', geeksforgeeks, problems, True, False)
+    refused = run('api first, api refuses until unlock', geeksforgeeks, problems, True, True)
+    browser = run('browser first (previous order)', geeksforgeeks, problems, False, True)
+    print(f'{"":<34} same submissions in every run: {expected == concurrent == refused == browser}')
@@ -0,0 +1,87 @@
+"""
+Compares the HTML parser backends on the pages each scraper parses.
+
+Usage:
+    python benchmarks/bench_html_parsers.py [PAGES]
+
+For every workload the scraper's own parsing function runs once per installed
+BeautifulSoup backend (html.parser, lxml, html5lib) and its output is checked
+against html.parser. Parse-only times are reported as well, including
+selectolax when it is installed; selectolax is not a BeautifulSoup tree
+builder, so it is only measured here and never used by the scrapers.
+"""
+import dataclasses
+import sys
+import time
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from common import load_scraper
+from sample_pages import gfg_problem_question, ib_markdown_content, td_editorial_page, td_home_page, td_problem_page
+
+from scraper_common import soup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+
+class StaticPage:
+    # Stands in for a Playwright page that has already loaded `html`
+
+    def __init__(self, html: str):
+        self.html = html
+
+    def goto(self, *args, **kwargs) -> None:
+        pass
+
+    def content(self) -> str:
+        return self.html
+
+
+def measure(extract, pages):
+    start_time = time.process_time()
+    results = [extract(page) for page in pages]
+    return (time.process_time() - start_time) / len(pages), results
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    geeksforgeeks = load_scraper('2. geeksforgeeks_scraper.py')
+    interviewbit = load_scraper('4. interviewbit_scraper.py')
+    techiedelight = load_scraper('5. techiedelight_scraper.py')
+    techiedelight.LOCAL_LOG = techiedelight.BROWSER_LOG = 'BENCH'
+    techiedelight.HTTP_FIRST = False
+    url = 'https://www.techiedelight.com/?problem=problem'
+
+    workloads = [
+        ('GFG statement', [gfg_problem_question(i) for i in range(count)], geeksforgeeks.get_data_from_html),
+        ('IB sections', [ib_markdown_content(i) for i in range(count)],
+         lambda page: dataclasses.asdict(interviewbit.extract_sections(page))),
+        ('TD problem list', [td_home_page(600)] * max(1, count // 10),
+         lambda page: techiedelight.get_problem_urls(StaticPage(page))),
+        ('TD problem page', [td_problem_page(i) for i in range(count)],
+         lambda page: techiedelight.fetch_html_and_editorial_url(StaticPage(page), url)),
+        ('TD editorial', [td_editorial_page(i) for i in range(count)],
+         lambda page: techiedelight.fetch_editorial_solutions(StaticPage(page), url)),
+    ]
+    parsers = [name for name in ('html.parser', 'lxml', 'html5lib') if builder_registry.lookup(name) is not None]
+    print(f'backends: {", ".join(parsers)}{", selectolax (parse only)" if HTMLParser else ""}')
+
+    for label, pages, extract in workloads:
+        print(f'\n{label}: {len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.1f} KB on average')
+        expected = None
+        for parser in parsers:
+            soup.configure(parser)
+            parse_time, _ = measure(lambda page: BeautifulSoup(page, parser), pages)
+            elapsed_time, results = measure(extract, pages)
+            if expected is None:
+                expected = results
+            print(f'  {parser:<12} parse {parse_time * 1000:8.3f} ms, scraper {elapsed_time * 1000:8.3f} ms/page,'
+                  f' same output as html.parser: {results == expected}')
+        if HTMLParser:
+            parse_time, _ = measure(HTMLParser, pages)
+            print(f'  {"selectolax":<12} parse {parse_time * 1000:8.3f} ms')
+    soup.configure()
@@ -0,0 +1,72 @@
+"""
+Measures the on-disk HTTP cache against a latency-injecting local server that sends ETags.
+
+Usage:
+    python benchmarks/bench_http_cache.py [PAGES] [LATENCY_MS] [PAGE_KB]
+
+Runs the same crawl without the cache, into an empty cache, from a fresh cache
+(no requests) and from an expired cache (one 304 per page).
+"""
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from common import start_json_stub
+
+from scraper_common import http_cache, http_session
+
+REQUESTS = 0
+PAGES = dict()
+WORDS = ['<p>', '</p>', 'array', 'integer', 'return', 'example', 'input', 'output', 'constraints', '<code>', 'n', '10^5']
+
+
+def respond(method, path, body):
+    global REQUESTS
+    REQUESTS += 1
+    if path not in PAGES:
+        PAGES[path] = ' '.join(random.Random(path).choices(WORDS, k=PAGE_BYTES // 6))
+    return 200, {'path': path, 'html': PAGES[path]}
+
+
+def run(label, urls, ttl):
+    global REQUESTS
+    REQUESTS = 0
+    start_time = time.perf_counter()
+    for url in urls:
+        http_session.get(url, cache_ttl=ttl).json()
+    elapsed_time = time.perf_counter() - start_time
+    print(f'{label:<22} {elapsed_time:8.2f}s  {len(urls) / elapsed_time:8.1f} pages/s  {REQUESTS:5d} requests')
+    return elapsed_time
+
+
+if __name__ == '__main__':
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+    PAGE_BYTES = int(sys.argv[3] if len(sys.argv) > 3 else 200) * 1024
+
+    server = start_json_stub(respond, latency=latency, etag=True)
+    urls = [f'http://127.0.0.1:{server.server_port}/problems/problem-{index}/' for index in range(pages)]
+    cache_dir = tempfile.mkdtemp()
+    stale_cache_dir = tempfile.mkdtemp()
+    http_cache.configure(cache_dir=cache_dir)
+
+    print(f'{pages} pages of {PAGE_BYTES // 1024} KB, {latency * 1000:.0f} ms per request')
+    baseline = run('no cache', urls, 0)
+    run('cold cache', urls, 3600)
+    elapsed_time = run('fresh cache', urls, 3600)
+    print(f'{"":<22} speedup {baseline / elapsed_time:.1f}x')
+    # Fill a second cache with entries that are stale at once, so the next pass revalidates them all
+    http_cache.configure(cache_dir=stale_cache_dir)
+    for url in urls:
+        http_session.get(url, cache_ttl=0.001)
+    elapsed_time = run('revalidate (304)', urls, 3600)
+    print(f'{"":<22} speedup {baseline / elapsed_time:.1f}x')
+    stats = http_cache.get_cache().stats()
+    print(f"cache: {stats['entries']} entries, {stats['bytes'] / 1024:.0f} KB on disk, {stats['revalidated']} revalidated")
+
+    http_cache.configure(enabled=False)
+    shutil.rmtree(cache_dir)
+    shutil.rmtree(stale_cache_dir)
+    server.shutdown()
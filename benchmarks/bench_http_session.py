@@ -0,0 +1,75 @@
+"""
+Compares fresh `requests` calls with the pooled `http_session` against a local keep-alive server.
+
+Usage:
+    python benchmarks/bench_http_session.py [REQUESTS] [LATENCY_MS]
+
+LATENCY_MS delays every new TCP connection to mimic the handshake cost of a
+remote host, which is what connection reuse saves.
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper_common import http_session, rate_limit  # noqa: E402
+
+CONNECT_LATENCY = 0.0
+CONNECTIONS = 0
+CONNECTIONS_LOCK = threading.Lock()
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        global CONNECTIONS
+        with CONNECTIONS_LOCK:
+            CONNECTIONS += 1
+        time.sleep(CONNECT_LATENCY)
+        super().setup()
+
+    def do_GET(self):
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(label, get, url, count):
+    global CONNECTIONS
+    CONNECTIONS = 0
+    start_time = time.perf_counter()
+    for _ in range(count):
+        get(url).json()
+    elapsed_time = time.perf_counter() - start_time
+    print(f'{label:<22} {elapsed_time:8.3f}s  {count / elapsed_time:9.1f} req/s  {CONNECTIONS:5d} connections')
+    return elapsed_time
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    CONNECT_LATENCY = (float(sys.argv[2]) if len(sys.argv) > 2 else 5) / 1000
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/api'
+    rate_limit.RATE_LIMITS[f'127.0.0.1:{server.server_port}'] = 100000.0
+
+    print(f'{count} GET requests, {CONNECT_LATENCY * 1000:.0f} ms per new connection')
+    fresh = run('requests.get', requests.get, url, count)
+    pooled = run('http_session.get', http_session.get, url, count)
+    print(f'speedup: {fresh / pooled:.1f}x')
+
+    http_session.close_all()
+    server.shutdown()
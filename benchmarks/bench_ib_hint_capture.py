@@ -0,0 +1,71 @@
+"""
+Measures InterviewBit hint capture with fixed waits against waiting for the expected hint responses.
+
+Usage:
+    python benchmarks/bench_ib_hint_capture.py [PROBLEMS] [TIME_SCALE]
+
+Runs on the stand-in page of ib_stand_in.py, so Playwright browsers are not needed.
+The previous capture waited 2.5 s after each tab, up to 5 s for every unlock
+button and then 25 s for the responses. The current one clicks each unlock button
+once it is visible and moves on as soon as the hint response is captured. Times
+are reported in real seconds, the benchmark itself runs TIME_SCALE times faster.
+"""
+import sys
+import time
+
+from common import load_scraper
+from ib_stand_in import StandInPage, hints_meta_of
+
+
+def legacy_get_hints(interviewbit, hints_meta, slug, page, scale):
+    # The previous open_api_gateways and get_hints waits, on top of the current response parsing
+    capture = interviewbit.HintCapture(slug)
+    page.on('response', capture.handle)
+    page.goto(f'https://www.interviewbit.com/problems/{slug}', wait_until='domcontentloaded')
+    for tab, unlock in ((page.get_by_role('link', name='Hints'), 'Unlock Hint'),
+                        (page.locator('a').filter(has_text='Solution Approach'), 'Unlock Solution Approach'),
+                        (page.locator('a').filter(has_text='Complete Solution'), 'Unlock Complete Solution')):
+        try:
+            tab.click(timeout=5000 / scale)
+        except Exception:
+            pass
+        page.wait_for_timeout(2500 / scale)
+        try:
+            page.get_by_text(unlock).click(timeout=5000 / scale)
+        except Exception:
+            pass
+    page.wait_for_timeout(25000 / scale)
+    page.remove_listener('response', capture.handle)
+    return {title: capture.has(hint['id']) for hint in hints_meta for title in [hint['title']]}
+
+
+def current_get_hints(interviewbit, hints_meta, slug, page, scale):
+    hints = interviewbit.get_hints(hints_meta, slug, page)
+    return {title: hints.get(key) is not None for title, key in (('Hint', 'hint'), ('Solution Approach', 'solution_approach'), ('Complete Solution', 'solutions'))}
+
+
+def run(label, get_hints, interviewbit, problems, scale):
+    page = StandInPage(scale)
+    durations, captured = [], []
+    for index in range(problems):
+        start_time = time.perf_counter()
+        captured.append(get_hints(interviewbit, hints_meta_of(index), f'problem-{index}', page, scale))
+        durations.append((time.perf_counter() - start_time) * scale)
+    unlocked_before = [duration for index, duration in enumerate(durations) if index % 3 == 0]
+    locked = [duration for index, duration in enumerate(durations) if index % 3 != 0]
+    print(f'{label:<24} {sum(durations) / problems:6.1f} s/problem  (locked {sum(locked) / len(locked):5.1f} s,'
+          f' unlocked before {sum(unlocked_before) / len(unlocked_before):5.1f} s)')
+    return captured
+
+
+if __name__ == '__main__':
+    problems = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    scale = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+    interviewbit = load_scraper('4. interviewbit_scraper.py')
+    interviewbit.HINT_DEADLINE = 30 / scale
+    interviewbit.HINT_CLICK_TIMEOUT = 5 / scale
+    interviewbit.HINT_POLL_INTERVAL = 0.25 / scale
+    print(f'{problems} problems, run {scale:g}x faster than real time')
+    expected = run('fixed waits (previous)', legacy_get_hints, interviewbit, problems, scale)
+    results = run('expected responses', current_get_hints, interviewbit, problems, scale)
+    print(f'{"":<24} every hint captured by both: {all(all(result.values()) for result in expected + results)}')
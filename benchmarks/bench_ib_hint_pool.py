@@ -0,0 +1,55 @@
+"""
+Measures InterviewBit hint capture with one browser context against a pool of contexts.
+
+Usage:
+    python benchmarks/bench_ib_hint_pool.py [PROBLEMS] [CONTEXTS] [TIME_SCALE]
+
+Playwright browsers are not needed: the pool opens the stand-in pages of
+ib_stand_in.py, and the run is TIME_SCALE times faster than real time. Each
+problem's capture must only see its own responses, so the results are compared
+with the single-context run.
+"""
+import sys
+import time
+
+from common import load_scraper
+from ib_stand_in import StandInPage, hints_meta_of
+
+from scraper_common.browser import ContextPool
+
+
+class StandInPool(ContextPool):
+    opened = 0
+
+    def _open(self):
+        StandInPool.opened += 1
+        return StandInPage(SCALE), lambda: None
+
+
+def run(interviewbit, problems, contexts):
+    pool = StandInPool({'cookies': [], 'origins': []}, size=contexts)
+    start_time = time.perf_counter()
+    futures = [
+        pool.submit(lambda page, index=index: interviewbit.get_hints(hints_meta_of(index), f'problem-{index}', page))
+        for index in range(problems)
+    ]
+    results = [future.result() for future in futures]
+    elapsed_time = (time.perf_counter() - start_time) * SCALE
+    pool.close()
+    print(f'{contexts} context(s) {elapsed_time / problems:6.2f} s/problem  ({elapsed_time:.1f} s total)')
+    return results
+
+
+if __name__ == '__main__':
+    problems = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    contexts = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    SCALE = float(sys.argv[3]) if len(sys.argv) > 3 else 20
+    interviewbit = load_scraper('4. interviewbit_scraper.py')
+    interviewbit.HINT_DEADLINE = 30 / SCALE
+    interviewbit.HINT_CLICK_TIMEOUT = 5 / SCALE
+    interviewbit.HINT_POLL_INTERVAL = 0.25 / SCALE
+    print(f'{problems} problems, run {SCALE:g}x faster than real time')
+    expected = run(interviewbit, problems, 1)
+    results = run(interviewbit, problems, contexts)
+    complete = all(None not in (result['hint'], result['solution_approach'], result['solutions']) for result in results)
+    print(f'every hint captured: {complete}, same hints as one context: {results == expected}, contexts opened: {StandInPool.opened}')
@@ -0,0 +1,39 @@
+"""
+Compares the jsbeautifier + regex extraction of InterviewBit problemsData with the direct JSON slice.
+
+Usage:
+    python benchmarks/bench_ib_problem_data.py [PAGES_DIR | PAGES]
+
+PAGES_DIR is a directory of saved problem pages (*.html); without it PAGES
+synthetic pages are generated. Reports CPU time per problem.
+"""
+import os
+import sys
+import time
+
+from common import load_scraper
+from sample_pages import ib_problem_page, load_pages
+
+from scraper_common.script_json import extract_assigned_json
+
+
+def measure(label, extract, pages):
+    start_time = time.process_time()
+    results = [extract(page) for page in pages]
+    cpu_time = (time.process_time() - start_time) / len(pages)
+    print(f'{label:<28} {cpu_time * 1000:9.2f} ms/problem')
+    return cpu_time, results
+
+
+if __name__ == '__main__':
+    argument = sys.argv[1] if len(sys.argv) > 1 else '5'
+    pages = load_pages(argument) if os.path.isdir(argument) else [ib_problem_page(index) for index in range(int(argument))]
+    pages = [page.decode('utf-8') for page in pages]
+    average_size = sum(map(len, pages)) / len(pages)
+    print(f'{len(pages)} pages, {average_size / 1024:.0f} KB on average')
+
+    interviewbit = load_scraper('4. interviewbit_scraper.py')
+    baseline, expected = measure('soup + jsbeautifier + regex', interviewbit.get_beautified_problem_data, pages)
+    elapsed_time, results = measure(
+        'JSON slice', lambda page: extract_assigned_json(page, 'window.__INTERVIEWBIT__.problemsData'), pages)
+    print(f'{"":<28} speedup {baseline / elapsed_time:.0f}x, identical output: {results == expected}')
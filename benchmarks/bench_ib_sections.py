@@ -0,0 +1,85 @@
+"""
+Compares the seven-lookup InterviewBit section parsing with the single-pass extract_sections.
+
+Usage:
+    python benchmarks/bench_ib_sections.py [PAGES_DIR | PAGES]
+
+PAGES_DIR is a directory of saved `meta.markdown_content` fragments (*.html);
+without it PAGES synthetic fragments are generated. The single pass runs on
+every installed BeautifulSoup backend and must match the previous output.
+"""
+import dataclasses
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from common import load_scraper
+from sample_pages import ib_markdown_content, load_pages
+
+from scraper_common import soup
+
+
+def legacy_examples(html_soup, div_id, skip_empty):
+    try:
+        div_ele = html_soup.find('div', id=div_id)
+        p_tags = div_ele.find_all('p')
+        if skip_empty:
+            p_tags = [p for p in p_tags if p.get_text().strip()]
+        examples = dict()
+        for tag in p_tags:
+            key = tag.get_text().strip()
+            pre_tag = tag.find_next_sibling('pre')
+            value = pre_tag.get_text().strip()
+            examples[key] = value
+        return examples
+    except Exception:
+        return None
+
+
+def legacy_text(html_soup, div_id, lines=False):
+    try:
+        text = html_soup.find('div', id=div_id).get_text().strip()
+        return text.split("\n") if lines else text
+    except Exception:
+        return None
+
+
+def legacy(html):
+    # The previous main-loop parsing: one find per section, then find_all + find_next_sibling per example
+    html_soup = BeautifulSoup(html, 'html.parser')
+    return {
+        'description': legacy_text(html_soup, 'problem_description_markdown_content_value'),
+        'constraints': legacy_text(html_soup, 'problem_constraints_markdown_content_value', lines=True),
+        'input_format': legacy_text(html_soup, 'input_format_markdown_content_value'),
+        'output_format': legacy_text(html_soup, 'output_format_markdown_content_value'),
+        'example_input': legacy_examples(html_soup, 'example_input_markdown_content_value', False),
+        'example_output': legacy_examples(html_soup, 'example_output_markdown_content_value', True),
+        'example_explanation': legacy_examples(html_soup, 'example_explanation_markdown_content_value', True),
+    }
+
+
+def measure(label, extract, pages):
+    start_time = time.process_time()
+    results = [extract(page) for page in pages]
+    cpu_time = (time.process_time() - start_time) / len(pages)
+    print(f'{label:<32} {cpu_time * 1000:8.3f} ms/problem')
+    return cpu_time, results
+
+
+if __name__ == '__main__':
+    argument = sys.argv[1] if len(sys.argv) > 1 else '200'
+    if os.path.isdir(argument):
+        pages = [page.decode('utf-8') for page in load_pages(argument)]
+    else:
+        pages = [ib_markdown_content(index) for index in range(int(argument))]
+    print(f'{len(pages)} problems, {sum(map(len, pages)) / len(pages) / 1024:.1f} KB of markdown content on average')
+
+    interviewbit = load_scraper('4. interviewbit_scraper.py')
+    baseline, expected = measure('seven lookups (html.parser)', legacy, pages)
+    for parser in soup.available_parsers():
+        soup.configure(parser)
+        elapsed_time, results = measure(
+            f'single pass ({parser})', lambda page: dataclasses.asdict(interviewbit.extract_sections(page)), pages)
+        print(f'{"":<32} speedup {baseline / elapsed_time:.1f}x, identical output: {results == expected}')
@@ -0,0 +1,96 @@
+"""
+Measures LeetCode question-content throughput against a latency-injecting local GraphQL stub.
+
+Usage:
+    python benchmarks/bench_leetcode_fetch.py [QUESTIONS] [LATENCY_MS]
+"""
+import json
+import sys
+import time
+
+from common import load_scraper, start_json_stub
+
+from scraper_common import http_cache, http_session
+from scraper_common.fetch_engine import fetch_in_order
+
+
+REQUESTS = 0
+
+
+def respond(method, path, body):
+    global REQUESTS
+    REQUESTS += 1
+    query = json.loads(body)
+    if 'questionList' in query.get('query'):
+        skip = query['variables']['skip']
+        limit = query['variables']['limit']
+        questions = [
+            {'title': f'Question {index}', 'titleSlug': f'question-{index}', 'difficulty': 'Easy'}
+            for index in range(skip, min(skip + limit, TOTAL))
+        ]
+        return 200, {'data': {'problemsetQuestionList': {'total': TOTAL, 'questions': questions}}}
+    if query.get('operationName') == 'consolePanelConfigBatch':
+        return 200, {'data': {
+            f'q{alias[1:]}': question_content(slug) for alias, slug in query['variables'].items()
+        }}
+    return 200, {'data': {'question': question_content(query['variables']['titleSlug'])}}
+
+
+def question_content(slug):
+    return {'content': f'<p>{slug}</p>', 'hints': [], 'codeSnippets': []}
+
+
+def run(label, fetch_all):
+    global REQUESTS
+    REQUESTS = 0
+    start_time = time.perf_counter()
+    count = fetch_all()
+    elapsed_time = time.perf_counter() - start_time
+    print(f'{label:<22} {elapsed_time:8.2f}s  {count / elapsed_time:8.1f} questions/s  {REQUESTS:5d} requests')
+    return elapsed_time
+
+
+if __name__ == '__main__':
+    TOTAL = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+
+    # Every stage must reach the network, not the contents cached by the previous one
+    http_cache.configure(enabled=False)
+    leetcode = load_scraper('1. leetcode_scraper.py')
+    server = start_json_stub(respond, latency=latency)
+    leetcode.graphql_url = f'http://127.0.0.1:{server.server_port}/graphql/'
+
+    def serial():
+        questions = list(leetcode.iter_questions())
+        return len([leetcode.get_question_content(question['titleSlug']) for question in questions])
+
+    def concurrent(concurrency):
+        questions = leetcode.iter_questions()
+        return sum(1 for _ in fetch_in_order(questions, leetcode.fetch_question_content, concurrency=concurrency))
+
+    def batched(concurrency, batch_size):
+        leetcode.detail_concurrency = concurrency
+        leetcode.batch_size = batch_size
+        questions = leetcode.iter_questions()
+        return sum(1 for _, content in leetcode.iter_question_contents(questions) if content)
+
+    def list_serial():
+        questions = []
+        for skip in range(0, TOTAL, 50):
+            questions.extend(leetcode.get_questions_page(skip, 50).get('questions'))
+        return len(questions)
+
+    print(f'{TOTAL} questions, {latency * 1000:.0f} ms per request')
+    list_baseline = run('list pages serial', list_serial)
+    elapsed_time = run('list pages fan-out', lambda: sum(1 for _ in leetcode.iter_questions()))
+    print(f'{"":<22} speedup {list_baseline / elapsed_time:.1f}x')
+    baseline = run('serial', serial)
+    for concurrency in (8, 16, 32):
+        http_session.configure(pool_size=concurrency + 1)
+        elapsed_time = run(f'concurrency={concurrency}', lambda: concurrent(concurrency))
+        print(f'{"":<22} speedup {baseline / elapsed_time:.1f}x')
+    for batch_size in (10, 25):
+        http_session.configure(pool_size=5)
+        elapsed_time = run(f'batch={batch_size} x 4 workers', lambda: batched(4, batch_size))
+        print(f'{"":<22} speedup {baseline / elapsed_time:.1f}x')
+    server.shutdown()
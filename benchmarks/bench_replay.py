@@ -0,0 +1,77 @@
+"""
+Replays a recorded scraper run offline and measures its end-to-end throughput.
+
+Record a run once against the live sites:
+    SCRAPER_RECORD=leetcode.sqlite3 python "1. leetcode_scraper.py"
+
+Then replay it as often as needed, with no network:
+    python benchmarks/bench_replay.py "1. leetcode_scraper.py" leetcode.sqlite3 [LATENCY_MS] [JITTER_MS]
+
+The script runs in a scratch directory (so its log, manifest and cache files stay
+out of the repository) against an in-memory S3 client, and every HTTP request and
+browser request is answered by the replay stand-in server.
+"""
+import io
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+
+import boto3
+
+
+class MemoryS3:
+    """
+    The subset of the S3 client used by the scrapers, kept in memory.
+    """
+
+    def __init__(self):
+        self.objects = dict()
+
+    def list_objects_v2(self, Bucket, Prefix='', ContinuationToken=None, **kwargs):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        return {'Contents': [{'Key': key} for key in keys], 'IsTruncated': False}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body.encode() if isinstance(Body, str) else Body
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, **kwargs):
+        self.objects[Key] = Fileobj.read()
+
+    def get_object(self, Bucket, Key, **kwargs):
+        return {'Body': io.BytesIO(self.objects[Key])}
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        sys.exit(__doc__)
+    script = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), sys.argv[1]))
+    archive_path = os.path.abspath(sys.argv[2])
+    latency = (float(sys.argv[3]) if len(sys.argv) > 3 else 0) / 1000
+    jitter = (float(sys.argv[4]) if len(sys.argv) > 4 else 0) / 1000
+
+    # Files the scrapers create relative to the working directory go to a scratch directory
+    work_dir = tempfile.mkdtemp()
+    os.chdir(work_dir)
+    from common import REPO_DIR  # noqa: E402,F401 -- puts the repository on sys.path
+    from scraper_common import replay  # noqa: E402
+
+    replay.configure('replay', archive_path, latency=latency, jitter=jitter)
+    s3 = MemoryS3()
+    boto3.client = lambda *args, **kwargs: s3
+    sys.argv = [script]
+
+    start_time = time.perf_counter()
+    try:
+        runpy.run_path(script, run_name='__main__')
+    finally:
+        elapsed_time = time.perf_counter() - start_time
+        stats = replay.stats()
+        print(f'{os.path.basename(script)}: {elapsed_time:.2f}s, {stats.get("served", 0)} responses served, '
+              f'{stats.get("missed", 0)} not recorded, {len(s3.objects)} objects uploaded '
+              f'({latency * 1000:.0f} ms latency, {jitter * 1000:.0f} ms jitter)')
+        replay.configure(None)
+        os.chdir(REPO_DIR)
+        shutil.rmtree(work_dir, ignore_errors=True)
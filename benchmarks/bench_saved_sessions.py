@@ -0,0 +1,91 @@
+"""
+Measures the startup of the GeeksforGeeks and CodeChef scrapers with a saved login.
+
+Usage:
+    python benchmarks/bench_saved_sessions.py [LATENCY_MS]
+
+Sessions are saved to a temporary directory. CodeChef checks its saved cookie and
+CSRF-token with one submissions request to a local server, which answers
+"apierror" for any other token; the browser login it replaces waits 10 seconds
+after signing in. GeeksforGeeks reads the practice API cookies from the saved
+storage state, so its browser is never launched. Expired and rejected sessions
+must be refused.
+"""
+import shutil
+import sys
+import tempfile
+import time
+import types
+
+from common import load_scraper, start_json_stub
+
+from scraper_common import http_cache, http_session
+from scraper_common.browser import LazyPage
+from scraper_common.session_store import SessionStore
+
+VALID_TOKEN = 'token-1'
+STATE = {'requests': 0}
+
+
+def respond(method, path, body):
+    STATE['requests'] += 1
+    return 200, {'status': 'OK', 'data': [{'id': 1, 'tooltip': 'accepted'}]}
+
+
+def storage_state(expires):
+    return {'cookies': [{'name': 'authtoken', 'value': 'secret', 'expires': expires}, {'name': 'gfg_nluid', 'value': 'id', 'expires': -1}],
+            'origins': []}
+
+
+def codechef_startup(codechef):
+    STATE['requests'] = 0
+    codechef.HEADERS = {'cookie': None, 'x-csrf-token': None}
+    start_time = time.perf_counter()
+    reused = codechef.load_saved_headers()
+    return reused, (time.perf_counter() - start_time) * 1000, STATE['requests']
+
+
+if __name__ == '__main__':
+    latency = (float(sys.argv[1]) if len(sys.argv) > 1 else 80) / 1000
+    http_cache.configure(enabled=False)
+    server = start_json_stub(respond, latency=latency)
+    base = f'http://127.0.0.1:{server.server_port}'
+    sessions_dir = tempfile.mkdtemp()
+
+    codechef = load_scraper('3. codechef_scraper.py')
+    codechef.SESSION_CHECK_PROBLEM = 'FOODCOST'
+
+    def submissions(method, url, headers=None, **kwargs):
+        # The stand-in API rejects any CSRF-token but the valid one
+        response = http_session.request(method, url.replace('https://www.codechef.com', base), headers=headers, **kwargs)
+        if (headers or {}).get('x-csrf-token') != VALID_TOKEN:
+            response._content = b'{"status": "apierror"}'
+        return response
+    codechef.http_session = types.SimpleNamespace(request=submissions)
+
+    print(f'{latency * 1000:.0f} ms per request')
+    codechef.SESSION_STORE = SessionStore('codechef', sessions_dir)
+    codechef.SESSION_STORE.save({'cookies': [], 'origins': []}, headers={'cookie': 'c', 'x-csrf-token': VALID_TOKEN})
+    reused, elapsed, requests = codechef_startup(codechef)
+    print(f'CodeChef saved headers      reused: {reused!s:<5} {elapsed:7.1f} ms  {requests} request (browser login: 10 s wait alone)')
+    codechef.SESSION_STORE.save({'cookies': [], 'origins': []}, headers={'cookie': 'c', 'x-csrf-token': 'stale'})
+    reused, elapsed, requests = codechef_startup(codechef)
+    print(f'CodeChef rejected headers   reused: {reused!s:<5} {elapsed:7.1f} ms  {requests} request, file discarded: {codechef.SESSION_STORE.load() is None}')
+
+    geeksforgeeks = load_scraper('2. geeksforgeeks_scraper.py')
+    geeksforgeeks.SUBMISSION_COOKY_NEEDED = {'authtoken', 'gfg_nluid'}
+    store = geeksforgeeks.SESSION_STORE = SessionStore('geeksforgeeks', sessions_dir)
+    store.save(storage_state(time.time() + 3600))
+    start_time = time.perf_counter()
+    saved_session = store.load(required_cookies={'authtoken'})
+    page = LazyPage(None)
+    cookies = geeksforgeeks.harvest_cookies(page, False, saved_session.get('storage_state'))
+    elapsed = (time.perf_counter() - start_time) * 1000
+    print(f'GeeksforGeeks saved cookies {sorted(cookies)}  {elapsed:7.1f} ms  browser launched: {page.started}')
+
+    store.save(storage_state(time.time() - 60))
+    print(f'GeeksforGeeks expired authtoken refused: {store.load(required_cookies={"authtoken"}) is None}')
+    store.save(storage_state(time.time() + 3600))
+    store.max_age = -1
+    print(f'Session older than max_age refused:      {store.load() is None}')
+    shutil.rmtree(sessions_dir, ignore_errors=True)
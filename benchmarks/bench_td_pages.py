@@ -0,0 +1,99 @@
+"""
+Measures the Techie Delight page fetches with the HTTP-first path and the browser.
+
+Usage:
+    python benchmarks/bench_td_pages.py [PROBLEMS] [--browser]
+
+The home page, PROBLEMS problem pages and their editorials are served locally.
+The editorials are the server HTML, whose tab headings only have the tabtitle
+class; every problem must end up with editorial solutions. The HTTP-first run
+must never touch the browser otherwise. Every fourth editorial is
+served without its code blocks to exercise the fallback, which a stand-in page
+answers. With --browser the same pages are also loaded through headless
+Chromium, as every page was before, for comparison.
+"""
+import sys
+import time
+import types
+
+from common import load_scraper, start_static_stub
+from sample_pages import td_editorial_page, td_home_page, td_problem_page
+
+from scraper_common import http_cache, http_session
+
+MAIN_URL = 'https://www.techiedelight.com'
+
+
+class CountingPage:
+    # Answers browser fallbacks from the served pages and counts them
+    def __init__(self, pages):
+        self.pages = pages
+        self.visits = 0
+        self.path = None
+
+    def goto(self, url, **kwargs):
+        self.visits += 1
+        self.path = url.replace(MAIN_URL, '') or '/'
+
+    def content(self):
+        return td_editorial_page(int(self.path.strip('/').split('-')[1])) if self.path.endswith('/') else self.pages[self.path].decode()
+
+
+class RewritingPage:
+    # Sends a real browser page to the local server instead of the site
+    def __init__(self, page, base):
+        self.page, self.base = page, base
+
+    def goto(self, url, **kwargs):
+        return self.page.goto(url.replace(MAIN_URL, self.base), **kwargs)
+
+    def content(self):
+        return self.page.content()
+
+
+def run(techiedelight, page, problems):
+    start_time = time.perf_counter()
+    problem_urls = techiedelight.get_problem_urls(page)[:problems]
+    empty = 0
+    for problem_url in problem_urls:
+        editorial_url, _ = techiedelight.fetch_html_and_editorial_url(page, problem_url)
+        empty += not techiedelight.fetch_editorial_solutions(page, editorial_url)
+    return (time.perf_counter() - start_time) / len(problem_urls), empty
+
+
+if __name__ == '__main__':
+    problems = int(next((argument for argument in sys.argv[1:] if argument.isdigit()), 40))
+    http_cache.configure(enabled=False)
+    pages = {'/': td_home_page(problems).encode()}
+    for index in range(problems):
+        pages[f'/?problem=problem-{index}'] = td_problem_page(index).encode()
+        editorial = td_editorial_page(index)
+        if index % 4 == 3:
+            editorial = editorial.replace('c-pre', 'c-pending')
+        pages[f'/problem-{index}/'] = editorial.encode()
+    server = start_static_stub(pages, 'text/html; charset=utf-8')
+    base = f'http://127.0.0.1:{server.server_port}'
+
+    techiedelight = load_scraper('5. techiedelight_scraper.py')
+    techiedelight.API_LOG = techiedelight.BROWSER_LOG = techiedelight.LOCAL_LOG = 'BENCH'
+    techiedelight.PAGE_HEADERS = dict()
+    techiedelight.http_session = types.SimpleNamespace(
+        request=lambda method, url, **kwargs: http_session.request(method, url.replace(MAIN_URL, base), **kwargs)
+    )
+
+    techiedelight.HTTP_FIRST = True
+    page = CountingPage(pages)
+    elapsed_time, empty = run(techiedelight, page, problems)
+    print(f'{problems} problems')
+    print(f'http first   {elapsed_time * 1000:8.1f} ms/problem, browser fallbacks: {page.visits}, empty editorials: {empty}')
+
+    if '--browser' in sys.argv:
+        from playwright.sync_api import sync_playwright
+        techiedelight.HTTP_FIRST = False
+        with sync_playwright() as playwright:
+            start_time = time.perf_counter()
+            browser = playwright.chromium.launch(headless=True)
+            launch_time = time.perf_counter() - start_time
+            elapsed_time, empty = run(techiedelight, RewritingPage(browser.new_context().new_page(), base), problems)
+            print(f'browser      {elapsed_time * 1000:8.1f} ms/problem, plus {launch_time * 1000:.0f} ms to launch')
+            browser.close()
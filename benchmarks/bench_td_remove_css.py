@@ -0,0 +1,82 @@
+"""
+Compares the previous tree-based Techie Delight remove_css with the streaming style stripper.
+
+Usage:
+    python benchmarks/bench_td_remove_css.py [PAGES_DIR | PAGES]
+
+PAGES_DIR is a directory of saved problem pages (*.html); without it PAGES
+synthetic pages plus a set of edge cases are used. The stripper keeps the
+original markup while the previous version re-serialized the tree, so outputs
+are compared after both go through the same BeautifulSoup round trip.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from common import load_scraper
+from sample_pages import load_pages, td_problem_page
+
+EDGE_CASES = [
+    '',
+    '<p style="color:red">plain</p>',
+    '<STYLE type="text/css">p > a { color: "<b>" }</STYLE><P STYLE="x" Class="a">Upper</P>',
+    '<div data-x=\'a "quoted" &amp; value\' style=\'margin:0\' hidden>attrs</div>',
+    '<br style="clear:both"/><img src="a.png" style="width:1px" alt="&lt;img&gt;"><input disabled style="">',
+    '<script>var s = "<style>not a tag</style>"; var t = \'<p style="x">\';</script><p>after</p>',
+    '<!DOCTYPE html><!-- <style>commented</style> --><p>A &amp; B &#169; &copy &nbsp;</p>',
+    '<svg><style>circle { fill: red }</style><circle style="stroke:blue" r="1"/></svg>',
+    '<style>unterminated <p style="x">lost',
+    '<p>text with style= inside and <b>bold</b></p><style></style><style/>tail',
+]
+
+
+def legacy(html_content: str) -> str:
+    # The previous remove_css, unchanged
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    for style_tag in soup.find_all('style'):
+        style_tag.decompose()
+
+    for tag in soup.find_all():
+        del tag['style']
+
+    return str(soup)
+
+
+def measure(label, sanitize, pages):
+    start_time = time.process_time()
+    results = [sanitize(page) for page in pages]
+    cpu_time = (time.process_time() - start_time) / len(pages)
+    tracemalloc.start()
+    for page in pages:
+        sanitize(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<20} {cpu_time * 1000:8.3f} ms/page, peak memory {peak / 2 ** 20:6.1f} MB')
+    return cpu_time, results
+
+
+if __name__ == '__main__':
+    argument = sys.argv[1] if len(sys.argv) > 1 else '100'
+    if os.path.isdir(argument):
+        pages = [page.decode('utf-8') for page in load_pages(argument)]
+    else:
+        pages = [td_problem_page(index) for index in range(int(argument))] + EDGE_CASES
+    print(f'{len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.1f} KB on average')
+
+    techiedelight = load_scraper('5. techiedelight_scraper.py')
+    baseline, expected = measure('tree (html.parser)', legacy, pages)
+    elapsed_time, results = measure('streaming', techiedelight.remove_css, pages)
+    mismatches = [
+        index for index, (result, previous) in enumerate(zip(results, expected))
+        if str(BeautifulSoup(result, 'html.parser')) != previous
+    ]
+    leftovers = [
+        index for index, result in enumerate(results)
+        if BeautifulSoup(result, 'html.parser').find(lambda tag: tag.name == 'style' or tag.has_attr('style'))
+    ]
+    print(f'{"":<20} speedup {baseline / elapsed_time:.1f}x, mismatching pages: {mismatches or "none"},'
+          f' pages with styles left: {leftovers or "none"}')
@@ -0,0 +1,78 @@
+"""
+Compares peak memory of the buffered and the streaming Techie Delight testcase paths.
+
+Usage:
+    python benchmarks/bench_td_testcase_stream.py [LINES ...]
+
+For every size a synthetic testcase file of LINES lines is served locally. The
+buffered path downloads it, cleans it and serializes the problem JSON as
+upload_json_to_s3 does; the streaming path hands gzipped files to the background
+uploader, which sends them to an S3 stand-in that reads them in 8 MB parts like
+boto3's managed transfer. Peak
+memory of the buffered path grows with the file while the streaming one stays
+under the spool size plus one part.
+"""
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+from common import load_scraper, start_static_stub
+from sample_pages import td_testcases
+
+from scraper_common import http_cache, http_session
+from scraper_common.s3_manifest import S3Manifest
+from scraper_common.s3_uploader import S3Uploader
+
+
+class DrainS3:
+    # Reads uploads in chunks like boto3's managed transfer and keeps only the last object
+    def __init__(self):
+        self.objects = dict()
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, **kwargs):
+        sizes = iter(lambda: len(Fileobj.read(8 * 2 ** 20)), 0)
+        self.objects[Key] = sum(sizes)
+
+
+def measure(label, run):
+    start_time = time.perf_counter()
+    result = run()
+    elapsed_time = time.perf_counter() - start_time
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'  {label:<10} {elapsed_time * 1000:8.0f} ms, peak memory {peak / 2 ** 20:7.1f} MB')
+    return result
+
+
+if __name__ == '__main__':
+    sizes = [int(argument) for argument in sys.argv[1:]] or [10000, 50000, 200000]
+    http_cache.configure(enabled=False)
+    techiedelight = load_scraper('5. techiedelight_scraper.py')
+    techiedelight.API_LOG = techiedelight.CLOUD_LOG = 'BENCH'
+    techiedelight.BUCKET, techiedelight.TESTCASE_SPOOL_BYTES = 'bench', 2 ** 20
+    techiedelight.S3 = s3 = DrainS3()
+    techiedelight.MANIFEST = S3Manifest('bench', os.path.join(tempfile.mkdtemp(), 'manifest.sqlite3'))
+    techiedelight.UPLOADER = uploader = S3Uploader(techiedelight.upload_json_to_s3, workers=2)
+
+    for lines in sizes:
+        content = td_testcases(lines).encode()
+        server = start_static_stub({'/practice/template/bench/bench': content})
+        base = f'http://127.0.0.1:{server.server_port}'
+        techiedelight.http_session = types.SimpleNamespace(
+            request=lambda method, url, **kwargs: http_session.request(
+                method, url.replace('https://www.techiedelight.com', base), **kwargs)
+        )
+        print(f'{lines} lines, {len(content) / 2 ** 20:.1f} MB')
+        buffered = measure('buffered', lambda: len(json.dumps({'testcases': techiedelight.fetch_testcases('bench')}, indent=4)))
+        # Waits for the uploads, so their memory is measured too
+        streamed = measure('streaming', lambda: (techiedelight.upload_testcases('bench', 'problems'), uploader.flush())[0])
+        print(f'  {streamed["count"]} testcases, {s3.objects[streamed["cleaned_s3_key"]] / 2 ** 20:.1f} MB of gzipped JSON lines'
+              f' (raw {s3.objects[streamed["dirty_s3_key"]] / 2 ** 20:.1f} MB)')
+        server.shutdown()
@@ -0,0 +1,118 @@
+"""
+Compares the previous eval-based Techie Delight testcase cleaning with the testcase field parser.
+
+Usage:
+    python benchmarks/bench_td_testcases.py [LINES]
+
+A synthetic testcase file of LINES lines is parsed, plus a set of edge cases.
+Differences from the previous output are listed; they are expected only where
+it evaluated strings containing Y or N as Python, read digits with underscores
+as integers or kept blank lines as empty testcases.
+"""
+import sys
+import time
+
+from common import load_scraper
+from sample_pages import td_testcases
+
+EDGE_CASES = [
+    'Y | N',
+    'y | n',
+    'yes | Sunday # no',
+    'None | True',
+    '1,2,3 | 4,x # 5',
+    ' +7 | -0 # 1_000',
+    'a, b | 3.5',
+    '42',
+    '1 | 2\n\n3 | 4\n',
+    '1 | 2\r\n3 | 4\r\n',
+]
+
+
+def legacy_clean(dirty_x):
+    # The previous custom_clean, unchanged
+    if ',' in dirty_x:
+        try:
+            return list(map(int, dirty_x.split(',')))
+        except:  # noqa: E722
+            return dirty_x.split(',')
+
+    elif 'Y' in dirty_x.upper():
+        x = dirty_x.replace('Y', 'True')
+        x = x.replace('y', 'true')
+        try:
+            return eval(x)
+        except:  # noqa: E722
+            return dirty_x
+
+    elif 'N' in dirty_x.upper():
+        x = dirty_x.replace('N', 'False')
+        x = x.replace('n', 'False')
+        try:
+            x = eval(x)
+            return x
+        except:  # noqa: E722
+            return dirty_x
+
+    else:
+        try:
+            return int(dirty_x)
+        except:  # noqa: E722
+            return dirty_x
+
+
+def legacy(dirty_content):
+    # The previous clean_testcases, unchanged
+    dirty_testcases_list = dirty_content.split('\n')
+    cleaned_testcases = list()
+    for dirty_TC in dirty_testcases_list:
+        dirty_TC = dirty_TC.split('|')
+        dirty_TC = list(map(str.strip, dirty_TC))
+        inputs, outputs = dirty_TC[:-1], dirty_TC[-1]
+        inputs = list(map(legacy_clean, inputs))
+        if type(inputs) == list:
+            inputs = inputs[0] if len(inputs) == 1 else inputs
+        if '#' in outputs:
+            outputs = outputs.split('#')
+        if type(outputs) == list:
+            outputs = list(map(lambda x: x.strip(), outputs))
+        else:
+            outputs = outputs.strip()
+        if type(outputs) == list:
+            outputs = list(map(legacy_clean, outputs))
+        else:
+            outputs = legacy_clean(outputs)
+
+        if type(outputs) == list:
+            outputs = outputs[0] if len(outputs) == 1 else outputs
+        cleaned_testcases.append({
+            'input': inputs,
+            'accepted_output(s)': outputs
+        })
+    return cleaned_testcases
+
+
+def measure(label, clean, content):
+    start_time = time.process_time()
+    result = clean(content)
+    cpu_time = time.process_time() - start_time
+    print(f'{label:<16} {cpu_time * 1000:9.1f} ms, {len(result)} testcases')
+    return cpu_time, result
+
+
+if __name__ == '__main__':
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    content = td_testcases(lines)
+    print(f'{lines} lines, {len(content) / 2 ** 20:.1f} MB')
+
+    techiedelight = load_scraper('5. techiedelight_scraper.py')
+    baseline, expected = measure('eval', legacy, content)
+    elapsed_time, result = measure('field parser', techiedelight.clean_testcases, content)
+    differences = sum(a != b for a, b in zip(result, expected))
+    print(f'{"":<16} speedup {baseline / elapsed_time:.1f}x, differing testcases: {differences}'
+          f' (+{len(expected) - len(result)} blank lines dropped)')
+
+    print('\nedge cases:')
+    for case in EDGE_CASES:
+        before, after = legacy(case), techiedelight.clean_testcases(case)
+        print(f'  {case!r:<28} {"same" if before == after else f"{before} -> {after}"}')
@@ -0,0 +1,110 @@
+"""
+Measures the per-problem code template phase of the Techie Delight and InterviewBit scrapers.
+
+Usage:
+    python benchmarks/bench_templates.py [PROBLEMS] [LATENCY_MS]
+
+Templates are served by a latency-injecting local server that sends ETags. Each
+scraper is run with the previous one-request-after-another loop, then with the
+concurrent fetch into an empty cache, from a fresh cache (no requests) and from
+an expired cache (one conditional GET answered 304 per template).
+"""
+import shutil
+import sys
+import tempfile
+import time
+import types
+
+from common import load_scraper, start_json_stub
+
+from scraper_common import http_cache, http_session
+
+REQUESTS = 0
+IB_LANGUAGES = {str(language_id): name for language_id, name in enumerate(['C', 'C++', 'Java', 'Python', 'Python3', 'JavaScript', 'Go'])}
+
+
+def respond(method, path, body):
+    global REQUESTS
+    REQUESTS += 1
+    return 200, {'content': f'// template for {path}\n' * 40}
+
+
+def rewrite(module, base):
+    # Sends the scraper's requests to the local server instead of the site
+    def local(url):
+        return url.replace('https://www.techiedelight.com', base).replace('https://www.interviewbit.com', base)
+    module.http_session = types.SimpleNamespace(
+        request=lambda method, url, **kwargs: http_session.request(method, local(url), **kwargs),
+        get=lambda url, **kwargs: http_session.get(local(url), **kwargs),
+    )
+
+
+def legacy_td(techiedelight, slug):
+    # The previous fetch_code_snippet: three requests one after another
+    return {name: techiedelight.get_code(slug, language) for language, name in (('cpp', 'cpp'), ('py', 'python'), ('java', 'java'))}
+
+
+def legacy_ib(interviewbit, slug):
+    # The previous get_code_snippets loop
+    return {
+        IB_LANGUAGES[language_id]: interviewbit.http_session.get(
+            f"https://www.interviewbit.com/v2/problems/{slug}/codes/?programming_language_id={language_id}").json().get('content')
+        for language_id in IB_LANGUAGES
+    }
+
+
+def revalidations():
+    return http_cache.get_cache().stats()['revalidated'] if http_cache.ENABLED else 0
+
+
+def run(label, fetch, slugs):
+    global REQUESTS
+    REQUESTS = 0
+    revalidated = revalidations()
+    start_time = time.perf_counter()
+    results = [fetch(slug) for slug in slugs]
+    elapsed_time = (time.perf_counter() - start_time) / len(slugs)
+    print(f'  {label:<26} {elapsed_time * 1000:8.1f} ms/problem  {REQUESTS / len(slugs):5.1f} requests/problem'
+          f'  ({(revalidations() - revalidated) / len(slugs):.1f} answered 304)')
+    return results
+
+
+if __name__ == '__main__':
+    problems = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 80) / 1000
+    server = start_json_stub(respond, latency=latency, etag=True)
+    base = f'http://127.0.0.1:{server.server_port}'
+    scope = f'127.0.0.1:{server.server_port}'
+
+    techiedelight = load_scraper('5. techiedelight_scraper.py')
+    interviewbit = load_scraper('4. interviewbit_scraper.py')
+    rewrite(techiedelight, base)
+    rewrite(interviewbit, base)
+    slugs = [f'problem-{index}' for index in range(problems)]
+    print(f'{problems} problems, {latency * 1000:.0f} ms per request')
+
+    for name, legacy, fetch in (
+        ('Techie Delight (3 templates)', lambda slug: legacy_td(techiedelight, slug), techiedelight.fetch_code_snippet),
+        (f'InterviewBit ({len(IB_LANGUAGES)} templates)', lambda slug: legacy_ib(interviewbit, slug),
+         lambda slug: interviewbit.get_code_snippets(slug, IB_LANGUAGES)),
+    ):
+        print(name)
+        http_cache.configure(enabled=False)
+        expected = run('sequential, no cache', legacy, slugs)
+        for label, ttl in (('concurrent, cold cache', 3600), ('concurrent, fresh cache', 3600)):
+            if label.endswith('cold cache'):
+                cache_dir = tempfile.mkdtemp()
+                http_cache.configure(cache_dir=cache_dir, enabled=True)
+            http_cache.CACHE_TTLS[scope] = ttl
+            results = run(label, fetch, slugs)
+        # Refill a cache whose entries expire at once, so the next pass revalidates every template
+        stale_cache_dir = tempfile.mkdtemp()
+        http_cache.configure(cache_dir=stale_cache_dir, enabled=True)
+        http_cache.CACHE_TTLS[scope] = 0.001
+        run('(refilling with short TTL)', fetch, slugs)
+        time.sleep(0.01)
+        results = run('concurrent, expired cache', fetch, slugs)
+        print(f'  {"":<26} same templates as before: {results == expected}')
+        http_cache.configure(enabled=False)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        shutil.rmtree(stale_cache_dir, ignore_errors=True)
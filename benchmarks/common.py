@@ -0,0 +1,124 @@
+"""
+Helpers shared by the benchmark scripts.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+from scraper_common import rate_limit  # noqa: E402
+
+
+def load_scraper(file_name: str):
+    """
+    Imports one of the numbered scraper scripts as a module without running its main block.
+
+    Args:
+        file_name (str): File name of the script, for example "1. leetcode_scraper.py".
+
+    Returns:
+        module: The loaded module.
+    """
+    module_name = file_name.split('. ', 1)[-1].replace('.py', '')
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(REPO_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def start_json_stub(
+    respond: Callable[[str, str, bytes], Tuple[int, Dict]],
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    etag: bool = False
+) -> ThreadingHTTPServer:
+    """
+    Starts a local keep-alive HTTP server answering every request with JSON.
+
+    Args:
+        respond (Callable[[str, str, bytes], Tuple[int, Dict]]): Maps (method, path, body) to (status, JSON body).
+        latency (float): Seconds added before every response.
+        jitter (float): Maximum extra random seconds added to the latency.
+        etag (bool): Sends an ETag with every response and answers 304 when If-None-Match matches it.
+
+    Returns:
+        ThreadingHTTPServer: The running server. Its port is `server.server_port`. The
+        adaptive rate limiter is lifted for it so benchmarks measure the fetch path only.
+    """
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def _handle(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+            time.sleep(latency + random.uniform(0, jitter))
+            status, payload = respond(self.command, self.path, body)
+            data = json.dumps(payload).encode()
+            tag = f'"{hashlib.md5(data).hexdigest()}"' if etag else None
+            if tag and self.headers.get('If-None-Match') == tag:
+                self.send_response(304)
+                self.send_header('ETag', tag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            if tag:
+                self.send_header('ETag', tag)
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = _handle
+        do_POST = _handle
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    rate_limit.RATE_LIMITS[f'127.0.0.1:{server.server_port}'] = 100000.0
+    return server
+
+
+def start_static_stub(pages: Dict[str, bytes], content_type: str = 'text/plain; charset=utf-8') -> ThreadingHTTPServer:
+    """
+    Starts a local keep-alive HTTP server answering GET requests with fixed bodies.
+
+    Args:
+        pages (Dict[str, bytes]): Maps a request path to its body. The query string is ignored unless the full path is listed. Other paths get 404.
+        content_type (str): The Content-Type of every body.
+
+    Returns:
+        ThreadingHTTPServer: The running server, exempt from the adaptive rate limiter like `start_json_stub`.
+    """
+    class StaticHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            body = pages.get(self.path, pages.get(self.path.split('?', 1)[0]))
+            self.send_response(200 if body is not None else 404)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body or b'')))
+            self.end_headers()
+            self.wfile.write(body or b'')
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StaticHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    rate_limit.RATE_LIMITS[f'127.0.0.1:{server.server_port}'] = 100000.0
+    return server
@@ -0,0 +1,130 @@
+"""
+A stand-in for the Playwright page of an InterviewBit problem, used by the hint benchmarks.
+
+Opening a hint tab shows its unlock button, and clicking the button makes the page
+send the matching /v2/problems/{slug}/hints/{id} response after a delay. Problems
+whose index is a multiple of three were unlocked before: their responses are sent
+as soon as the tab opens and no unlock button is shown. As in Playwright's sync
+API, events are only delivered while a page call is running. Navigation and
+response delays are divided by the time scale; timeouts passed in by the caller
+are used as given, so callers scale their own waits.
+"""
+import heapq
+import itertools
+import time
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+NAVIGATION_SECONDS = 1.5
+RESPONSE_SECONDS = 0.3
+TABS = {'Hints': 'Hint', 'Solution Approach': 'Solution Approach', 'Complete Solution': 'Complete Solution'}
+UNLOCKS = {'Unlock Hint': 'Hint', 'Unlock Solution Approach': 'Solution Approach', 'Unlock Complete Solution': 'Complete Solution'}
+
+
+def hints_meta_of(index):
+    return [{'id': index * 10 + offset, 'title': title} for offset, title in enumerate(TABS.values())]
+
+
+class Response:
+    def __init__(self, url, body):
+        self.url, self.status, self._body = url, 200, body
+
+    def json(self):
+        return self._body
+
+
+class Clickable:
+    def __init__(self, page, name):
+        self.page, self.name = page, name
+
+    @property
+    def first(self):
+        return self
+
+    def filter(self, **kwargs):
+        return Clickable(self.page, kwargs.get('has_text'))
+
+    def is_visible(self):
+        self.page.deliver()
+        return self.name in self.page.visible
+
+    def click(self, timeout=30000, **kwargs):
+        page = self.page
+        page.deliver()
+        if self.name in TABS:
+            title = TABS[self.name]
+            if page.index % 3 == 0:
+                page.send(title)
+            else:
+                page.visible.add(next(text for text, unlocks in UNLOCKS.items() if unlocks == title))
+        elif self.name in page.visible:
+            page.visible.discard(self.name)
+            page.send(UNLOCKS[self.name])
+        else:
+            # Playwright waits for the element until the click timeout
+            time.sleep(timeout / 1000)
+            raise PlaywrightTimeoutError(f'Timeout {timeout}ms exceeded waiting for {self.name}')
+
+
+class StandInPage:
+    def __init__(self, scale):
+        self.scale, self.listeners, self.due = scale, [], []
+        self.order = itertools.count()
+        self.slug = self.index = None
+        self.visible = set()
+
+    def send(self, title):
+        hint = next(hint for hint in hints_meta_of(self.index) if hint['title'] == title)
+        url = f'https://www.interviewbit.com/v2/problems/{self.slug}/hints/{hint["id"]}/'
+        if title == 'Complete Solution':
+            body = {'hint': {'complete_solution': {
+                'language_names': {'1': 'C++', '2': 'Java'},
+                'editorial_solutions': {'1': {'content': f'<div>// {self.slug} in C++</div>'}, '2': {'content': f'// {self.slug} in Java'}}}}}
+        else:
+            body = {'hint': {'markdown_content': f'{title} of {self.slug}'}}
+        heapq.heappush(self.due, (time.monotonic() + RESPONSE_SECONDS / self.scale, next(self.order), Response(url, body)))
+
+    def deliver(self):
+        delivered = []
+        while self.due and self.due[0][0] <= time.monotonic():
+            response = heapq.heappop(self.due)[2]
+            for handler in list(self.listeners):
+                handler(response)
+            delivered.append(response)
+        return delivered
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+    def goto(self, url, **kwargs):
+        time.sleep(NAVIGATION_SECONDS / self.scale)
+        self.due, self.visible = [], set()
+        self.slug = url.rstrip('/').split('/')[-1]
+        self.index = int(self.slug.split('-')[-1])
+
+    def get_by_role(self, role, name=None, **kwargs):
+        return Clickable(self, name)
+
+    def get_by_text(self, text, **kwargs):
+        return Clickable(self, text)
+
+    def locator(self, selector):
+        return Clickable(self, None)
+
+    def wait_for_timeout(self, milliseconds):
+        time.sleep(milliseconds / 1000)
+        self.deliver()
+
+    def wait_for_event(self, event, predicate=None, timeout=30000):
+        end = time.monotonic() + timeout / 1000
+        while True:
+            for response in self.deliver():
+                if predicate is None or predicate(response):
+                    return response
+            now = time.monotonic()
+            if now >= end:
+                raise PlaywrightTimeoutError(f'Timeout {timeout}ms exceeded while waiting for event "{event}"')
+            time.sleep(max(0.0, min(end, self.due[0][0] if self.due else end) - now))
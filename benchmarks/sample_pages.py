@@ -0,0 +1,248 @@
+"""
+Synthetic problem pages shaped like the ones the scrapers download, for parser benchmarks.
+
+Each generator is deterministic for a given index. Benchmarks use them when no
+directory of saved pages is given.
+"""
+import json
+import os
+import random
+from typing import List
+
+WORDS = (
+    'array integer return given find the of and number elements minimum maximum sum string '
+    'print each query index value sorted subarray length pair order distinct count tree node'
+).split()
+
+
+def sentence(rng: random.Random, words: int = 14) -> str:
+    return ' '.join(rng.choices(WORDS, k=words)).capitalize() + '.'
+
+
+def gfg_problem_question(index: int) -> str:
+    """
+    The `problem_question` HTML of a GeeksforGeeks problem: description, examples and constraints.
+    """
+    rng = random.Random(index)
+    parts = [f'<p><span style="font-size:18px">{sentence(rng, 20)}</span></p>' for _ in range(rng.randint(2, 4))]
+    for example in range(1, rng.randint(2, 4)):
+        parts.append(f'<p><span style="font-size:18px"><strong>Example {example}:</strong></span></p>')
+        parts.append(
+            '<pre><span style="font-size:18px"><strong>Input: </strong>'
+            f'arr[] = {[rng.randint(1, 99) for _ in range(6)]}\n<strong>Output: </strong>{rng.randint(1, 99)}\n'
+            f'<strong>Explanation: </strong>{sentence(rng)}</span></pre>'
+        )
+    parts.append(f'<p><span style="font-size:18px"><strong>Your Task:</strong><br>{sentence(rng, 24)}</span></p>')
+    parts.append(
+        '<p><span style="font-size:18px"><strong>Constraints:</strong><br>'
+        f'1 &lt;= n &lt;= 10<sup>{rng.randint(3, 6)}</sup><br>1 &lt;= arr[i] &lt;= 10<sup>9</sup></span></p>'
+    )
+    return ''.join(parts)
+
+
+def gfg_problem_page(index: int) -> bytes:
+    """
+    A GeeksforGeeks problem page: server-rendered markup followed by a large `__NEXT_DATA__` payload.
+    """
+    rng = random.Random(index)
+    question = gfg_problem_question(index)
+    related = [
+        {'id': rng.randint(1, 10 ** 6), 'slug': f'problem-{rng.randint(1, 10 ** 4)}', 'title': sentence(rng, 5),
+         'tags': rng.choices(WORDS, k=5), 'accuracy': rng.random(), 'submissions': rng.randint(1, 10 ** 6)}
+        for _ in range(900)
+    ]
+    payload = {
+        'props': {'pageProps': {'initialState': {
+            'problemData': {'allData': {'probData': {
+                'id': index, 'problem_name': f'Problem {index}', 'problem_question': question,
+                'difficulty': rng.choice(['Easy', 'Medium', 'Hard']), 'tags': {'topic_tags': rng.choices(WORDS, k=4)},
+            }}},
+            'relatedProblems': related,
+            'articles': [{'title': sentence(rng, 8), 'body': sentence(rng, 60)} for _ in range(60)],
+        }}},
+        'page': '/problems/[slug]/[id]', 'buildId': 'build', 'isFallback': False,
+    }
+    body = ''.join(
+        f'<div class="problems_row"><a href="/problems/p{i}">{sentence(rng, 6)}</a><span class="tag">{rng.choice(WORDS)}</span></div>'
+        for i in range(1500)
+    )
+    data = json.dumps(payload).replace('<', '\\u003c')
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Problem</title>'
+        '<link rel="stylesheet" href="/_next/static/css/app.css"></head><body>'
+        f'<div id="__next"><main>{question}{body}</main></div>'
+        f'<script id="__NEXT_DATA__" type="application/json">{data}</script>'
+        '<script src="/_next/static/chunks/main.js" defer></script></body></html>'
+    ).encode()
+
+
+def load_pages(directory: str) -> List[bytes]:
+    """
+    Reads every saved `.html` page of a directory.
+    """
+    return [
+        open(os.path.join(directory, name), 'rb').read()
+        for name in sorted(os.listdir(directory)) if name.endswith('.html')
+    ]
+
+
+def ib_markdown_content(index: int) -> str:
+    """
+    The `meta.markdown_content` HTML of an InterviewBit problem, one div per section.
+    """
+    rng = random.Random(index)
+
+    def section(name, html):
+        return f'<div id="{name}_markdown_content_value" class="markdown-content">{html}</div>'
+
+    def examples(label):
+        return ''.join(
+            f'<p><strong>{label} {number}:</strong></p>\n<pre>{rng.randint(1, 9)}\n{[rng.randint(1, 99) for _ in range(5)]}</pre>\n'
+            for number in range(1, rng.randint(2, 4))
+        )
+
+    return ''.join([
+        section('problem_description', ''.join(f'<p>{sentence(rng, 24)}</p>\n' for _ in range(rng.randint(2, 5)))),
+        section('problem_constraints', '<p>1 &lt;= N &lt;= 10<sup>5</sup>\n1 &lt;= A[i] &lt;= 10<sup>9</sup></p>'),
+        section('input_format', f'<p>{sentence(rng)}</p>\n<p>{sentence(rng)}</p>'),
+        section('output_format', f'<p>{sentence(rng)}</p>'),
+        section('example_input', examples('Input')),
+        section('example_output', examples('Output')),
+        section('example_explanation', ''.join(
+            f'<p><strong>Explanation {number}:</strong></p>\n<pre>{sentence(rng)}</pre>\n' for number in range(1, 3)
+        )),
+    ])
+
+
+def ib_problem_page(index: int) -> bytes:
+    """
+    An InterviewBit problem page whose inline bundle assigns `window.__INTERVIEWBIT__.problemsData`.
+    """
+    rng = random.Random(index)
+    problems_data = {
+        'meta': {
+            'id': index, 'slug': f'problem-{index}', 'title': sentence(rng, 4),
+            'markdown_content': ib_markdown_content(index),
+            'input_descriptor': {'A': 'array of integers', 'B': 'integer'},
+            'languages': {str(language_id): name for language_id, name in enumerate(['C', 'C++', 'Java', 'Python', 'Python3', 'JavaScript', 'Go'])},
+        },
+        'hints': {'hints': [{'id': rng.randint(1, 10 ** 5), 'title': f'Hint {number}', 'unlocked': False} for number in range(1, 4)]},
+        'companies': [{'name': sentence(rng, 2), 'count': rng.randint(1, 99)} for _ in range(40)],
+        'similar_problems': [{'slug': f'problem-{rng.randint(1, 10 ** 4)}', 'title': sentence(rng, 5)} for _ in range(150)],
+    }
+    user_data = {'user': {'id': rng.randint(1, 10 ** 6), 'settings': {word: rng.random() for word in WORDS}}}
+    bundle = ''.join(
+        f'function f{i}(a,b){{var c=a+b;if(c>{i}){{return c*{i}}}else{{return [a,b,"{rng.choice(WORDS)}"]}}}}'
+        for i in range(800)
+    )
+    script = (
+        'window.__INTERVIEWBIT__=window.__INTERVIEWBIT__||{};'
+        f'window.__INTERVIEWBIT__.userData={json.dumps(user_data)};'
+        f'window.__INTERVIEWBIT__.problemsData={json.dumps(problems_data)};'
+        f'{bundle}'
+    )
+    body = ''.join(f'<li class="nav-item"><a href="/courses/{word}">{word}</a></li>' for word in WORDS * 20)
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Problem</title></head><body>'
+        f'<nav><ul>{body}</ul></nav><div id="problem"></div>'
+        f'<script>{script}</script></body></html>'
+    ).encode()
+
+
+def td_home_page(problems: int = 600) -> str:
+    """
+    The Techie Delight home page: navigation followed by the `span#problemsList` list of problem links.
+    """
+    rng = random.Random(problems)
+    items = ''.join(
+        f'<li><a href="/?problem=problem-{i}">{sentence(rng, 5)}</a> <span class="level">{rng.choice(["Easy", "Medium", "Hard"])}</span></li>'
+        for i in range(problems)
+    )
+    navigation = ''.join(f'<li class="menu-item"><a href="/category/{word}">{word}</a></li>' for word in WORDS * 10)
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Techie Delight</title>'
+        '<style>body{margin:0}.level{color:#888}</style></head><body>'
+        f'<header><ul class="menu">{navigation}</ul></header>'
+        f'<main><span id="problemsList"><ol>{items}</ol></span></main></body></html>'
+    )
+
+
+def td_problem_page(index: int) -> str:
+    """
+    A Techie Delight practice page: inline styles everywhere, style blocks and the `a#editorial` link.
+    """
+    rng = random.Random(index)
+    styles = ''.join(
+        f'<style id="css-{i}">.c{i}{{color:#{rng.randint(0, 0xFFFFFF):06x};margin:{rng.randint(0, 9)}px}}</style>'
+        for i in range(30)
+    )
+    statement = ''.join(
+        f'<p style="font-size:{rng.randint(12, 18)}px"><span style="color:#333">{sentence(rng, 20)}</span></p>'
+        for _ in range(rng.randint(4, 8))
+    )
+    examples = ''.join(
+        f'<pre style="background:#f5f5f5"><strong>Input:</strong> {[rng.randint(1, 99) for _ in range(6)]}\n'
+        f'<strong>Output:</strong> {rng.randint(1, 99)}</pre>'
+        for _ in range(rng.randint(2, 4))
+    )
+    editor = ''.join(
+        f'<div class="line" style="top:{line * 19}px"><span class="token" style="color:#00f">{rng.choice(WORDS)}</span></div>'
+        for line in range(400)
+    )
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Problem {index}</title>{styles}</head>'
+        f'<body style="margin:0"><div class="problem" style="padding:8px">{statement}{examples}'
+        f'<a id="editorial" href="/problem-{index}/" style="font-weight:bold">Editorial</a></div>'
+        f'<div class="editor" style="height:600px">{editor}</div></body></html>'
+    )
+
+
+def td_editorial_page(index: int) -> str:
+    """
+    A Techie Delight editorial article with one `h2.tabtitle` and `div.c-pre` pair per solution.
+
+    This is the server HTML: the responsive-tabs__heading classes are only added by the tabs script in the browser.
+    """
+    rng = random.Random(index)
+    tabs = []
+    for approach in range(rng.randint(1, 3)):
+        for language in ['C', 'C++', 'Java', 'Python']:
+            code = '\n'.join(f'    {sentence(rng, 6)}' for _ in range(rng.randint(10, 30)))
+            tabs.append(
+                f'<h2 class="tabtitle">{language}</h2>'
+                f'<div class="tabcontent"><div class="c-pre"><pre>{code}</pre></div></div>'
+            )
+        tabs.append(f'<p>{sentence(rng, 40)}</p>')
+    article = ''.join(f'<p>{sentence(rng, 30)}</p>' for _ in range(12))
+    sidebar = ''.join(f'<li><a href="/post-{i}/">{sentence(rng, 6)}</a></li>' for i in range(200))
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Editorial {index}</title></head><body>'
+        f'<article>{article}<div class="responsive-tabs">{"".join(tabs)}</div></article>'
+        f'<aside><ul>{sidebar}</ul></aside></body></html>'
+    )
+
+
+def td_testcases(lines: int, seed: int = 0) -> str:
+    """
+    A Techie Delight testcase file: `|` separated inputs, then the outputs with `#` between alternatives.
+    """
+    rng = random.Random(seed)
+
+    def field():
+        kind = rng.random()
+        if kind < 0.4:
+            return ','.join(str(rng.randint(-99, 99)) for _ in range(rng.randint(2, 40)))
+        if kind < 0.6:
+            return str(rng.randint(-10 ** 9, 10 ** 9))
+        if kind < 0.75:
+            return rng.choice('YN')
+        if kind < 0.9:
+            return ''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=rng.randint(1, 12)))
+        return ','.join(rng.choices(WORDS, k=rng.randint(2, 6)))
+
+    testcases = []
+    for _ in range(lines):
+        inputs = ' | '.join(field() for _ in range(rng.randint(1, 3)))
+        outputs = ' # '.join(field() for _ in range(rng.choice([1, 1, 1, 2, 3])))
+        testcases.append(f'{inputs} | {outputs}')
+    return '\n'.join(testcases) + '\n'
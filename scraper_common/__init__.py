@@ -0,0 +1,6 @@
+"""
+Shared helpers used by the platform scrapers.
+
+The scrapers are run as standalone scripts from the repository root, so this
+package is importable from each of them without any installation step.
+"""
@@ -0,0 +1,147 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from playwright.sync_api import sync_playwright
+
+from scraper_common import replay
+
+R = TypeVar('R')
+
+
+class LazyPage:
+    """
+    Stands in for a Playwright page and only launches the browser when the page is first used.
+
+    Scrapers that fetch most pages over HTTP keep the browser as a fallback, so
+    runs that never need it skip the browser startup entirely. Any attribute of
+    the Playwright page can be used on this object directly.
+    """
+
+    def __init__(self, playwright, headless: bool = True, **context_options: Any) -> None:
+        """
+        Args:
+            playwright (Playwright): The running sync Playwright instance.
+            headless (bool): Launch the browser without a window.
+            **context_options: Keyword arguments for `browser.new_context`.
+        """
+        self._playwright = playwright
+        self._headless = headless
+        self._context_options = context_options
+        self._browser = None
+        self._page = None
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether the browser has been launched.
+        """
+        return self._page is not None
+
+    @property
+    def page(self):
+        """
+        The Playwright page, launching the browser on first access.
+        """
+        if self._page is None:
+            logging.info('BROWSER --> LAUNCHING BROWSER ON FIRST USE')
+            self._browser = self._playwright.chromium.launch(headless=self._headless)
+            context = self._browser.new_context(**self._context_options)
+            replay.attach(context)
+            self._page = context.new_page()
+        return self._page
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.page, name)
+
+    def close(self) -> None:
+        """
+        Closes the browser if it was launched.
+        """
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = self._page = None
+
+
+class ContextPool:
+    """
+    Runs browser work on a fixed set of threads, each with its own browser context cloned from one logged-in storage state.
+
+    Playwright's sync API is bound to the thread that started it, so every worker
+    thread starts its own Playwright and browser on first use and keeps a single
+    context and page for the life of the pool. The contexts are created from the
+    `storage_state` of a context that already signed in, so none of them has to
+    sign in again.
+    """
+
+    def __init__(self, storage_state: Dict, size: int = 3, headless: bool = True, **context_options: Any) -> None:
+        """
+        Args:
+            storage_state (Dict): Cookies and local storage of the logged-in context, from `context.storage_state()`.
+            size (int): Number of contexts, and so of pages driven at the same time.
+            headless (bool): Launch the browsers without a window.
+            **context_options: Keyword arguments for `browser.new_context`.
+        """
+        self.size = size
+        self._storage_state = storage_state
+        self._headless = headless
+        self._context_options = context_options
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='browser-pool')
+
+    def _open(self) -> Tuple[Any, Callable[[], None]]:
+        """
+        Starts Playwright, a browser and a context on the calling thread.
+
+        Returns:
+            Tuple[Page, Callable[[], None]]: The page, and a function closing everything again from the same thread.
+        """
+        playwright = sync_playwright().start()
+        browser = playwright.chromium.launch(headless=self._headless)
+        context = browser.new_context(storage_state=self._storage_state, **self._context_options)
+        replay.attach(context)
+
+        def close() -> None:
+            browser.close()
+            playwright.stop()
+        return context.new_page(), close
+
+    def _page(self) -> Any:
+        if getattr(self._local, 'page', None) is None:
+            logging.info(f'BROWSER --> OPENING POOLED CONTEXT   <THREAD = {threading.current_thread().name}>')
+            self._local.page, self._local.close = self._open()
+        return self._local.page
+
+    def submit(self, work: Callable[[Any], R]) -> 'Future[R]':
+        """
+        Queues browser work for the next free context.
+
+        Args:
+            work (Callable[[Page], R]): Called with the page of the context it runs on. It must leave the page
+                without listeners of its own once it returns.
+
+        Returns:
+            Future[R]: The result of `work`.
+        """
+        return self._executor.submit(lambda: work(self._page()))
+
+    def close(self) -> None:
+        """
+        Waits for the queued work, then closes every browser from the thread that opened it.
+        """
+        # The barrier keeps each worker busy until all of them took one close task
+        barrier = threading.Barrier(self.size)
+
+        def close_thread() -> None:
+            barrier.wait()
+            if getattr(self._local, 'page', None) is not None:
+                try:
+                    self._local.close()
+                except Exception as e:
+                    logging.info(f'BROWSER --> CLOSING POOLED CONTEXT FAILED <EXCEPTION = {e}>')
+                self._local.page = None
+
+        for future in [self._executor.submit(close_thread) for _ in range(self.size)]:
+            future.result()
+        self._executor.shutdown(wait=True)
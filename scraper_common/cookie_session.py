@@ -0,0 +1,93 @@
+import logging
+import threading
+from typing import Callable, Dict, FrozenSet, Optional
+
+import requests
+
+from scraper_common import http_session
+
+# Statuses meaning the cookies are missing or expired
+AUTH_FAILURE_STATUSES = frozenset({401, 403})
+
+
+class CookieSession:
+    """
+    Sends API requests with the cookies of a logged-in browser, reading them from the browser only when needed.
+
+    The cookies are harvested once, on the first request, and reused for every
+    request after that. When a response has an auth failure status they are
+    harvested again and the request is repeated once, so the browser is only
+    consulted when the session actually expired.
+    """
+
+    def __init__(
+        self,
+        harvest: Callable[[bool], Dict[str, str]],
+        auth_failure_statuses: FrozenSet[int] = AUTH_FAILURE_STATUSES
+    ) -> None:
+        """
+        Args:
+            harvest (Callable[[bool], Dict[str, str]]): Returns the cookies of the browser. Its argument is True when
+                the previous cookies were rejected, so it should log in again. It is called from the thread that sends
+                the request while other requests wait.
+            auth_failure_statuses (FrozenSet[int]): Response statuses that trigger a harvest and one retry.
+        """
+        self._harvest = harvest
+        self._auth_failure_statuses = auth_failure_statuses
+        self._lock = threading.Lock()
+        self._cookies: Optional[Dict[str, str]] = None
+        self._generation = 0
+        self.harvests = 0
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """
+        The current cookies, harvested on first access.
+        """
+        with self._lock:
+            if self._cookies is None:
+                self._refresh(False)
+            return self._cookies
+
+    def _refresh(self, stale: bool) -> None:
+        self._cookies = self._harvest(stale)
+        self._generation += 1
+        self.harvests += 1
+        logging.info(f'HTTP    --> COOKIES HARVESTED       <COOKIES = {len(self._cookies)}, HARVESTS = {self.harvests}>')
+
+    def invalidate(self) -> None:
+        """
+        Forgets the cookies, so the next request harvests them again.
+        """
+        with self._lock:
+            self._cookies = None
+
+    def request(self, method: str, url: str, refresh: bool = True, **kwargs) -> requests.Response:
+        """
+        Sends a request through `http_session.request` with the harvested cookies.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            refresh (bool): Harvest again and retry on an auth failure. Pass False from worker threads when the
+                harvest drives a browser that belongs to another thread; the failed response is returned instead.
+            **kwargs: Any keyword argument accepted by `http_session.request`; cookies given here override the harvested ones.
+
+        Returns:
+            requests.Response: The response, after at most one harvest and retry on an auth failure.
+        """
+        extra_cookies = kwargs.pop('cookies', None) or {}
+        with self._lock:
+            if self._cookies is None:
+                self._refresh(False)
+            cookies, generation = self._cookies, self._generation
+        response = http_session.request(method, url, cookies={**cookies, **extra_cookies}, **kwargs)
+        if not refresh or response.status_code not in self._auth_failure_statuses:
+            return response
+        logging.info(f'HTTP    --> AUTH FAILURE, REFRESHING COOKIES <URL = {url}, STATUS = {response.status_code}>')
+        with self._lock:
+            # Another thread may already have refreshed them after the same failure
+            if self._generation == generation:
+                self._refresh(True)
+            cookies = self._cookies
+        return http_session.request(method, url, cookies={**cookies, **extra_cookies}, **kwargs)
@@ -0,0 +1,9 @@
+try:
+    # orjson parses large payloads several times faster than the standard library
+    from orjson import loads
+    JSON_BACKEND = 'orjson'
+except ImportError:
+    from json import loads
+    JSON_BACKEND = 'json'
+
+__all__ = ['JSON_BACKEND', 'loads']
@@ -0,0 +1,145 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def fetch_in_order(
+    items: Iterable[T],
+    fetch: Callable[[T], R],
+    concurrency: int = 8,
+    prefetch: Optional[int] = None
+) -> Iterator[Tuple[T, R]]:
+    """
+    Runs `fetch` on many items concurrently and yields the results in input order.
+
+    Items are pulled lazily, so when `items` is a generator over listing pages the
+    engine starts on the next page while the current one is still being processed.
+    At most `prefetch` fetches are in flight or waiting to be consumed.
+
+    Args:
+        items (Iterable[T]): The items to fetch, for example question slugs.
+        fetch (Callable[[T], R]): Blocking fetch function, called from worker threads.
+        concurrency (int): Number of fetches running at the same time.
+        prefetch (Optional[int]): Size of the look-ahead window. Defaults to twice the concurrency.
+
+    Returns:
+        Iterator[Tuple[T, R]]: (item, result) pairs in the order of `items`. An exception raised by
+        `fetch` is re-raised when its item is reached.
+    """
+    window = prefetch or 2 * concurrency
+    pending: Deque[Tuple[T, Future]] = deque()
+    iterator = iter(items)
+    exhausted = False
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='fetch-engine')
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, executor.submit(fetch, item)))
+            if not pending:
+                return
+            item, future = pending.popleft()
+            yield item, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def collect_first(
+    candidates: Iterable[T],
+    fetch: Callable[[T], Optional[R]],
+    limit: int,
+    key: Optional[Callable[[R], Hashable]] = None,
+    retry: Optional[Callable[[T], Optional[R]]] = None,
+    concurrency: int = 4,
+    prefetch: Optional[int] = None
+) -> List[Tuple[T, R]]:
+    """
+    Fetches candidates concurrently until `limit` distinct results are collected, then drops the rest.
+
+    Candidates are pulled lazily from the calling thread, so a generator walking
+    listing pages keeps paging while earlier code bodies are still downloading, and
+    stops paging once enough results are in. As soon as the limit is reached the
+    queued fetches are cancelled and the call returns without waiting for the ones
+    already running; their results are discarded.
+
+    Args:
+        candidates (Iterable[T]): The candidates in order of preference, for example accepted submissions.
+        fetch (Callable[[T], Optional[R]]): Blocking fetch function, called from worker threads. None means the
+            candidate could not be read.
+        limit (int): Number of distinct results to collect.
+        key (Optional[Callable[[R], Hashable]]): Identifies duplicate results, only the first one is kept. By default
+            every result counts.
+        retry (Optional[Callable[[T], Optional[R]]]): Called from the calling thread when `fetch` returned None, for
+            example to unlock the candidates in the browser and fetch again.
+        concurrency (int): Number of fetches running at the same time.
+        prefetch (Optional[int]): Size of the look-ahead window. Defaults to twice the concurrency.
+
+    Returns:
+        List[Tuple[T, R]]: Up to `limit` (candidate, result) pairs in the order of `candidates`. An exception raised
+        by `fetch` is re-raised when its candidate is reached.
+    """
+    window = prefetch or 2 * concurrency
+    pending: Deque[Tuple[T, Future]] = deque()
+    iterator = iter(candidates)
+    exhausted = False
+    collected: List[Tuple[T, R]] = []
+    seen = set()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='fetch-engine')
+    try:
+        while len(collected) < limit:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, executor.submit(fetch, item)))
+            if not pending:
+                break
+            item, future = pending.popleft()
+            result = future.result()
+            if result is None and retry is not None:
+                result = retry(item)
+            if result is None:
+                continue
+            if key is not None:
+                identity = key(result)
+                if identity in seen:
+                    continue
+                seen.add(identity)
+            collected.append((item, result))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+    return collected
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Groups items lazily into lists of `size` (the last one may be shorter).
+
+    Args:
+        items (Iterable[T]): The items to group.
+        size (int): Number of items per batch.
+
+    Returns:
+        Iterator[List[T]]: The batches.
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
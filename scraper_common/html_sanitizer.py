@@ -0,0 +1,83 @@
+from html import escape
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+
+class StyleStripper(HTMLParser):
+    """
+    Copies an HTML document token by token, leaving out <style> elements and style attributes.
+
+    No tree is built: every token is written out as soon as it is read, using its
+    original source text unless the tag carried a style attribute, in which case
+    the tag is written again without it.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self.in_style = False
+
+    def _start(self, tag: str, attrs: List[Tuple[str, Optional[str]]], closing: str) -> None:
+        if not any(name == 'style' for name, _ in attrs):
+            self.parts.append(self.get_starttag_text())
+            return
+        self.parts.append(f'<{tag}')
+        for name, value in attrs:
+            if name == 'style':
+                continue
+            self.parts.append(f' {name}' if value is None else f' {name}="{escape(value)}"')
+        self.parts.append(f'{closing}>')
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'style':
+            self.in_style = True
+        elif not self.in_style:
+            self._start(tag, attrs, '')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag != 'style' and not self.in_style:
+            self._start(tag, attrs, '/')
+
+    def handle_endtag(self, tag):
+        if tag == 'style':
+            self.in_style = False
+        elif not self.in_style:
+            self.parts.append(f'</{tag}>')
+
+    def handle_data(self, data):
+        if not self.in_style:
+            self.parts.append(data)
+
+    def handle_entityref(self, name):
+        self.parts.append(f'&{name};')
+
+    def handle_charref(self, name):
+        self.parts.append(f'&#{name};')
+
+    def handle_comment(self, data):
+        self.parts.append(f'<!--{data}-->')
+
+    def handle_decl(self, decl):
+        self.parts.append(f'<!{decl}>')
+
+    def handle_pi(self, data):
+        self.parts.append(f'<?{data}>')
+
+    def unknown_decl(self, data):
+        self.parts.append(f'<![{data}]>')
+
+
+def strip_styles(html: str) -> str:
+    """
+    Removes <style> elements and style attributes from an HTML document in a single pass.
+
+    Args:
+        html (str): The HTML document.
+
+    Returns:
+        str: The document without CSS, otherwise as written.
+    """
+    stripper = StyleStripper()
+    stripper.feed(html)
+    stripper.close()
+    return ''.join(stripper.parts)
@@ -0,0 +1,552 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, stream_decode_response_unicode
+
+DAY = 24 * 3600
+
+# Time to live (seconds) of cached GET responses, by "host/path-prefix" scope.
+# Only these detail endpoints are cached unless a caller passes its own TTL.
+CACHE_TTLS: Dict[str, float] = {
+    'www.geeksforgeeks.org/problems': 7 * DAY,
+    'www.interviewbit.com/problems': 7 * DAY,
+    'www.codechef.com/api/contests/PRACTICE/problems': 7 * DAY,
+    'www.techiedelight.com/practice/template': 30 * DAY,
+    # InterviewBit code templates (/v2/problems/<slug>/codes/); the other v2 problem endpoints are only read by the browser
+    'www.interviewbit.com/v2/problems': 30 * DAY,
+}
+
+
+
+def _json_body(response: requests.Response) -> Any:
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+def no_graphql_errors(response: requests.Response) -> bool:
+    """
+    Accepts GraphQL responses that have data and no errors.
+    """
+    body = _json_body(response)
+    return isinstance(body, dict) and not body.get('errors') and body.get('data') is not None
+
+
+def no_error_status(response: requests.Response) -> bool:
+    """
+    Accepts JSON responses whose "status" field does not report an error, as CodeChef answers errors with 200.
+    """
+    body = _json_body(response)
+    return not (isinstance(body, dict) and str(body.get('status')).lower() in ('error', 'apierror'))
+
+
+# Checks a 200 response must pass to be cached, by the same kind of scope as CACHE_TTLS.
+# Sites that report errors inside a 200 body would otherwise serve the error until the TTL ends.
+CACHE_CHECKS: Dict[str, Callable[[requests.Response], bool]] = {
+    'leetcode.com/graphql': no_graphql_errors,
+    'www.codechef.com/api': no_error_status,
+}
+
+ENABLED = True
+DEFAULT_CACHE_DIR = os.path.join(os.getcwd(), '.http_cache')
+MAX_BYTES = 512 * 1024 * 1024
+
+# Headers describing the wire encoding; cached bodies are stored decoded
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'set-cookie'}
+_READ_SIZE = 64 * 1024
+
+
+class _BodyReader:
+    """
+    File-like reader that decompresses a stored body as it is read, so a streamed response replayed
+    from the cache is never held in memory whole.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self._decompressor = zlib.decompressobj()
+        self._buffer = b''
+        self._done = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            data = self._file.read(_READ_SIZE)
+            if data:
+                self._buffer += self._decompressor.decompress(data)
+            else:
+                self._buffer += self._decompressor.flush()
+                self._done = True
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached response as read back from the cache.
+
+    Entries read for a streamed request hold the open body file instead of the content.
+    """
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: Optional[bytes]
+    expires_at: float
+    body: Optional[BinaryIO] = None
+
+    @property
+    def fresh(self) -> bool:
+        """
+        True while the entry is within its time to live.
+        """
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Returns the conditional request headers that revalidate this entry.
+
+        Returns:
+            Dict[str, str]: If-None-Match and/or If-Modified-Since, empty if the server sent no validators.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators = dict()
+        if headers.get('ETag'):
+            validators['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = headers['Last-Modified']
+        return validators
+
+    def to_response(self, request: Optional[requests.PreparedRequest] = None) -> requests.Response:
+        """
+        Rebuilds a `requests.Response` from the entry.
+
+        Args:
+            request (Optional[requests.PreparedRequest]): The request the response answers.
+
+        Returns:
+            requests.Response: A response whose `from_cache` attribute is True.
+        """
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        if self.body is not None:
+            response.raw = _BodyReader(self.body)
+            response._content = False
+        else:
+            response._content = self.content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = self.url
+        response.reason = 'OK'
+        response.request = request
+        response.from_cache = True
+        return response
+
+    def close(self) -> None:
+        """
+        Closes the body file of an entry read for a streamed request that was not turned into a response.
+        """
+        if self.body is not None:
+            self.body.close()
+
+
+class HTTPCache:
+    """
+    Size-bounded on-disk cache of HTTP responses.
+
+    Bodies are stored compressed under the SHA-256 of their content, so identical
+    bodies served for different requests are kept once. A SQLite index maps the
+    request key to its body, headers and expiry, and the least recently used
+    entries are evicted once the bodies exceed `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+        """
+        Opens (or creates) the cache directory and its index.
+
+        Args:
+            cache_dir (str): Directory holding the index and the bodies.
+            max_bytes (int): Maximum total size of the stored bodies.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        os.makedirs(os.path.join(cache_dir, 'bodies'), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite3'), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, url TEXT NOT NULL, status INTEGER NOT NULL, headers TEXT NOT NULL, '
+                'digest TEXT NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)')
+        self.size = self._stored_size()
+
+    def _stored_size(self) -> int:
+        row = self._connection.execute(
+            'SELECT SUM(size) FROM (SELECT DISTINCT digest, size FROM entries)'
+        ).fetchone()
+        return row[0] or 0
+
+    def _body_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'bodies', digest[:2], digest)
+
+    def get(self, key: str, stream: bool = False) -> Optional[CacheEntry]:
+        """
+        Reads an entry, fresh or stale, and marks it as recently used.
+
+        Args:
+            key (str): The request key from `request_key`.
+            stream (bool): Open the body file instead of reading it, for a streamed request. The caller must
+                turn the entry into a response or close it.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if it is not cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT url, status, headers, digest, expires_at FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            url, status, headers, digest, expires_at = row
+            content, body = None, None
+            try:
+                if stream:
+                    # An open file stays readable even if the body is evicted meanwhile
+                    body = open(self._body_path(digest), 'rb')
+                else:
+                    with open(self._body_path(digest), 'rb') as file:
+                        content = zlib.decompress(file.read())
+            except (OSError, zlib.error):
+                self._delete(key, digest)
+                return None
+            now = time.time()
+            if now < expires_at:
+                self.hits += 1
+            with self._connection:
+                self._connection.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+        return CacheEntry(url, status, json.loads(headers), content, expires_at, body)
+
+    def store(self, key: str, response: requests.Response, ttl: float) -> None:
+        """
+        Stores a response, replacing any previous entry for the key.
+
+        Args:
+            key (str): The request key from `request_key`.
+            response (requests.Response): A fully read response.
+            ttl (float): Seconds the entry stays fresh.
+        """
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._body_path(digest)
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp_path = f'{path}.{threading.get_ident()}.tmp'
+                with open(temp_path, 'wb') as file:
+                    file.write(zlib.compress(content, 1))
+                os.replace(temp_path, path)
+            self._index(key, response, digest, ttl)
+
+    def store_stream(self, key: str, response: requests.Response, ttl: float) -> None:
+        """
+        Stores a streamed response as the caller reads it, replacing any previous entry for the key.
+
+        The body is compressed to a temporary file chunk by chunk while `iter_content`
+        hands it out, and the entry is only written once the body was read to the end.
+        A body left half read is not stored.
+
+        Args:
+            key (str): The request key from `request_key`.
+            response (requests.Response): A response sent with stream=True and not read yet.
+            ttl (float): Seconds the entry stays fresh.
+        """
+        iter_content = response.iter_content
+
+        def tee(chunk_size: int = 1, decode_unicode: bool = False) -> Iterator:
+            chunks = tee_bytes(chunk_size)
+            return stream_decode_response_unicode(chunks, response) if decode_unicode else chunks
+
+        def tee_bytes(chunk_size: int) -> Iterator[bytes]:
+            digest = hashlib.sha256()
+            compressor = zlib.compressobj(1)
+            temp_path = os.path.join(self.cache_dir, 'bodies', f'stream.{threading.get_ident()}.{id(response)}.tmp')
+            try:
+                with open(temp_path, 'wb') as file:
+                    for chunk in iter_content(chunk_size):
+                        digest.update(chunk)
+                        file.write(compressor.compress(chunk))
+                        yield chunk
+                    file.write(compressor.flush())
+            except BaseException:
+                os.remove(temp_path)
+                raise
+            path = self._body_path(digest.hexdigest())
+            with self._lock:
+                if os.path.exists(path):
+                    os.remove(temp_path)
+                else:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    os.replace(temp_path, path)
+                self._index(key, response, digest.hexdigest(), ttl)
+
+        response.iter_content = tee
+
+    def _index(self, key: str, response: requests.Response, digest: str, ttl: float) -> None:
+        # Points the key at a stored body; the caller holds the lock
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS}
+        path = self._body_path(digest)
+        size = os.path.getsize(path)
+        previous = self._connection.execute('SELECT digest FROM entries WHERE key = ?', (key,)).fetchone()
+        shared = self._connection.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone()
+        now = time.time()
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO entries (key, url, status, headers, digest, size, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, response.url, response.status_code, json.dumps(headers), digest, size, now + ttl, now)
+            )
+        self.misses += 1
+        if shared is None:
+            self.size += size
+        if previous is not None and previous[0] != digest:
+            self._release(previous[0])
+        self._evict()
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """
+        Extends the life of an entry after the server confirmed it is unchanged.
+
+        Args:
+            key (str): The request key from `request_key`.
+            ttl (float): Seconds the entry stays fresh from now.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'UPDATE entries SET expires_at = ?, accessed_at = ? WHERE key = ?', (now + ttl, now, key)
+            )
+            self.revalidated += 1
+
+    def _delete(self, key: str, digest: str) -> None:
+        with self._connection:
+            self._connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+        self._release(digest)
+
+    def _release(self, digest: str) -> None:
+        # Removes a body once no entry points to it any more
+        if self._connection.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone():
+            return
+        path = self._body_path(digest)
+        try:
+            self.size -= os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes:
+            rows = self._connection.execute(
+                'SELECT key, digest FROM entries ORDER BY accessed_at LIMIT 64'
+            ).fetchall()
+            if not rows:
+                self.size = 0
+                return
+            for key, digest in rows:
+                self._delete(key, digest)
+                if self.size <= self.max_bytes:
+                    return
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit counters and the stored size.
+
+        Returns:
+            Dict[str, int]: hits (served without a request), revalidated (304s), misses (downloaded and stored), entries and bytes.
+        """
+        with self._lock:
+            entries = self._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'entries': entries,
+                'bytes': self.size,
+            }
+
+    def close(self) -> None:
+        """
+        Closes the index database.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+_CACHE: Optional[HTTPCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def configure(cache_dir: Optional[str] = None, max_bytes: Optional[int] = None, enabled: Optional[bool] = None) -> None:
+    """
+    Changes where the cache lives, how large it may grow and whether it is used.
+
+    Args:
+        cache_dir (Optional[str]): Directory holding the cache.
+        max_bytes (Optional[int]): Maximum total size of the stored bodies.
+        enabled (Optional[bool]): False sends every request to the network.
+    """
+    global DEFAULT_CACHE_DIR, MAX_BYTES, ENABLED, _CACHE
+    if cache_dir is not None:
+        DEFAULT_CACHE_DIR = cache_dir
+    if max_bytes is not None:
+        MAX_BYTES = max_bytes
+    if enabled is not None:
+        ENABLED = enabled
+    with _CACHE_LOCK:
+        if _CACHE is not None:
+            _CACHE.close()
+        _CACHE = None
+
+
+def get_cache() -> HTTPCache:
+    """
+    Returns the cache shared by every request, opening it on first use.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = HTTPCache(DEFAULT_CACHE_DIR, MAX_BYTES)
+        return _CACHE
+
+
+def ttl_for(method: str, url: str, cache_ttl: Optional[float] = None) -> float:
+    """
+    Works out how long the response to a request may be cached.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+        cache_ttl (Optional[float]): TTL chosen by the caller, which overrides CACHE_TTLS; 0 disables caching.
+
+    Returns:
+        float: The TTL in seconds, or 0 if the response must not be cached.
+    """
+    if not ENABLED:
+        return 0
+    if cache_ttl is not None:
+        return cache_ttl
+    if method.upper() != 'GET':
+        return 0
+    scope = _match_scope(url, CACHE_TTLS)
+    return CACHE_TTLS[scope] if scope else 0
+
+
+def is_cacheable(url: str, response: requests.Response, cacheable: Optional[Callable[[requests.Response], bool]] = None) -> bool:
+    """
+    Checks whether a 200 response may be stored, so error payloads sent with a 200 are never cached.
+
+    Args:
+        url (str): The request URL.
+        response (requests.Response): The response.
+        cacheable (Optional[Callable[[requests.Response], bool]]): Check chosen by the caller, which overrides CACHE_CHECKS.
+
+    Returns:
+        bool: True if the response passes the check of its scope, or if its scope has none.
+    """
+    check = cache_check(url, cacheable)
+    return check is None or check(response)
+
+
+def cache_check(url: str, cacheable: Optional[Callable[[requests.Response], bool]] = None) -> Optional[Callable[[requests.Response], bool]]:
+    """
+    Finds the check a 200 response of the URL must pass to be cached.
+
+    Args:
+        url (str): The request URL.
+        cacheable (Optional[Callable[[requests.Response], bool]]): Check chosen by the caller, which overrides CACHE_CHECKS.
+
+    Returns:
+        Optional[Callable[[requests.Response], bool]]: The check, or None if responses of the URL are cached unchecked.
+    """
+    if cacheable is not None:
+        return cacheable
+    scope = _match_scope(url, CACHE_CHECKS)
+    return CACHE_CHECKS[scope] if scope else None
+
+
+def _match_scope(url: str, scopes: Iterable[str]) -> Optional[str]:
+    # The longest "host/path-prefix" scope containing the URL
+    parts = urlsplit(url)
+    target = parts.netloc + parts.path
+    matches = [scope for scope in scopes if target == scope or target.startswith(scope.rstrip('/') + '/')]
+    return max(matches, key=len) if matches else None
+
+
+def exchange_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """
+    Computes the key of an HTTP exchange from its method, full URL and body.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The full request URL, query string included.
+        body (Optional[bytes]): The request body.
+
+    Returns:
+        str: The hex SHA-256 key.
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{method.upper()} {url}\n'.encode())
+    digest.update(body or b'')
+    return digest.hexdigest()
+
+
+def request_key(method: str, url: str, **kwargs) -> Tuple[str, requests.PreparedRequest]:
+    """
+    Computes the cache key of a request from its method, full URL and body.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+        **kwargs: The keyword arguments of the request; only params, data and json are used.
+
+    Returns:
+        Tuple[str, requests.PreparedRequest]: The key and the prepared request it was computed from.
+    """
+    prepared = requests.Request(
+        method.upper(), url, params=kwargs.get('params'), data=kwargs.get('data'), json=kwargs.get('json')
+    ).prepare()
+    body = prepared.body
+    if isinstance(body, str):
+        body = body.encode()
+    return exchange_key(prepared.method, prepared.url, body), prepared
+
+
+def log_stats() -> None:
+    """
+    Logs the hit counters of the cache, if it was used.
+    """
+    if _CACHE is None:
+        return
+    stats = _CACHE.stats()
+    logging.info(
+        f"HTTP    --> CACHE                   <HITS = {stats['hits']}, REVALIDATED = {stats['revalidated']}, "
+        f"MISSES = {stats['misses']}, ENTRIES = {stats['entries']}, SIZE = {stats['bytes'] / 1024 / 1024:.1f} MB>"
+    )
@@ -0,0 +1,217 @@
+import logging
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scraper_common import http_cache, replay
+from scraper_common.rate_limit import get_limiter
+from scraper_common.retry import DEFAULT_POLICY, RetryPolicy, get_breaker
+
+try:
+    import brotli  # noqa: F401 -- urllib3 only decodes "br" when brotli is installed
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+POOL_SIZE = 10
+DEFAULT_TIMEOUT: Union[float, Tuple[float, float]] = (10, 60)
+
+_SESSIONS: Dict[str, requests.Session] = dict()
+_SESSIONS_LOCK = threading.Lock()
+
+
+def configure(pool_size: Optional[int] = None, timeout: Optional[Union[float, Tuple[float, float]]] = None) -> None:
+    """
+    Changes the pool size and default timeout used for new sessions.
+
+    Args:
+        pool_size (Optional[int]): Maximum number of kept-alive connections per host.
+        timeout (Optional[Union[float, Tuple[float, float]]]): Default (connect, read) timeout in seconds.
+    """
+    global POOL_SIZE, DEFAULT_TIMEOUT
+    if pool_size is not None:
+        POOL_SIZE = pool_size
+    if timeout is not None:
+        DEFAULT_TIMEOUT = timeout
+    close_all()
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Returns the pooled keep-alive session for the host of the given URL.
+
+    The session does not store cookies sent back by the server, so every call
+    behaves like a standalone `requests.request` apart from connection reuse.
+
+    Args:
+        url (str): Any URL on the host.
+
+    Returns:
+        requests.Session: The session shared by every request to that host.
+    """
+    parts = urlsplit(url)
+    host = f'{parts.scheme}://{parts.netloc}'
+    session = _SESSIONS.get(host)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            _SESSIONS[host] = session
+    return session
+
+
+def request(
+    method: str,
+    url: str,
+    retry: Optional[RetryPolicy] = DEFAULT_POLICY,
+    cache_ttl: Optional[float] = None,
+    cacheable: Optional[Callable[[requests.Response], bool]] = None,
+    **kwargs
+) -> requests.Response:
+    """
+    Drop-in replacement for `requests.request` that goes through the pooled session of the host.
+
+    Responses of the endpoints in `http_cache.CACHE_TTLS` (or of any request given
+    a `cache_ttl`) are served from the on-disk cache while fresh. Once stale they
+    are revalidated with If-None-Match/If-Modified-Since, and a 304 reuses the
+    cached body. A 200 carrying an error payload (see `http_cache.CACHE_CHECKS`)
+    is returned but not stored.
+
+    Streamed responses are cached too: a fresh or revalidated body is read back
+    from disk as it is iterated, and a downloaded one is stored while the caller
+    reads it, once read to the end. Streamed responses of a scope with a check
+    in CACHE_CHECKS are not stored, since their body cannot be checked first.
+
+    With SCRAPER_RECORD set every exchange is archived, and with SCRAPER_REPLAY set
+    requests are answered from the archive by a local stand-in server (see `replay`).
+
+    Every attempt first waits for the adaptive rate limiter of the URL scope.
+    Connection errors, timeouts and retryable statuses (429/5xx) are retried with
+    exponential backoff and jitter. Every outcome is reported to the rate limiter
+    and to the circuit breaker of the host, which raises CircuitOpenError instead
+    of sending while it is open.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+        retry (Optional[RetryPolicy]): The retry policy, or None to send once.
+        cache_ttl (Optional[float]): Seconds the response may be cached, overriding CACHE_TTLS; 0 bypasses the cache.
+        cacheable (Optional[Callable[[requests.Response], bool]]): Check a 200 response must pass to be cached, overriding
+            http_cache.CACHE_CHECKS, so error payloads sent with a 200 are not stored.
+        **kwargs: Any keyword argument accepted by `requests.request`.
+
+    Returns:
+        requests.Response: The response. After the last attempt a retryable status is returned as is.
+    """
+    # Record and replay runs must see every exchange, so they bypass the cache
+    ttl = 0 if replay.MODE else http_cache.ttl_for(method, url, cache_ttl)
+    if not ttl:
+        return _send(method, url, retry, **kwargs)
+    stream = kwargs.get('stream', False)
+    cache = http_cache.get_cache()
+    key, prepared = http_cache.request_key(method, url, **kwargs)
+    entry = cache.get(key, stream=stream)
+    if entry is not None:
+        if entry.fresh:
+            return entry.to_response(prepared)
+        kwargs['headers'] = {**(kwargs.get('headers') or {}), **entry.validators()}
+    try:
+        response = _send(method, url, retry, **kwargs)
+    except BaseException:
+        if entry is not None:
+            entry.close()
+        raise
+    if entry is not None:
+        if response.status_code == 304:
+            response.close()
+            cache.refresh(key, ttl)
+            return entry.to_response(prepared)
+        entry.close()
+    if response.status_code == 200:
+        if stream:
+            # The caller reads a streamed body, so it is stored as it goes by and cannot be checked first
+            if http_cache.cache_check(url, cacheable) is None:
+                cache.store_stream(key, response, ttl)
+        elif http_cache.is_cacheable(url, response, cacheable):
+            cache.store(key, response, ttl)
+    return response
+
+
+def _send(method: str, url: str, retry: Optional[RetryPolicy], **kwargs) -> requests.Response:
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    url = replay.rewrite(url)
+    host = urlsplit(url).netloc
+    breaker = get_breaker(host)
+    limiter = get_limiter(url)
+    policy = retry or DEFAULT_POLICY
+    max_attempts = retry.max_attempts if retry else 1
+    for attempt in range(1, max_attempts + 1):
+        breaker.before_request(host)
+        limiter.acquire()
+        start_time = time.monotonic()
+        try:
+            response = get_session(url).request(method, url, **kwargs)
+            replay.record(response)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            limiter.record(None, time.monotonic() - start_time)
+            breaker.record_failure()
+            if attempt == max_attempts:
+                raise
+            delay = policy.delay(attempt)
+            logging.info(f'HTTP    --> RETRYING IN {delay:.1f}s      <URL = {url}, TRY = {attempt}, EXCEPTION = {e}>')
+        except BaseException:
+            # Any other error must still end a half-open trial, or the host stays blocked for the rest of the run
+            breaker.record_failure()
+            raise
+        else:
+            limiter.record(response.status_code, time.monotonic() - start_time)
+            if not policy.should_retry_status(response.status_code):
+                breaker.record_success()
+                return response
+            if response.status_code == 429:
+                # Throttling is handled by the rate limiter; only errors count against the host
+                breaker.record_neutral()
+            else:
+                breaker.record_failure()
+            if attempt == max_attempts:
+                return response
+            delay = policy.delay(attempt, response.headers.get('Retry-After'))
+            logging.info(f'HTTP    --> RETRYING IN {delay:.1f}s      <URL = {url}, TRY = {attempt}, STATUS = {response.status_code}>')
+            response.close()
+        time.sleep(delay)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """
+    Drop-in replacement for `requests.get`.
+    """
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """
+    Drop-in replacement for `requests.post`.
+    """
+    return request('POST', url, **kwargs)
+
+
+def close_all() -> None:
+    """
+    Closes every pooled session and its connections.
+    """
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
@@ -0,0 +1,35 @@
+import re
+from typing import Any, Optional, Union
+
+from scraper_common.fast_json import JSON_BACKEND, loads
+
+_SCRIPT_OPEN = re.compile(rb'<script\b[^>]*\bid\s*=\s*["\']?__NEXT_DATA__["\']?[^>]*>', re.IGNORECASE)
+_SCRIPT_CLOSE = re.compile(rb'</script\s*>', re.IGNORECASE)
+
+
+def extract_next_data(html: Union[str, bytes]) -> Optional[Any]:
+    """
+    Parses the `<script id="__NEXT_DATA__">` payload of a Next.js page without parsing the page.
+
+    The raw bytes are scanned for the script tag and only its contents are handed
+    to the JSON parser. Next.js escapes "<" inside the payload, so the first
+    closing script tag ends it.
+
+    Args:
+        html (Union[str, bytes]): The page, preferably the undecoded response body.
+
+    Returns:
+        Optional[Any]: The parsed payload, or None if the tag is missing or its contents are not valid JSON.
+    """
+    if isinstance(html, str):
+        html = html.encode()
+    opening = _SCRIPT_OPEN.search(html)
+    if opening is None:
+        return None
+    closing = _SCRIPT_CLOSE.search(html, opening.end())
+    if closing is None:
+        return None
+    try:
+        return loads(html[opening.end():closing.start()])
+    except ValueError:
+        return None
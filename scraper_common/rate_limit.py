@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Starting rate (requests per second) of each rate-limited scope, as "host/path-prefix".
+# URLs outside these scopes get a limiter per host starting at DEFAULT_RATE.
+RATE_LIMITS: Dict[str, float] = {
+    'leetcode.com/graphql': 5.0,
+    'practiceapi.geeksforgeeks.org': 3.0,
+    'www.codechef.com/api': 3.0,
+    'www.interviewbit.com/v2': 3.0,
+}
+DEFAULT_RATE = 5.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose refill rate follows AIMD: it grows additively while requests
+    succeed and is cut multiplicatively on 429s, server errors, or when latency exceeds the target.
+
+    `acquire` is safe to call from many threads and `acquire_async` from coroutines;
+    the lock is only held for the bucket arithmetic, never while waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: float = 2.0,
+        min_rate: float = 0.2,
+        max_rate: float = 50.0,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_target: Optional[float] = 5.0,
+        decrease_cooldown: float = 1.0
+    ) -> None:
+        """
+        Args:
+            rate (float): Starting rate in requests per second.
+            burst (float): Bucket capacity, i.e. how many requests may be sent back to back.
+            min_rate (float): Lowest rate the limiter backs off to.
+            max_rate (float): Highest rate the limiter grows to (raised to `rate` if lower).
+            additive_increase (float): Rate gained per second of successful requests.
+            decrease_factor (float): Factor applied to the rate on a 429.
+            latency_target (Optional[float]): Seconds above which a response counts as congestion.
+            decrease_cooldown (float): Seconds between two decreases, so a burst of 429s counts once.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.decrease_cooldown = decrease_cooldown
+        self.tokens = burst
+        self.throttled = 0
+        self.slow = 0
+        self.requests = 0
+        self.waited = 0.0
+        self._updated_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self.tokens -= 1
+            self.requests += 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.waited += wait
+            return wait
+
+    def acquire(self) -> None:
+        """
+        Blocks the calling thread until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """
+        Waits without blocking the event loop until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def record(self, status_code: Optional[int], latency: float) -> None:
+        """
+        Adjusts the rate from the outcome of a request.
+
+        Args:
+            status_code (Optional[int]): The response status, or None if the request failed without one. Only 2xx and
+                3xx responses raise the rate, and 5xx responses lower it like failed requests.
+            latency (float): Seconds the request took.
+        """
+        with self._lock:
+            if status_code == 429:
+                self.throttled += 1
+                self._decrease(self.decrease_factor)
+            elif status_code is None or status_code >= 500 or (self.latency_target and latency > self.latency_target):
+                # An overloaded server often fails fast, so a quick 5xx is no sign of spare capacity
+                self.slow += 1
+                self._decrease((1 + self.decrease_factor) / 2)
+            elif status_code < 400:
+                self.rate = min(self.max_rate, self.rate + self.additive_increase / self.rate)
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        if now - self._decreased_at < self.decrease_cooldown:
+            return
+        self._decreased_at = now
+        self.rate = max(self.min_rate, self.rate * factor)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the current rate and the throttle counters.
+
+        Returns:
+            Dict[str, float]: rate, requests, throttled (429s), slow (over latency target, failed or 5xx) and waited seconds.
+        """
+        with self._lock:
+            return {
+                'rate': round(self.rate, 2),
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'slow': self.slow,
+                'waited': round(self.waited, 2),
+            }
+
+
+_LIMITERS: Dict[str, AdaptiveRateLimiter] = dict()
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _scope(url: str) -> Tuple[str, float]:
+    parts = urlsplit(url)
+    target = parts.netloc + parts.path
+    matches = [scope for scope in RATE_LIMITS if target == scope or target.startswith(scope.rstrip('/') + '/')]
+    if matches:
+        scope = max(matches, key=len)
+        return scope, RATE_LIMITS[scope]
+    return parts.netloc, DEFAULT_RATE
+
+
+def get_limiter(url: str) -> AdaptiveRateLimiter:
+    """
+    Returns the limiter shared by every request in the scope of the URL.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        AdaptiveRateLimiter: The limiter of the longest matching scope in RATE_LIMITS, or of the host.
+    """
+    scope, rate = _scope(url)
+    with _LIMITERS_LOCK:
+        if scope not in _LIMITERS:
+            _LIMITERS[scope] = AdaptiveRateLimiter(rate=rate)
+        return _LIMITERS[scope]
+
+
+def all_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Returns the stats of every limiter by scope.
+    """
+    with _LIMITERS_LOCK:
+        limiters = dict(_LIMITERS)
+    return {scope: limiter.stats() for scope, limiter in limiters.items()}
+
+
+def log_stats() -> None:
+    """
+    Logs the current rate and throttle counts of every limiter.
+    """
+    for scope, stats in all_stats().items():
+        logging.info(
+            f"HTTP    --> RATE LIMIT              <SCOPE = {scope}, RATE = {stats['rate']}/s, REQUESTS = {stats['requests']}, "
+            f"THROTTLED = {stats['throttled']}, SLOW = {stats['slow']}, WAITED = {stats['waited']}s>"
+        )
@@ -0,0 +1,382 @@
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from scraper_common import rate_limit
+from scraper_common.http_cache import exchange_key
+
+# Environment variables selecting the mode. SCRAPER_RECORD=<archive> records every
+# exchange of the run, SCRAPER_REPLAY=<archive> serves them back from a local
+# stand-in server, delayed by SCRAPER_REPLAY_LATENCY_MS plus up to SCRAPER_REPLAY_JITTER_MS.
+RECORD_ENV = 'SCRAPER_RECORD'
+REPLAY_ENV = 'SCRAPER_REPLAY'
+LATENCY_ENV = 'SCRAPER_REPLAY_LATENCY_MS'
+JITTER_ENV = 'SCRAPER_REPLAY_JITTER_MS'
+
+# Headers describing the wire encoding; archived bodies are stored decoded
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class Archive:
+    """
+    SQLite file of recorded HTTP exchanges, keyed by method, full URL and request body.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens (or creates) the archive.
+
+        Args:
+            path (str): Path of the archive file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS exchanges ('
+                'key TEXT PRIMARY KEY, method TEXT NOT NULL, url TEXT NOT NULL, request_body BLOB, source TEXT NOT NULL, '
+                'status INTEGER NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, recorded_at REAL NOT NULL)'
+            )
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        request_body: Optional[bytes],
+        status_code: int,
+        headers: Dict[str, str],
+        body: bytes,
+        source: str = 'http'
+    ) -> None:
+        """
+        Records an exchange, replacing an earlier one with the same key.
+
+        Args:
+            method (str): The request method.
+            url (str): The full request URL.
+            request_body (Optional[bytes]): The request body.
+            status_code (int): The response status.
+            headers (Dict[str, str]): The response headers.
+            body (bytes): The decoded response body.
+            source (str): 'http' for the pooled session, 'browser' for Playwright.
+        """
+        headers = {name: value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS}
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO exchanges '
+                '(key, method, url, request_body, source, status, headers, body, recorded_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (exchange_key(method, url, request_body), method.upper(), url, request_body, source,
+                 status_code, json.dumps(headers), body, time.time())
+            )
+
+    def get(self, method: str, url: str, request_body: Optional[bytes]) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """
+        Looks up a recorded exchange.
+
+        Args:
+            method (str): The request method.
+            url (str): The full request URL.
+            request_body (Optional[bytes]): The request body.
+
+        Returns:
+            Optional[Tuple[int, Dict[str, str], bytes]]: Status, headers and body, or None if it was not recorded.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT status, headers, body FROM exchanges WHERE key = ?',
+                (exchange_key(method, url, request_body),)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM exchanges').fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Closes the archive file.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class StandInServer:
+    """
+    Local HTTP server answering rewritten requests from an archive.
+
+    A request for https://host/path?query is sent to /https/host/path?query on the
+    stand-in server, which rebuilds the original URL, waits for the configured
+    latency and jitter, and answers with the recorded response, or with a 404
+    carrying an X-Replay-Miss header when the exchange was never recorded.
+    """
+
+    def __init__(self, archive: Archive, latency: float = 0.0, jitter: float = 0.0, seed: int = 0) -> None:
+        """
+        Starts the server on a free local port.
+
+        Args:
+            archive (Archive): The recorded exchanges.
+            latency (float): Seconds added before every response.
+            jitter (float): Maximum extra random seconds added to the latency.
+            seed (int): Seed of the jitter, so runs see the same sequence of delays.
+        """
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.served = 0
+        self.missed = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self._server.server_port}'
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        # The stand-in answers as fast as the injected latency allows; do not throttle it
+        rate_limit.RATE_LIMITS[f'127.0.0.1:{self._server.server_port}'] = 100000.0
+
+    def url_for(self, url: str) -> str:
+        """
+        Rewrites a URL so the request is sent to the stand-in server.
+
+        Args:
+            url (str): The original URL.
+
+        Returns:
+            str: The stand-in URL, or the URL itself if it already points to the stand-in.
+        """
+        if url.startswith(self.base_url):
+            return url
+        scheme, rest = url.split('://', 1)
+        return f'{self.base_url}/{scheme}/{rest}'
+
+    def original_url(self, url: str) -> str:
+        """
+        Reverses `url_for`.
+
+        Args:
+            url (str): A stand-in URL.
+
+        Returns:
+            str: The original URL, or the URL itself if it does not point to the stand-in.
+        """
+        if not url.startswith(self.base_url + '/'):
+            return url
+        scheme, rest = url[len(self.base_url) + 1:].split('/', 1)
+        return f'{scheme}://{rest}'
+
+    def _delay(self) -> float:
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def _handler(self):
+        server = self
+
+        class StandInHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                request_body = self.rfile.read(length) if length else None
+                url = server.original_url(server.base_url + self.path)
+                time.sleep(server._delay())
+                exchange = server.archive.get(self.command, url, request_body)
+                with server._lock:
+                    if exchange is None:
+                        server.missed += 1
+                    else:
+                        server.served += 1
+                if exchange is None:
+                    logging.info(f'REPLAY  --> NOT RECORDED            <METHOD = {self.command}, URL = {url}>')
+                    status_code, headers, body = 404, {'X-Replay-Miss': '1'}, b''
+                else:
+                    status_code, headers, body = exchange
+                self.send_response(status_code)
+                for name, value in headers.items():
+                    if name.lower() == 'location':
+                        # Keep redirects on the stand-in server
+                        value = server.url_for(requests.compat.urljoin(url, value))
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return StandInHandler
+
+    def shutdown(self) -> None:
+        """
+        Stops the server.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+
+MODE: Optional[str] = 'record' if os.environ.get(RECORD_ENV) else 'replay' if os.environ.get(REPLAY_ENV) else None
+ARCHIVE_PATH: Optional[str] = os.environ.get(RECORD_ENV) or os.environ.get(REPLAY_ENV) or None
+LATENCY = float(os.environ.get(LATENCY_ENV) or 0) / 1000
+JITTER = float(os.environ.get(JITTER_ENV) or 0) / 1000
+
+_ARCHIVE: Optional[Archive] = None
+_SERVER: Optional[StandInServer] = None
+_BROWSER_SESSION: Optional[requests.Session] = None
+_STATE_LOCK = threading.Lock()
+
+
+def configure(
+    mode: Optional[str],
+    archive_path: Optional[str] = None,
+    latency: float = 0.0,
+    jitter: float = 0.0
+) -> None:
+    """
+    Switches record/replay on or off without going through the environment.
+
+    Args:
+        mode (Optional[str]): 'record', 'replay' or None.
+        archive_path (Optional[str]): Path of the archive file.
+        latency (float): Seconds the stand-in server adds before every response.
+        jitter (float): Maximum extra random seconds added to the latency.
+    """
+    global MODE, ARCHIVE_PATH, LATENCY, JITTER, _ARCHIVE, _SERVER
+    with _STATE_LOCK:
+        if _SERVER is not None:
+            _SERVER.shutdown()
+        if _ARCHIVE is not None:
+            _ARCHIVE.close()
+        _ARCHIVE = _SERVER = None
+        MODE, ARCHIVE_PATH, LATENCY, JITTER = mode, archive_path, latency, jitter
+
+
+def get_archive() -> Archive:
+    """
+    Returns the archive of the current mode, opening it on first use.
+    """
+    global _ARCHIVE
+    with _STATE_LOCK:
+        if _ARCHIVE is None:
+            _ARCHIVE = Archive(ARCHIVE_PATH)
+            logging.info(f'REPLAY  --> {MODE.upper()} MODE            <ARCHIVE = {ARCHIVE_PATH}>')
+        return _ARCHIVE
+
+
+def get_server() -> StandInServer:
+    """
+    Returns the stand-in server of replay mode, starting it on first use.
+    """
+    global _SERVER
+    archive = get_archive()
+    with _STATE_LOCK:
+        if _SERVER is None:
+            _SERVER = StandInServer(archive, latency=LATENCY, jitter=JITTER)
+        return _SERVER
+
+
+def rewrite(url: str) -> str:
+    """
+    Points a request at the stand-in server in replay mode.
+
+    Args:
+        url (str): The request URL.
+
+    Returns:
+        str: The stand-in URL in replay mode, otherwise the URL unchanged.
+    """
+    if MODE != 'replay':
+        return url
+    return get_server().url_for(url)
+
+
+def record(response: requests.Response) -> None:
+    """
+    Archives a response of the pooled session, and the redirects leading to it, in record mode.
+
+    Args:
+        response (requests.Response): The response. A streamed body is read in full so it can be archived.
+    """
+    if MODE != 'record':
+        return
+    archive = get_archive()
+    for exchange in [*response.history, response]:
+        request = exchange.request
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        archive.add(request.method, request.url, body, exchange.status_code, dict(exchange.headers), exchange.content)
+
+
+def attach(context) -> None:
+    """
+    Records or replays the network traffic of a Playwright browser context.
+
+    In record mode every response body seen by the context is archived. In replay
+    mode every request of the context is answered by the stand-in server, and
+    requests that were never recorded are aborted. Outside both modes it does nothing.
+
+    Args:
+        context (BrowserContext): The Playwright browser context.
+    """
+    if MODE == 'record':
+        context.on('response', _record_browser_response)
+    elif MODE == 'replay':
+        context.route('**/*', _replay_browser_request)
+
+
+def _record_browser_response(response) -> None:
+    try:
+        body = response.body()
+    except Exception:
+        # Redirects and aborted requests have no body
+        return
+    request = response.request
+    get_archive().add(
+        request.method, response.url, request.post_data_buffer, response.status, response.headers, body, 'browser'
+    )
+
+
+def _replay_browser_request(route) -> None:
+    global _BROWSER_SESSION
+    request = route.request
+    if _BROWSER_SESSION is None:
+        _BROWSER_SESSION = requests.Session()
+    try:
+        response = _BROWSER_SESSION.request(
+            request.method, rewrite(request.url), data=request.post_data_buffer, allow_redirects=False
+        )
+    except requests.RequestException:
+        route.abort()
+        return
+    if response.headers.get('X-Replay-Miss'):
+        route.abort()
+        return
+    headers = {name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS}
+    if 'Location' in response.headers:
+        headers = {**headers, 'Location': get_server().original_url(response.headers['Location'])}
+    route.fulfill(status=response.status_code, headers=headers, body=response.content)
+
+
+def stats() -> Dict[str, int]:
+    """
+    Returns the number of archived exchanges and, in replay mode, how many requests were served or missed.
+    """
+    if MODE is None:
+        return dict()
+    result = {'exchanges': len(get_archive())}
+    if _SERVER is not None:
+        result['served'] = _SERVER.served
+        result['missed'] = _SERVER.missed
+    return result
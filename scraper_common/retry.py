@@ -0,0 +1,240 @@
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Optional, TypeVar
+
+R = TypeVar('R')
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker of its host is open.
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0, breaker: Optional['CircuitBreaker'] = None) -> None:
+        """
+        Args:
+            message (str): The error message.
+            retry_after (float): Seconds until the breaker lets a trial request through, 0 while a trial is in flight.
+            breaker (Optional[CircuitBreaker]): The breaker that refused the request, so callers can wait on it.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.breaker = breaker
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, plus the response statuses worth retrying.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    ) -> None:
+        """
+        Args:
+            max_attempts (int): Total number of attempts, including the first one.
+            backoff_base (float): Upper bound in seconds of the first backoff; it doubles on every retry.
+            backoff_max (float): Upper bound in seconds of any single backoff.
+            retry_statuses (FrozenSet[int]): Response statuses that are retried.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+
+    def should_retry_status(self, status_code: int) -> bool:
+        """
+        Checks whether a response status is worth retrying.
+
+        Args:
+            status_code (int): The HTTP status code.
+
+        Returns:
+            bool: True for throttling and server errors.
+        """
+        return status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Computes how long to wait before the next attempt.
+
+        Args:
+            attempt (int): The attempt that just failed, starting at 1.
+            retry_after (Optional[str]): The Retry-After header of the response, if any.
+
+        Returns:
+            float: Seconds to sleep.
+        """
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a host after repeated failures and lets a single trial through after a cool-down.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a trial request is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        # Notified whenever a trial ends or the circuit closes
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def state(self) -> str:
+        """
+        'closed', 'open' or 'half-open'.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return 'closed'
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def before_request(self, host: str) -> None:
+        """
+        Raises CircuitOpenError unless a request to the host may be sent now.
+
+        Args:
+            host (str): The host, used in the error message.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            retry_after = self.opened_at + self.reset_timeout - time.monotonic()
+            if retry_after > 0 or self._trial_in_flight:
+                raise CircuitOpenError(f'circuit open for {host}', max(retry_after, 0.0), self)
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """
+        Closes the circuit.
+        """
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+            self._changed.notify_all()
+
+    def record_failure(self) -> None:
+        """
+        Counts a failure, opening (or re-opening) the circuit once the threshold is reached.
+        """
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+            self._changed.notify_all()
+
+    def record_neutral(self) -> None:
+        """
+        Ends a trial request that neither proved nor disproved the host, such as a throttled one, so the next
+        request becomes the trial.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+            self._changed.notify_all()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Blocks until a request may be sent: the circuit is closed, or its cool-down is over and no trial is in flight.
+
+        Args:
+            timeout (float): Longest time to wait, in seconds.
+
+        Returns:
+            bool: True if a request may be sent, False if the timeout ran out first.
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while self.opened_at is not None:
+                now = time.monotonic()
+                retry_after = self.opened_at + self.reset_timeout - now
+                if retry_after <= 0 and not self._trial_in_flight:
+                    break
+                if now >= deadline:
+                    return False
+                # A trial in flight notifies when it ends; otherwise sleep out the cool-down
+                self._changed.wait(deadline - now if self._trial_in_flight else min(retry_after, deadline - now))
+            return True
+
+
+DEFAULT_POLICY = RetryPolicy()
+# Longest wait for an open circuit: the 30 s reset window, then a trial request that may run
+# into the (10, 60) s default timeout of http_session, with some slack
+CIRCUIT_WAIT = 120.0
+
+
+def wait_for_circuit(call: Callable[[], R], policy: RetryPolicy = DEFAULT_POLICY, timeout: float = CIRCUIT_WAIT) -> R:
+    """
+    Runs a call that sends requests, waiting out an open circuit breaker instead of failing at once.
+
+    While a breaker is open every request to its host fails immediately, so
+    callers that give up on errors would skip everything for the whole reset
+    window. Here the call is repeated once the breaker lets a request through:
+    after the cool-down, or when the trial request of another worker ends. A
+    little jitter keeps the waiting workers from all retrying at the same moment.
+
+    Args:
+        call (Callable[[], R]): The call, for example a function fetching one question.
+        policy (RetryPolicy): Its first backoff bounds the jitter.
+        timeout (float): Seconds to keep waiting in all before giving up.
+
+    Returns:
+        R: The result of the call.
+
+    Raises:
+        CircuitOpenError: If the breaker still refuses requests once the timeout ran out.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return call()
+        except CircuitOpenError as e:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise
+            logging.info(f'HTTP    --> CIRCUIT OPEN, WAITING     <RETRY AFTER = {e.retry_after:.1f}s, ERROR = {e}>')
+            if e.breaker is None:
+                time.sleep(min(e.retry_after, remaining))
+            elif not e.breaker.wait(remaining):
+                raise
+            time.sleep(policy.delay(1))
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = dict()
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """
+    Returns the circuit breaker shared by every request to a host.
+
+    Args:
+        host (str): The host name.
+
+    Returns:
+        CircuitBreaker: The breaker of the host.
+    """
+    with _BREAKERS_LOCK:
+        if host not in _BREAKERS:
+            _BREAKERS[host] = CircuitBreaker()
+        return _BREAKERS[host]
@@ -0,0 +1,128 @@
+import os
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+DEFAULT_MANIFEST_PATH = os.path.join(os.getcwd(), '.s3_manifest.sqlite3')
+
+
+class S3Manifest:
+    """
+    Local SQLite copy of the object keys already uploaded under an S3 prefix.
+
+    The manifest is filled from a single listing of the prefix the first time it
+    is used (or when a resync is requested) and is then kept up to date on every
+    upload, so membership checks never go back to S3.
+    """
+
+    def __init__(self, bucket: str, manifest_path: str = DEFAULT_MANIFEST_PATH) -> None:
+        """
+        Opens (or creates) the manifest database.
+
+        Args:
+            bucket (str): The S3 bucket the keys belong to.
+            manifest_path (str): Path of the SQLite file holding the manifest.
+        """
+        self.bucket = bucket
+        self.manifest_path = manifest_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(manifest_path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS objects ('
+                'bucket TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (bucket, key))'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS syncs ('
+                'bucket TEXT NOT NULL, prefix TEXT NOT NULL, synced_at REAL NOT NULL, '
+                'PRIMARY KEY (bucket, prefix))'
+            )
+
+    def is_synced(self, prefix: str) -> bool:
+        """
+        Checks whether the given prefix has been listed from S3 before.
+
+        Args:
+            prefix (str): The S3 prefix.
+
+        Returns:
+            bool: True if the prefix has a recorded sync.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT 1 FROM syncs WHERE bucket = ? AND prefix = ?',
+                (self.bucket, prefix)
+            ).fetchone()
+        return row is not None
+
+    def resync(self, prefix: str, list_objects: Callable[[str], Optional[Iterable[str]]]) -> int:
+        """
+        Rebuilds the manifest entries for a prefix from one S3 listing.
+
+        Args:
+            prefix (str): The S3 prefix to list.
+            list_objects (Callable[[str], Optional[Iterable[str]]]): The scraper's listing function.
+
+        Returns:
+            int: Number of keys recorded for the prefix.
+        """
+        logging.info(f'CLOUD   --> SYNCING S3 MANIFEST     <S3 PATH = |{prefix}|>')
+        keys: List[str] = list(list_objects(prefix) or [])
+        with self._lock, self._connection:
+            self._connection.execute(
+                # A case-sensitive prefix test, since LIKE ignores ASCII case and would drop the keys of "foo/" with "Foo/"
+                'DELETE FROM objects WHERE bucket = ? AND substr(key, 1, ?) = ?',
+                (self.bucket, len(prefix), prefix)
+            )
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO objects (bucket, key) VALUES (?, ?)',
+                [(self.bucket, key) for key in keys]
+            )
+            self._connection.execute(
+                'INSERT OR REPLACE INTO syncs (bucket, prefix, synced_at) VALUES (?, ?, ?)',
+                (self.bucket, prefix, time.time())
+            )
+        logging.info(f'CLOUD   --> S3 MANIFEST SYNCED      <OBJECTS = {len(keys)}>')
+        return len(keys)
+
+    def load(self, prefix: str, list_objects: Callable[[str], Optional[Iterable[str]]], resync: bool = False) -> None:
+        """
+        Makes sure the prefix is present in the manifest, listing S3 only when needed.
+
+        Args:
+            prefix (str): The S3 prefix the scraper uploads to.
+            list_objects (Callable[[str], Optional[Iterable[str]]]): The scraper's listing function.
+            resync (bool): Forces a fresh listing even if the prefix was synced before.
+        """
+        if resync or not self.is_synced(prefix):
+            self.resync(prefix, list_objects)
+
+    def add(self, s3_key: str) -> None:
+        """
+        Records a freshly uploaded key.
+
+        Args:
+            s3_key (str): The uploaded S3 key.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR IGNORE INTO objects (bucket, key) VALUES (?, ?)',
+                (self.bucket, s3_key)
+            )
+
+    def __contains__(self, s3_key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT 1 FROM objects WHERE bucket = ? AND key = ?',
+                (self.bucket, s3_key)
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """
+        Closes the underlying database connection.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,178 @@
+import os
+import json
+import atexit
+import logging
+import queue
+import shutil
+import threading
+import time
+from typing import IO, Callable, Dict, List, Optional, Tuple, Union
+
+UploadData = Union[Dict, IO[bytes]]
+
+FAILED_UPLOADS_DIR = os.path.join(os.getcwd(), 'failed_uploads')
+
+
+class S3Uploader:
+    """
+    Uploads finished problem data from a bounded queue on a pool of background threads.
+
+    The scraping thread only pays for putting the data on the queue. When the
+    queue is full `submit` blocks, which keeps memory bounded if S3 falls behind.
+    Besides JSON data, an open binary file can be queued with its own upload
+    function; the uploader rewinds it before every attempt and closes it once done.
+    """
+
+    def __init__(
+        self,
+        upload: Callable[[str, Dict], None],
+        workers: int = 4,
+        max_queue: int = 16,
+        retries: int = 3,
+        stats_every: int = 10
+    ) -> None:
+        """
+        Starts the upload worker threads.
+
+        Args:
+            upload (Callable[[str, Dict], None]): The scraper's blocking upload function.
+            workers (int): Number of upload threads. The S3 client should allow as many pooled connections.
+            max_queue (int): Maximum number of uploads waiting in the queue.
+            retries (int): Attempts per upload before the data is written to FAILED_UPLOADS_DIR.
+            stats_every (int): Log the queue depth and latency after this many uploads.
+        """
+        self._upload = upload
+        self._retries = retries
+        self._stats_every = stats_every
+        self._queue: 'queue.Queue[Optional[Tuple[str, UploadData, Optional[Callable]]]]' = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self.uploaded = 0
+        self.failed: List[str] = []
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._threads = [
+            threading.Thread(target=self._worker, name=f's3-uploader-{index}', daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        atexit.register(self.close)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of uploads waiting for a worker.
+        """
+        return self._queue.qsize()
+
+    @property
+    def average_latency(self) -> float:
+        """
+        Mean seconds spent in the upload function per successful upload.
+        """
+        with self._stats_lock:
+            return self.total_latency / self.uploaded if self.uploaded else 0.0
+
+    def submit(self, s3_key: str, data: UploadData, upload: Optional[Callable[[str, UploadData], None]] = None) -> None:
+        """
+        Queues the data for upload, blocking while the queue is full.
+
+        Args:
+            s3_key (str): The S3 key to upload the data to.
+            data (UploadData): The JSON data to upload, which must not be modified after submitting, or an open binary
+                file, which the uploader owns from now on.
+            upload (Optional[Callable[[str, UploadData], None]]): Upload function for this item instead of the scraper's.
+        """
+        if self._closed:
+            raise RuntimeError('S3Uploader is closed')
+        self._queue.put((s3_key, data, upload))
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued upload has finished.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flushes the queue and stops the worker threads. Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self.log_stats()
+        if self.failed:
+            logging.info(f'CLOUD   --> FAILED UPLOADS SAVED    <DIR = |{FAILED_UPLOADS_DIR}|, COUNT = {len(self.failed)}>')
+
+    def log_stats(self) -> None:
+        """
+        Logs the queue depth and upload latency so the pool can be sized.
+        """
+        with self._stats_lock:
+            uploaded, failed, max_latency = self.uploaded, len(self.failed), self.max_latency
+        logging.info(
+            f'CLOUD   --> UPLOADER STATS          <QUEUED = {self.queue_depth}, UPLOADED = {uploaded}, '
+            f'FAILED = {failed}, AVG = {self.average_latency:.2f}s, MAX = {max_latency:.2f}s>'
+        )
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._upload_with_retries(*item)
+            finally:
+                self._queue.task_done()
+
+    def _upload_with_retries(self, s3_key: str, data: UploadData, upload: Optional[Callable]) -> None:
+        try:
+            self._upload_attempts(s3_key, data, upload or self._upload)
+        finally:
+            if hasattr(data, 'close'):
+                data.close()
+
+    def _upload_attempts(self, s3_key: str, data: UploadData, upload: Callable) -> None:
+        for attempt in range(1, self._retries + 1):
+            start_time = time.perf_counter()
+            try:
+                if hasattr(data, 'seek'):
+                    data.seek(0)
+                upload(s3_key, data)
+            except Exception as e:
+                logging.info(f'CLOUD   --> UPLOAD FAILED           <S3 KEY = |{s3_key}|, TRY = {attempt}, EXCEPTION = {e}>')
+                if attempt < self._retries:
+                    time.sleep(2 ** attempt)
+                continue
+            latency = time.perf_counter() - start_time
+            with self._stats_lock:
+                self.uploaded += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                log_now = self.uploaded % self._stats_every == 0
+            if log_now:
+                self.log_stats()
+            return
+        self._save_failed(s3_key, data)
+
+    def _save_failed(self, s3_key: str, data: UploadData) -> None:
+        os.makedirs(FAILED_UPLOADS_DIR, exist_ok=True)
+        file_name = s3_key.strip('/').replace('/', '__')
+        if hasattr(data, 'read'):
+            # Files are kept as they would have been uploaded
+            data.seek(0)
+            with open(os.path.join(FAILED_UPLOADS_DIR, file_name), 'wb') as file:
+                shutil.copyfileobj(data, file)
+        else:
+            if not file_name.endswith('.json'):
+                file_name += '.json'
+            with open(os.path.join(FAILED_UPLOADS_DIR, file_name), 'w') as file:
+                json.dump({'s3_key': s3_key, 'data': data}, file, indent=4)
+        with self._stats_lock:
+            self.failed.append(s3_key)
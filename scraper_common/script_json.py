@@ -0,0 +1,34 @@
+import json
+import re
+from typing import Any, Dict, Optional, Pattern
+
+_DECODER = json.JSONDecoder()
+_ASSIGNMENTS: Dict[str, Pattern[str]] = dict()
+
+
+def extract_assigned_json(text: str, target: str) -> Optional[Any]:
+    """
+    Parses the object literal assigned to a JavaScript target, straight from the page or script text.
+
+    The text is searched for `<target> = ` and the JSON value starting there is
+    decoded up to its balanced closing bracket, wherever that is. Nothing is
+    beautified or parsed beyond the value itself.
+
+    Args:
+        text (str): The page or script source.
+        target (str): The assignment target, for example "window.__INTERVIEWBIT__.problemsData".
+
+    Returns:
+        Optional[Any]: The decoded value, or None if the assignment is missing or its value is not strict JSON.
+    """
+    pattern = _ASSIGNMENTS.get(target)
+    if pattern is None:
+        pattern = _ASSIGNMENTS[target] = re.compile(re.escape(target) + r'\s*=\s*(?=[\[{])')
+    match = pattern.search(text)
+    if match is None:
+        return None
+    try:
+        value, _ = _DECODER.raw_decode(text, match.end())
+    except ValueError:
+        return None
+    return value
@@ -0,0 +1,106 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+DEFAULT_SESSIONS_DIR = os.path.join(os.getcwd(), '.sessions')
+# Sites keep a login for days, but a day old session is cheap to replace
+DEFAULT_MAX_AGE = 24 * 3600
+
+
+def state_cookies(storage_state: Dict, names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    Reads the unexpired cookies out of a Playwright storage state.
+
+    Args:
+        storage_state (Dict): The storage state, as returned by `context.storage_state()`.
+        names (Optional[Iterable[str]]): Only these cookies are returned. By default all of them.
+
+    Returns:
+        Dict[str, str]: Cookie values by name. Session cookies, which have no expiry, are included.
+    """
+    wanted = set(names) if names is not None else None
+    now = time.time()
+    return {
+        cookie.get('name'): cookie.get('value')
+        for cookie in storage_state.get('cookies', [])
+        if (wanted is None or cookie.get('name') in wanted) and not 0 <= cookie.get('expires', -1) <= now
+    }
+
+
+class SessionStore:
+    """
+    Keeps the login of one site in a local file between runs, so a run can skip the browser sign-in.
+
+    The file holds the Playwright `storage_state` (cookies and local storage) and the
+    request headers the scraper sends, such as a CSRF token, together with the time
+    they were saved. A session older than `max_age`, or whose required cookies have
+    expired, is not returned. It is written with owner-only permissions, since it
+    is as good as the password while it lasts.
+    """
+
+    def __init__(self, name: str, sessions_dir: str = DEFAULT_SESSIONS_DIR, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """
+        Args:
+            name (str): Name of the site, used as the file name.
+            sessions_dir (str): Directory holding the session files.
+            max_age (float): Seconds after which a saved session is ignored.
+        """
+        self.name = name
+        self.path = os.path.join(sessions_dir, f'{name}.json')
+        self.max_age = max_age
+
+    def load(self, required_cookies: Iterable[str] = ()) -> Optional[Dict]:
+        """
+        Reads the saved session if it is still fresh.
+
+        Args:
+            required_cookies (Iterable[str]): Cookies that must be present and unexpired, such as the auth token.
+
+        Returns:
+            Optional[Dict]: The session with `storage_state`, `headers` and `saved_at` keys, or None if there is no
+            usable session.
+        """
+        try:
+            with open(self.path) as file:
+                session = json.load(file)
+        except (OSError, ValueError):
+            return None
+        age = time.time() - session.get('saved_at', 0)
+        if age > self.max_age:
+            logging.info(f'LOCAL   --> SAVED SESSION EXPIRED   <SITE = {self.name}, AGE = {age / 3600:.1f} HOURS>')
+            return None
+        required = set(required_cookies)
+        if required and not required <= set(state_cookies(session.get('storage_state') or {}, required)):
+            logging.info(f'LOCAL   --> SAVED SESSION EXPIRED   <SITE = {self.name}, MISSING COOKIES>')
+            return None
+        logging.info(f'LOCAL   --> REUSING SAVED SESSION   <SITE = {self.name}, AGE = {age / 3600:.1f} HOURS>')
+        return session
+
+    def save(self, storage_state: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None) -> None:
+        """
+        Writes the session, replacing the saved one at once so a crash never leaves half a file.
+
+        Args:
+            storage_state (Optional[Dict]): The storage state of the logged-in browser context.
+            headers (Optional[Dict[str, str]]): Request headers to send with the session.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        session = {'saved_at': time.time(), 'storage_state': storage_state, 'headers': headers}
+        temporary_path = f'{self.path}.{os.getpid()}.tmp'
+        descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, 'w') as file:
+            json.dump(session, file)
+        os.replace(temporary_path, self.path)
+        logging.info(f'LOCAL   --> SAVED SESSION           <SITE = {self.name}>')
+
+    def discard(self) -> None:
+        """
+        Deletes the saved session, so the next run signs in again.
+        """
+        try:
+            os.remove(self.path)
+            logging.info(f'LOCAL   --> DISCARDED SESSION       <SITE = {self.name}>')
+        except FileNotFoundError:
+            pass
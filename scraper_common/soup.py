@@ -0,0 +1,65 @@
+import logging
+import os
+from typing import List, Optional, Union
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# Environment variable forcing a BeautifulSoup parser, for example SCRAPER_HTML_PARSER=html.parser
+PARSER_ENV = 'SCRAPER_HTML_PARSER'
+
+# BeautifulSoup parsers from fastest to slowest; html.parser ships with Python
+PREFERRED_PARSERS = ('lxml', 'html.parser')
+
+
+def available_parsers() -> List[str]:
+    """
+    Returns the preferred parsers whose tree builder is installed, fastest first.
+    """
+    return [name for name in PREFERRED_PARSERS if builder_registry.lookup(name) is not None]
+
+
+def select_parser(name: Optional[str] = None) -> str:
+    """
+    Chooses the parser used by `make_soup`.
+
+    Args:
+        name (Optional[str]): A BeautifulSoup parser name. Defaults to SCRAPER_HTML_PARSER, then to the fastest installed one.
+
+    Returns:
+        str: The requested parser if it is installed, otherwise the fastest installed one.
+    """
+    requested = name or os.environ.get(PARSER_ENV)
+    if requested:
+        if builder_registry.lookup(requested) is not None:
+            return requested
+        logging.info(f'LOCAL   --> HTML PARSER MISSING     <PARSER = {requested}, USING = {available_parsers()[0]}>')
+    return available_parsers()[0]
+
+
+DEFAULT_PARSER = select_parser()
+
+
+def configure(parser: Optional[str] = None) -> None:
+    """
+    Changes the parser used by `make_soup`.
+
+    Args:
+        parser (Optional[str]): A BeautifulSoup parser name, or None to pick the fastest installed one again.
+    """
+    global DEFAULT_PARSER
+    DEFAULT_PARSER = select_parser(parser)
+
+
+def make_soup(markup: Union[str, bytes], parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parses HTML with the configured BeautifulSoup tree builder.
+
+    Args:
+        markup (Union[str, bytes]): The HTML.
+        parser (Optional[str]): A BeautifulSoup parser name, overriding DEFAULT_PARSER.
+
+    Returns:
+        BeautifulSoup: The parsed document.
+    """
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER)